@@ -6,6 +6,8 @@
   
   // Avoid double-injection
   if (document.getElementById('scrapeOverlay')) {
+    delete window.scraperPersistent;
+    delete window.scraperFieldLabels;
     const titleDiv = document.getElementById('scrapeOverlayTitle');
     if (titleDiv && window.scraperContextMessage) {
       titleDiv.textContent = window.scraperContextMessage;
@@ -19,6 +21,64 @@
   let hoveredElement = null;
   let selectedElement = null;
 
+  // Persistent mode keeps the overlay open across selections; field labels
+  // (if given) are walked through in order, one per selection.
+  const persistent = !!window.scraperPersistent;
+  const fieldLabels = Array.isArray(window.scraperFieldLabels) ? window.scraperFieldLabels : null;
+  const baseMessage = window.scraperContextMessage || 'Click on an element to select it';
+  let labelIndex = 0;
+  let selectionCount = 0;
+
+  // With field labels, picks are collected in-page as {field: selector} and
+  // handed back in one go once every label is answered (or Done/Cancel).
+  const picks = {};
+  if (fieldLabels) {
+    window.scraperFieldPicks = picks;
+    window.scraperFieldPicksDone = false;
+  }
+
+  function finishPicking() {
+    if (!fieldLabels || window.scraperFieldPicksDone !== false) return;
+    window.scraperFieldPicksDone = true;
+    window.dispatchEvent(new CustomEvent('scraperfieldpicks'));
+  }
+
+  function currentTitle() {
+    if (fieldLabels && labelIndex < fieldLabels.length) {
+      return `Select ${fieldLabels[labelIndex]} (${labelIndex + 1}/${fieldLabels.length})`;
+    }
+    if (persistent && selectionCount > 0) {
+      return `${baseMessage} (${selectionCount} selected)`;
+    }
+    return baseMessage;
+  }
+
+  function writeSelection(value) {
+    let input = document.getElementById('selected_element_data');
+    if (!input) {
+      input = document.createElement('input');
+      input.type = 'hidden';
+      input.id = 'selected_element_data';
+      document.body.appendChild(input);
+    }
+    input.value = value;
+    // Cheap change token for get_selected_element_data(); unique per document
+    window.scraperSelectionCount = (window.scraperSelectionCount || 0) + 1;
+    window.scraperSelectionVersion = `${performance.timeOrigin}:${window.scraperSelectionCount}`;
+    // Wake up a pending wait_for_selected_element_data() call
+    window.dispatchEvent(new CustomEvent('scraperselection'));
+  }
+
+  function advanceLabel() {
+    labelIndex += 1;
+    const titleDiv = document.getElementById('scrapeOverlayTitle');
+    if (titleDiv) titleDiv.textContent = currentTitle();
+    if (fieldLabels && labelIndex >= fieldLabels.length) {
+      finishPicking();
+      setTimeout(cleanup, 2000);
+    }
+  }
+
   // ======== Helper: Generate CSS selector ========
   function getCssSelector(el) {
     if (!(el instanceof Element)) return null;
@@ -103,9 +163,7 @@
   `;
 
   infoPanel.innerHTML = `
-    <h3 style="margin: 0 0 10px 0; color: #333; font-size: 18px;">
-      ${window.scraperContextMessage || 'Click on an element to select it'}
-    </h3>
+    <h3 id="scrapeOverlayTitle" style="margin: 0 0 10px 0; color: #333; font-size: 18px;"></h3>
     <p style="margin: 0 0 15px 0; color: #666;">
       Move your mouse over elements to highlight them. Click to select.
     </p>
@@ -119,6 +177,16 @@
         cursor: pointer;
         font-size: 14px;
       ">Done</button>
+      <button id="scraper-skip-btn" style="
+        display: ${fieldLabels ? 'inline-block' : 'none'};
+        background: #9E9E9E;
+        color: white;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 4px;
+        cursor: pointer;
+        font-size: 14px;
+      ">Skip</button>
       <button id="scraper-cancel-btn" style="
         background: #f44336;
         color: white;
@@ -164,16 +232,13 @@
       tagName: element.tagName.toLowerCase(),
       classes: Array.from(element.classList).filter(c => !c.includes('scraper-'))
     };
-    
-    // Update or create hidden input
-    let input = document.getElementById('selected_element_data');
-    if (!input) {
-      input = document.createElement('input');
-      input.type = 'hidden';
-      input.id = 'selected_element_data';
-      document.body.appendChild(input);
+    if (fieldLabels) {
+      if (labelIndex >= fieldLabels.length) return;
+      picks[fieldLabels[labelIndex]] = selector;
+    } else {
+      // Update or create hidden input
+      writeSelection(JSON.stringify(data));
     }
-    input.value = JSON.stringify(data);
     
     // Visual feedback
     if (selectedElement) {
@@ -188,8 +253,13 @@
     infoDiv.style.display = 'block';
     selectorText.textContent = `Selected: ${selector}`;
     
-    // Auto close after 2 seconds
-    setTimeout(cleanup, 2000);
+    if (persistent) {
+      selectionCount += 1;
+      advanceLabel();
+    } else {
+      // Auto close after 2 seconds
+      setTimeout(cleanup, 2000);
+    }
   }
 
   function handleMouseMove(e) {
@@ -226,6 +296,7 @@
 
   function cleanup() {
     isActive = false;
+    finishPicking();
     
     // Remove highlights
     document.querySelectorAll('.scraper-highlight-hover, .scraper-highlight-selected').forEach(el => {
@@ -268,6 +339,7 @@
   // Add elements to page
   document.body.appendChild(overlay);
   document.body.appendChild(infoPanel);
+  document.getElementById('scrapeOverlayTitle').textContent = currentTitle();
 
   // Attach event listeners
   document.addEventListener('mousemove', handleMouseMove, true);
@@ -276,19 +348,20 @@
 
   // Button handlers
   document.getElementById('scraper-done-btn').onclick = function() {
-    if (!document.getElementById('selected_element_data')) {
-      const input = document.createElement('input');
-      input.type = 'hidden';
-      input.id = 'selected_element_data';
-      input.value = 'DONE_SELECTING';
-      document.body.appendChild(input);
-    }
+    if (!fieldLabels) writeSelection('DONE_SELECTING');
     cleanup();
   };
 
+  document.getElementById('scraper-skip-btn').onclick = function() {
+    if (!fieldLabels || labelIndex >= fieldLabels.length) return;
+    advanceLabel();
+  };
+
   document.getElementById('scraper-cancel-btn').onclick = cleanup;
 
-  // Clean up context message
+  // Clean up context message and options
   delete window.scraperContextMessage;
+  delete window.scraperPersistent;
+  delete window.scraperFieldLabels;
 
 })();
\ No newline at end of file
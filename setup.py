@@ -59,6 +59,11 @@ setup(
             "sphinx-rtd-theme>=1.3.0",
             "sphinx-autodoc-typehints>=1.24.0",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "hyperscan>=0.4.0; platform_system != \"Windows\"",
+            "curl_cffi>=0.7.0",
+        ],
     },
     entry_points={
         "console_scripts": [
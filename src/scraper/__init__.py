@@ -10,7 +10,6 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 # Import main classes for convenient access
-from .core.base_scraper import BaseScraper
 from .config.settings import Config
 from .models.data_models import (
     ExportFormat,
@@ -21,8 +20,22 @@ from .models.data_models import (
     ScrapingTemplate
 )
 
-# Import unified CLI
-from .unified_cli import main as unified_cli_main
+# Browser and CLI entry points pull in selenium, playwright and colorama,
+# so they are imported on first access rather than with the package
+_LAZY_IMPORTS = {
+    'BaseScraper': ('.core.base_scraper', 'BaseScraper'),
+    'unified_cli_main': ('.unified_cli', 'main'),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
 
 # Make key classes available at package level
 __all__ = [
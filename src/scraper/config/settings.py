@@ -41,6 +41,13 @@ class Config:
     
     # Cookie Handling
     COOKIE_ACCEPTANCE_TIMEOUT = 5
+    
+    # Playwright API capture: how long to wait for a matching JSON response
+    API_CAPTURE_TIMEOUT = 10
+    # Upper bound on Playwright pages scraping detail URLs at once
+    MAX_CONCURRENT_DETAIL_PAGES = 4
+    # Browser TLS fingerprint for the requests engine when curl_cffi is installed
+    HTTP_IMPERSONATE = 'chrome124'
     COOKIE_XPATHS = [
         "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]",
         "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'agree')]",
@@ -57,6 +64,12 @@ class Config:
         "button[data-cookie-accept]", "button[data-accept-cookies]",
         ".cookie-banner button.primary", ".cookie-notice button.agree"
     ]
+    # Cookies set by common consent managers once the banner was answered
+    COOKIE_CONSENT_NAMES = frozenset({
+        "OptanonAlertBoxClosed", "CookieConsent", "cookieconsent_status",
+        "euconsent-v2", "didomi_token", "cookielawinfo-checkbox-necessary",
+        "borlabs-cookie", "cmplz_consented_services", "_iub_cs-s",
+    })
     
     # Load More Keywords
     LOAD_MORE_KEYWORDS = [
@@ -6,7 +6,9 @@ and context manager support.
 
 import logging
 import time
-from typing import Optional, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Any, List
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -26,6 +28,82 @@ from ..handlers import CookieHandler
 from ..utils.retry import retry_on_exception
 
 
+# Sets the overlay options read by interactive_selector.js; prepended to the
+# bundle so options and code go over the wire in one execute_script call.
+_SELECTOR_OPTIONS_JS = (
+    "window.scraperContextMessage = arguments[0];"
+    "window.scraperPersistent = arguments[1];"
+    "window.scraperFieldLabels = arguments[2];\n"
+)
+
+
+@lru_cache(maxsize=4)
+def _load_selector_script(js_path: Path) -> str:
+    """Read the interactive selector bundle once per path"""
+    with open(js_path, 'r', encoding='utf-8') as f:
+        return _SELECTOR_OPTIONS_JS + f.read()
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve (and download if needed) chromedriver once per process"""
+    return ChromeDriverManager().install()
+
+
+# Reads the overlay's hidden input, clearing it unless the user clicked Done.
+_READ_AND_CLEAR_SELECTION_JS = """
+    const input = document.getElementById('selected_element_data');
+    if (!input || !input.value) { return null; }
+    const value = input.value;
+    if (value !== 'DONE_SELECTING') { input.value = ''; }
+    return value;
+"""
+
+# Resolves with the next selection, or null after arguments[0] milliseconds.
+_WAIT_FOR_SELECTION_JS = """
+    const timeoutMs = arguments[0];
+    const callback = arguments[arguments.length - 1];
+    const readAndClear = () => {
+""" + _READ_AND_CLEAR_SELECTION_JS + """
+    };
+    const value = readAndClear();
+    if (value !== null) { callback(value); return; }
+    let timer = null;
+    const onSelection = () => {
+        const selected = readAndClear();
+        if (selected === null) { return; }
+        window.removeEventListener('scraperselection', onSelection);
+        clearTimeout(timer);
+        callback(selected);
+    };
+    window.addEventListener('scraperselection', onSelection);
+    timer = setTimeout(() => {
+        window.removeEventListener('scraperselection', onSelection);
+        callback(null);
+    }, timeoutMs);
+"""
+
+
+# Resolves with the overlay's {field: selector} picks once every label has been
+# answered (or Done/Cancel was clicked), or with the partial picks on timeout.
+_WAIT_FOR_FIELD_PICKS_JS = """
+    const timeoutMs = arguments[0];
+    const callback = arguments[arguments.length - 1];
+    const finish = () => {
+        window.removeEventListener('scraperfieldpicks', finish);
+        clearTimeout(timer);
+        const picks = window.scraperFieldPicks || null;
+        delete window.scraperFieldPicks;
+        delete window.scraperFieldPicksDone;
+        callback(picks);
+    };
+    let timer = null;
+    if (window.scraperFieldPicksDone !== false) { finish(); return; }
+    window.addEventListener('scraperfieldpicks', finish);
+    timer = setTimeout(finish, timeoutMs);
+"""
+
+
 class BaseScraper:
     """
     Base class for web scrapers, handling driver initialization,
@@ -44,6 +122,11 @@ class BaseScraper:
         self.config = Config()
         self.driver = self._init_driver(headless, options)
         self.wait = WebDriverWait(self.driver, self.config.DEFAULT_TIMEOUT)
+        # Selenium's default async script timeout
+        self._script_timeout = 30
+        # Last selection seen by get_selected_element_data()
+        self._selection_version = None
+        self._selection_done = False
         self.cookie_handler = CookieHandler(self.driver, self.config)
 
     def _init_driver(self, headless: bool, options: Optional[webdriver.ChromeOptions]) -> webdriver.Chrome:
@@ -68,7 +151,7 @@ class BaseScraper:
             for key, value in experimental_options.items():
                 options.add_experimental_option(key, value)
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         try:
             driver = webdriver.Chrome(service=service, options=options)
             if not headless:
@@ -80,17 +163,22 @@ class BaseScraper:
             raise
 
     @retry_on_exception()
-    def navigate_to(self, url: str) -> bool:
+    def navigate_to(self, url: str, wait_until: str = "load") -> bool:
         """
         Navigates to the specified URL with retry logic.
 
         Args:
             url: The URL to navigate to.
+            wait_until: "load" waits for every subresource (driver.get);
+                "domcontentloaded" returns as soon as the DOM is parsed.
 
         Returns:
             True if navigation is successful, False otherwise.
         """
         try:
+            if wait_until == "domcontentloaded" and self._navigate_dom_ready(url):
+                self.logger.info(f"Navigated to {url} (DOM ready)")
+                return True
             self.driver.get(url)
             self.logger.info(f"Navigated to {url}")
             return True
@@ -98,6 +186,39 @@ class BaseScraper:
             self.logger.error(f"Failed to navigate to {url}: {e}")
             return False
 
+    def _navigate_dom_ready(self, url: str) -> bool:
+        """
+        Navigates via CDP and waits only for DOMContentLoaded.
+
+        Page.navigate returns once the new document has committed, so polling
+        readyState afterwards never observes the previous page.
+
+        Args:
+            url: The URL to navigate to.
+
+        Returns:
+            True if the DOM is ready, False if the caller should fall back
+            to a regular driver.get().
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Page.navigate', {'url': url})
+        except (AttributeError, WebDriverException) as e:
+            self.logger.debug(f"CDP navigation unavailable, using driver.get(): {e}")
+            return False
+
+        if result.get('errorText'):
+            self.logger.debug(f"CDP navigation to {url} failed: {result['errorText']}")
+            return False
+
+        try:
+            WebDriverWait(self.driver, self.config.PAGE_LOAD_TIMEOUT, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script("return document.readyState") != "loading"
+            )
+            return True
+        except TimeoutException:
+            self.logger.debug(f"DOMContentLoaded not reached for {url}, using driver.get()")
+            return False
+
     def get_current_url(self) -> str:
         """Returns the current URL of the browser."""
         return self.driver.current_url
@@ -174,27 +295,28 @@ class BaseScraper:
             self.logger.error(f"Failed to take screenshot: {e}")
             return None
 
-    def inject_interactive_selector(self, context_message: str = "Select elements") -> bool:
+    def inject_interactive_selector(self, context_message: str = "Select elements",
+                                    labels: Optional[List[str]] = None,
+                                    persistent: bool = False) -> bool:
         """
         Injects the interactive selector JavaScript into the page.
         
         Args:
             context_message: Message to display in the overlay
+            labels: Field labels to walk through, one per selection. Implies
+                persistent mode and adds a Skip button to the overlay.
+            persistent: Keep the overlay open across selections instead of
+                closing it after the first click
             
         Returns:
             True if injection successful, False otherwise
         """
         try:
-            # Load the JavaScript file
-            js_path = self.config.get_js_asset_path()
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            
-            # Set context message
-            self.driver.execute_script(f"window.scraperContextMessage = '{context_message}';")
-            
-            # Inject the JavaScript
-            self.driver.execute_script(js_content)
+            # Set the selection options and inject the (cached) script together
+            self.driver.execute_script(
+                _load_selector_script(self.config.get_js_asset_path()),
+                context_message, persistent or bool(labels), list(labels) if labels else None
+            )
             
             self.logger.info("Interactive selector JavaScript injected successfully")
             return True
@@ -207,19 +329,35 @@ class BaseScraper:
         """
         Retrieves the selected element data from the hidden input.
         
+        The overlay bumps a version token on every write, so an unchanged
+        selection costs one round-trip returning just that token; the payload
+        is only transferred when something new was selected, and the input is
+        cleared in the same call so a later wait does not see it again.
+        
         Returns:
-            Dictionary with selector and text, or None if no selection
+            Dictionary with selector and text, or None if no new selection
         """
         try:
-            value = self.driver.execute_script(
-                "return document.getElementById('selected_element_data') ? "
-                "document.getElementById('selected_element_data').value : '';"
+            result = self.driver.execute_script(
+                "const version = window.scraperSelectionVersion || null;"
+                "if (version === arguments[0]) { return null; }"
+                "const input = document.getElementById('selected_element_data');"
+                "const value = input ? input.value : '';"
+                "if (value && value !== 'DONE_SELECTING') { input.value = ''; }"
+                "return [version, value];",
+                self._selection_version
             )
             
-            if value and value != '' and value != 'DONE_SELECTING':
+            if result is None:
+                return {'done': True} if self._selection_done else None
+            
+            self._selection_version, value = result
+            self._selection_done = value == 'DONE_SELECTING'
+            
+            if value and not self._selection_done:
                 import json
                 return json.loads(value)
-            elif value == 'DONE_SELECTING':
+            elif self._selection_done:
                 return {'done': True}
             
             return None
@@ -228,6 +366,90 @@ class BaseScraper:
             self.logger.error(f"Failed to get selected element data: {e}")
             return None
 
+    def wait_for_selected_element_data(self, timeout: float = 15,
+                                       poll_frequency: float = 0.05) -> Optional[dict]:
+        """
+        Blocks until the user selects an element (or clicks Done).
+        
+        A single async script waits in the browser for the overlay's
+        'scraperselection' event, so there is one round-trip per selection
+        instead of one per poll. The hidden input is read and cleared in the
+        same call, so a selection is consumed exactly once.
+        
+        Args:
+            timeout: Maximum seconds to wait for a selection
+            poll_frequency: Seconds between polls if the async wait fails
+            
+        Returns:
+            Dictionary with selector and text, {'done': True}, or None on timeout
+        """
+        try:
+            self._ensure_script_timeout(timeout)
+            value = self.driver.execute_async_script(
+                _WAIT_FOR_SELECTION_JS, int(timeout * 1000)
+            )
+        except TimeoutException:
+            return None
+        except WebDriverException as e:
+            # e.g. the page navigated mid-wait; poll the new document instead
+            self.logger.debug(f"Async selection wait failed, polling instead: {e}")
+            try:
+                value = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(
+                    lambda driver: driver.execute_script(_READ_AND_CLEAR_SELECTION_JS)
+                )
+            except TimeoutException:
+                return None
+            except WebDriverException as e:
+                self.logger.error(f"Failed to wait for selected element data: {e}")
+                return None
+        
+        if not value:
+            return None
+        if value == 'DONE_SELECTING':
+            return {'done': True}
+        
+        import json
+        try:
+            return json.loads(value)
+        except ValueError as e:
+            self.logger.error(f"Invalid selected element data: {e}")
+            return None
+
+    def pick_fields(self, field_names: List[str], context_message: str = "Select fields",
+                    timeout: float = 300) -> dict:
+        """
+        Lets the user pick one element per field in a single overlay session.
+        
+        The overlay collects the picks in the page; they are returned by one
+        async script call instead of one wait per field.
+        
+        Args:
+            field_names: Fields to walk through, in order
+            context_message: Message to display in the overlay
+            timeout: Maximum seconds for the whole session
+            
+        Returns:
+            Dictionary mapping picked field names to CSS selectors. Skipped
+            fields are absent; on timeout the picks made so far are returned.
+        """
+        if not field_names or not self.inject_interactive_selector(context_message, labels=field_names):
+            return {}
+        
+        try:
+            self._ensure_script_timeout(timeout)
+            picks = self.driver.execute_async_script(_WAIT_FOR_FIELD_PICKS_JS, int(timeout * 1000))
+        except WebDriverException as e:
+            self.logger.error(f"Failed to collect field picks: {e}")
+            return {}
+        
+        return picks or {}
+
+    def _ensure_script_timeout(self, timeout: float):
+        """Raise the async script timeout so in-page timers fire before the driver's"""
+        if self._script_timeout < timeout + 5:
+            self.driver.set_script_timeout(timeout + 5)
+            self._script_timeout = timeout + 5
+
     def close(self):
         """Safely quits the WebDriver."""
         if self.driver:
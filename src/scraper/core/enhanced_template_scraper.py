@@ -8,41 +8,105 @@ Enhanced template scraper that integrates all improvements:
 - Advanced selector strategies
 """
 
+import os
+import re
 import logging
 import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Iterator, AsyncIterator
+from urllib.parse import urlparse, urljoin
+
+from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
 
 from ..models import (
     ScrapingTemplate,
     ScrapeResult,
     ScrapedItem,
     ExportFormat,
-    ScrapingType
+    ScrapingType,
+    now_iso
 )
 from ..config import Config
 from ..utils.rate_limiter import DomainRateLimiter, RATE_LIMIT_PRESETS
 from ..utils.template_migration import TemplateMigrationManager
+from ..utils.file_io import write_json
 from ..extractors.enhanced_element_extractor import EnhancedElementExtractor
 from ..extractors.pattern_extractor import PatternExtractor
+from ..extractors.requests_extractor import RequestExtractor
+from ..handlers import CookieHandler
+from ..utils.selectors import compile_css_selector
 
 # Import engine-specific components
 from .base_scraper import BaseScraper
-from .requests_scraper import RequestScraper
+from .requests_scraper import RequestScraper, HTML_PARSER
 from .playwright_scraper import PlaywrightScraper, PlaywrightExtractor
 # Removed import of deprecated template_scraper
 
 # Import exporters
-from ..exporters import JsonExporter, CsvExporter, ExcelExporter, HtmlExporter
+from ..exporters import JsonExporter, CsvExporter, ExcelExporter, HtmlExporter, ExportStream
+
+# Playwright navigation strategies in default order: (label, PlaywrightScraper method)
+_NAVIGATION_STRATEGIES = (
+    ("Smart", "navigate_to_smart"),
+    ("Ultra-fast", "navigate_to_fast"),
+    ("Minimal", "navigate_to_minimal"),
+)
+
+# Reads every field (and the detail link) of every list item in one round trip
+_EXTRACT_LIST_ITEMS_JS = """
+([nodes, fields, linkSelector]) => nodes.map(node => {
+    const data = {};
+    for (const [name, selector] of fields) {
+        const el = node.querySelector(selector);
+        const text = el && el.textContent ? el.textContent.trim() : '';
+        if (text) data[name] = text;
+    }
+    let link = null;
+    if (linkSelector) {
+        // The selector may point inside the anchor; .href is already absolute
+        const linkEl = node.querySelector(linkSelector);
+        const anchor = linkEl && linkEl.closest('a[href]');
+        link = anchor ? anchor.href : null;
+    }
+    return [data, link];
+})
+"""
+
+# Reads the raw text of every single-page field in one round trip
+_EXTRACT_PAGE_FIELDS_JS = """
+fields => {
+    const data = {};
+    for (const [name, selector] of fields) {
+        const el = document.querySelector(selector);
+        if (el && el.textContent) data[name] = el.textContent;
+    }
+    return data;
+}
+"""
+
+
+def _resolve_json_path(data: Any, keys: Sequence[str]) -> Any:
+    """Follow dotted-path keys into nested JSON, returning None when missing"""
+    for key in keys:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
 
 
 class EnhancedTemplateScraper:
     """Enhanced template scraper with all new features"""
     
     def __init__(self, engine: str = 'selenium', headless: bool = True,
-                 rate_limit_preset: str = 'respectful_bot'):
+                 rate_limit_preset: str = 'respectful_bot',
+                 max_concurrency: Optional[int] = None):
         """
         Initialize enhanced scraper
 
@@ -50,28 +114,43 @@ class EnhancedTemplateScraper:
             engine: Scraping engine ('selenium', 'requests', 'playwright')
             headless: Run browser in headless mode
             rate_limit_preset: Rate limiting preset name
+            max_concurrency: Playwright detail pages open at once
+                (defaults to Config.MAX_CONCURRENT_DETAIL_PAGES)
         """
         self.logger = logging.getLogger(f'{__name__}.EnhancedTemplateScraper')
         self.config = Config()
         self.engine = engine
+        self.max_concurrency = max(1, max_concurrency or self.config.MAX_CONCURRENT_DETAIL_PAGES)
         self.headless = headless
         self.scraper = None  # Initialize attributes to None
         self.extractor = None
         self.playwright_scraper = None
+        # One loop for the scraper's lifetime so the Playwright browser survives between templates
+        self._loop = asyncio.new_event_loop()
+        # Regex work from async paths runs here so it overlaps other pages' I/O
+        self._executor = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1))
+        # Background exports not yet known to be finished
+        self._pending_exports: List[Future] = []
+        # Per-domain navigation memory: winning strategy and consecutive total failures
+        self._nav_strategy_cache: Dict[str, str] = {}
+        self._nav_failures: Dict[str, int] = {}
+        # Loaded templates by path, valid while (mtime, auto_migrate) matches
+        self._template_cache: Dict[str, Tuple[Tuple[int, bool], ScrapingTemplate]] = {}
+        # (pattern name, joined context keywords) for the template being applied
+        self._compiled_patterns: List[Tuple[str, str]] = []
+        self._field_pattern_types: Dict[str, str] = {}
+        # (field name, selector) pairs, fixed for the template being applied
+        self._list_fields: Tuple[Tuple[str, str], ...] = ()
+        self._detail_fields: Tuple[Tuple[str, str], ...] = ()
+        # Detail field -> label text for the text-based fallback
+        self._label_fallbacks: Dict[str, str] = {}
+        # Fetch detail pages over plain HTTP, for templates whose detail pages need no JS
+        self._detail_via_http = False
+        # One requests scraper per worker thread; HTTP sessions aren't shared across threads
+        self._http_local = threading.local()
+        self._http_scrapers: List[RequestScraper] = []
 
-        # --- Corrected Engine Initialization ---
-        self.logger.info(f"Initializing scraper with engine: '{self.engine}'")
-        if self.engine == 'selenium':
-            self.scraper = BaseScraper(headless=self.headless)
-            self.extractor = EnhancedElementExtractor(self.scraper.driver)
-        elif self.engine == 'requests':
-            self.scraper = RequestScraper(self.config)
-            # For requests, the extractor is created later with page content
-        elif self.engine == 'playwright':
-            # Playwright's async initialization is handled in `apply_template`
-            pass
-        else:
-            raise ValueError(f"Unsupported engine: {self.engine}")
+        self._init_engine()
 
         # Initialize common components
         self.exporters = {
@@ -87,6 +166,56 @@ class EnhancedTemplateScraper:
 
         self.logger.info(f"Enhanced scraper configured for '{engine}' engine")                 
     
+    def _run(self, coro):
+        """Run a coroutine on the scraper's long-lived event loop"""
+        return self._loop.run_until_complete(coro)
+    
+    def _init_engine(self):
+        """Create the scraper objects for the current engine"""
+        self.logger.info(f"Initializing scraper with engine: '{self.engine}'")
+        # Engine-specific steps are bound here once, not re-dispatched on every page
+        if self.engine == 'selenium':
+            self.scraper = BaseScraper(headless=self.headless)
+            self.extractor = EnhancedElementExtractor(self.scraper.driver)
+            self._apply_engine = self._apply_template_sync
+            self._iter_engine = self._iter_template_sync
+            self._navigate_engine = self._navigate_selenium
+            self._find_items_engine = self._find_items_selenium
+        elif self.engine == 'requests':
+            self.scraper = RequestScraper(self.config)
+            # For requests, the extractor is created later with page content
+            self._apply_engine = self._apply_template_sync
+            self._iter_engine = self._iter_template_sync
+            self._navigate_engine = self._navigate_requests
+            self._find_items_engine = self._find_items_requests
+        elif self.engine == 'playwright':
+            # Playwright's async initialization is handled in `apply_template`
+            self._apply_engine = self._apply_template_playwright
+            self._iter_engine = self._iter_template_playwright
+            self._navigate_engine = None
+            self._find_items_engine = None
+        else:
+            raise ValueError(f"Unsupported engine: {self.engine}")
+    
+    def _switch_engine(self, new_engine: str):
+        """
+        Swap to another engine, keeping exporters, rate limiter and extractors
+
+        Args:
+            new_engine: Engine to switch to ('selenium', 'requests', 'playwright')
+        """
+        self.logger.info(f"Switching engine: '{self.engine}' -> '{new_engine}'")
+        if self.playwright_scraper:
+            self._run(self.playwright_scraper.close())
+            self.playwright_scraper = None
+        if self.scraper:
+            self.scraper.close()
+            self.scraper = None
+        self.extractor = None
+        
+        self.engine = new_engine
+        self._init_engine()
+    
     def _init_playwright(self):
         """Initialize Playwright components"""
         self.logger.info("🎭 Initializing Playwright engine for enhanced template scraper...")
@@ -100,7 +229,10 @@ class EnhancedTemplateScraper:
             
             self.logger.info("⚙️  Running async browser initialization...")
             # Run async initialization
-            asyncio.run(self.playwright_scraper._init_browser())
+            self._run(self.playwright_scraper._init_browser())
+            self._run(
+                self.playwright_scraper.open_page_pool(self.max_concurrency)
+            )
             
             self.logger.info("🔧 Creating PlaywrightExtractor...")
             self.playwright_extractor = PlaywrightExtractor(self.playwright_scraper.page)
@@ -110,9 +242,22 @@ class EnhancedTemplateScraper:
             self.logger.error(f"❌ Failed to initialize Playwright: {e}")
             raise
     
+    async def _install_resource_blocker(self, template: ScrapingTemplate):
+        """Block images, fonts and other assets the template does not need"""
+        try:
+            if not template.block_resources:
+                # Drop any blocker left behind by a previous template
+                await self.playwright_scraper.unblock_resources()
+                self.logger.info("Resource blocking disabled by template")
+                return
+            await self.playwright_scraper.block_resources(template.resource_block)
+        except Exception as e:
+            self.logger.warning(f"Could not install resource blocker: {e}")
+    
     def apply_template(self, template_path: str, 
                       export_formats: Optional[List[ExportFormat]] = None,
-                      auto_migrate: bool = True) -> ScrapeResult:
+                      auto_migrate: bool = True,
+                      sync_export: bool = False) -> ScrapeResult:
         """
         Apply template with automatic migration and enhancements
         
@@ -120,51 +265,190 @@ class EnhancedTemplateScraper:
             template_path: Path to template file
             export_formats: Export formats
             auto_migrate: Automatically migrate old templates
+            sync_export: Finish exporting before returning instead of in the
+                background (see ScrapeResult.export_future)
             
         Returns:
             Scraping results
         """
-        # Load and potentially migrate template
-        template = ScrapingTemplate.load(template_path)
+        template = self._prepare_template(template_path, auto_migrate)
         
-        if auto_migrate and self.migration_manager.needs_migration(template.to_dict()):
-            self.logger.info("Migrating template to latest version")
-            template_dict = self.migration_manager.migrate_template(template.to_dict())
-            template = ScrapingTemplate.from_dict(template_dict)
+        # Apply template based on engine
+        result = self._apply_engine(template)
+        
+        if export_formats:
+            if sync_export:
+                self._export_results(result, export_formats)
+            else:
+                # Write the files while the caller moves on to the next template
+                self._pending_exports = [f for f in self._pending_exports if not f.done()]
+                result.export_future = self._executor.submit(self._export_results, result, export_formats)
+                self._pending_exports.append(result.export_future)
+        
+        return result
+    
+    def apply_template_stream(self, template_path: str,
+                              export_formats: Optional[List[ExportFormat]] = None,
+                              auto_migrate: bool = True) -> Iterator[ScrapedItem]:
+        """
+        Apply template, yielding each item as soon as it is complete
+        
+        With Playwright, list-detail items are yielded in the order their
+        detail pages finish and are not kept after being yielded. Formats
+        whose exporter can write incrementally are written as items arrive;
+        other formats are skipped, since they need the whole result.
+        
+        Args:
+            template_path: Path to template file
+            export_formats: Export formats
+            auto_migrate: Automatically migrate old templates
             
-            # Save migrated template
-            template.save(template_path)
+        Yields:
+            Scraped items
+        """
+        template = self._prepare_template(template_path, auto_migrate)
+        streams = self._open_export_streams(template, export_formats or [])
+        try:
+            for item in self._iter_engine(template):
+                for stream in streams:
+                    stream.append(item)
+                yield item
+        finally:
+            for stream in streams:
+                stream.close()
+                self.logger.info(f"Exported {stream.count} items to {stream.filepath}")
+    
+    def _prepare_template(self, template_path: str, auto_migrate: bool) -> ScrapingTemplate:
+        """Load a template and set the engine, rate limits and patterns up for it"""
+        # Load and potentially migrate template
+        template = self._load_template(template_path, auto_migrate)
         
         # Check if template engine matches scraper engine
-        template_engine = getattr(template, 'engine', 'selenium')
+        template_engine = template.engine
         if template_engine != self.engine:
             self.logger.warning(f"Template engine ({template_engine}) doesn't match scraper engine ({self.engine})")
             # Respect the template's engine choice by reinitializing if needed
             if template_engine in ['selenium', 'requests', 'playwright']:
-                self.__init__(engine=template_engine, headless=self.headless, rate_limit_preset='respectful_bot')
+                self._switch_engine(template_engine)
         
         # Check rate limit configuration
-        template_dict = template.to_dict()
-        if template_dict.get('rate_limiting', {}).get('enabled'):
-            preset = template_dict['rate_limiting'].get('preset', 'respectful_bot')
+        rate_limiting = template.rate_limiting or {}
+        if rate_limiting.get('enabled'):
+            preset = rate_limiting.get('preset', 'respectful_bot')
             if preset in RATE_LIMIT_PRESETS:
                 self.rate_limiter.default_config = RATE_LIMIT_PRESETS[preset]
         
-        # Apply template based on engine
-        if self.engine == 'playwright':
-            return self._apply_template_playwright(template, export_formats)
-        else:
-            # For both selenium and requests engines, use parent's apply_template
-            # which already handles the engine-specific logic
-            return super().apply_template(template_path, export_formats)
+        self._compile_template(template)
+        return template
+    
+    def _load_template(self, template_path: str, auto_migrate: bool) -> ScrapingTemplate:
+        """Load (and migrate) a template, reusing the result while the file is unchanged"""
+        path = str(template_path)
+        key = (os.stat(path).st_mtime_ns, auto_migrate)
+        cached = self._template_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        template = ScrapingTemplate.load(path)
+        
+        # Up-to-date templates, the common case, are never serialized
+        if auto_migrate and self.migration_manager.needs_migration_version(template.version):
+            self.logger.info("Migrating template to latest version")
+            template_dict = self.migration_manager.migrate_template(template.to_dict())
+            template = ScrapingTemplate.from_dict(template_dict)
+            
+            # Save migrated template, unless the file already holds it
+            write_json(path, template.to_dict(), skip_unchanged=True)
+            key = (os.stat(path).st_mtime_ns, auto_migrate)
+        
+        self._template_cache[path] = (key, template)
+        return template
+    
+    def _compile_template(self, template: ScrapingTemplate):
+        """Resolve the template's extraction patterns once, before any page is scraped"""
+        compiled = []
+        for field_name, pattern_config in (template.extraction_patterns or {}).items():
+            if not pattern_config.get('enabled', True):
+                continue
+            
+            context_keywords = pattern_config.get('context_keywords') or []
+            custom_pattern = pattern_config.get('pattern')
+            if custom_pattern and field_name not in self.pattern_extractor.patterns:
+                self.pattern_extractor.add_custom_pattern(field_name, custom_pattern, context_keywords)
+            
+            if field_name not in self.pattern_extractor.patterns:
+                self.logger.warning(f"Skipping unknown extraction pattern: {field_name}")
+                continue
+            compiled.append((field_name, ' '.join(context_keywords)))
+        
+        self._compiled_patterns = compiled
+        self._field_pattern_types = {name: name for name, _ in compiled}
+        self.pattern_extractor.prime(name for name, _ in compiled)
+        
+        list_rules = template.list_page_rules
+        detail_rules = template.detail_page_rules
+        self._list_fields = tuple(list_rules.fields.items()) if list_rules else ()
+        self._detail_fields = tuple(detail_rules.fields.items()) if detail_rules else ()
+        
+        label_hints = {}
+        if detail_rules and detail_rules.advanced_selectors:
+            label_hints = detail_rules.advanced_selectors.get('use_text_content') or {}
+        self._label_fallbacks = {
+            field_name: label for field_name, label in label_hints.items()
+            if label and field_name in detail_rules.fields
+        }
+        self._detail_via_http = template.detail_engine == 'requests'
     
-    def _apply_template_playwright(self, template: ScrapingTemplate,
-                                 export_formats: Optional[List[ExportFormat]] = None) -> ScrapeResult:
+    async def _navigate_playwright(self, url: str) -> bool:
+        """
+        Navigate with the fallback strategies, starting from the domain's last winner
+
+        Args:
+            url: URL to navigate to
+
+        Returns:
+            True if any strategy succeeded
+        """
+        domain = urlparse(url).netloc.lower()
+        
+        # Back off before retrying a domain whose navigations keep failing
+        failures = self._nav_failures.get(domain, 0)
+        if failures:
+            delay = self.config.RETRY_DELAY * self.config.RETRY_BACKOFF ** (failures - 1)
+            self.logger.info(f"⏳ {failures} failed navigation(s) to {domain}, backing off {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        preferred = self._nav_strategy_cache.get(domain)
+        strategies = sorted(_NAVIGATION_STRATEGIES, key=lambda strategy: strategy[1] != preferred)
+        
+        for attempt, (label, method_name) in enumerate(strategies, 1):
+            self.logger.debug("📋 ATTEMPT %d: %s navigation...", attempt, label)
+            try:
+                if await getattr(self.playwright_scraper, method_name)(url):
+                    self.logger.debug("✅ %s navigation succeeded!", label)
+                    self._nav_strategy_cache[domain] = method_name
+                    self._nav_failures.pop(domain, None)
+                    return True
+            except Exception as e:
+                self.logger.error(f"❌ {label} navigation threw exception: {e}")
+            
+            # Demote a cached strategy that stopped working
+            if self._nav_strategy_cache.get(domain) == method_name:
+                del self._nav_strategy_cache[domain]
+        
+        self._nav_failures[domain] = failures + 1
+        return False
+    
+    def _apply_template_playwright(self, template: ScrapingTemplate) -> ScrapeResult:
         """Apply template using Playwright engine"""
-        self.logger.info("🎭 Starting Playwright template application...")
-        self.logger.info(f"📋 Template: {template.name}")
-        self.logger.info(f"🌐 Target URL: {template.site_info.url}")
-        self.logger.info(f"📊 Scraping type: {template.scraping_type.value}")
+        self.logger.info("🎭 Applying template with Playwright: %s", template.name)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🌐 Target URL: %s", template.site_info.url)
+            self.logger.debug("📊 Scraping type: %s", template.scraping_type.value)
+        
+        # Reuse the browser from earlier templates; only the first run pays for startup
+        if self.playwright_scraper is None:
+            self._init_playwright()
         
         start_time = datetime.now()
         items: List[ScrapedItem] = []
@@ -172,74 +456,31 @@ class EnhancedTemplateScraper:
         
         async def scrape_async():
             try:
-                self.logger.info("🚀 Starting async scraping process...")
-                
-                # Navigate to URL with multiple fallback strategies and detailed logging
-                url = template.site_info.url
-                self.logger.info(f"🌐 Starting multi-strategy navigation to: {url}")
-                navigation_success = False
-                
-                # Strategy 1: Smart navigation
-                self.logger.info("📋 ATTEMPT 1: Smart navigation strategy...")
-                try:
-                    navigation_success = await self.playwright_scraper.navigate_to_smart(url)
-                    if navigation_success:
-                        self.logger.info("✅ Smart navigation succeeded!")
-                except Exception as e:
-                    self.logger.error(f"❌ Smart navigation threw exception: {e}")
-                
-                # Strategy 2: Ultra-fast navigation
-                if not navigation_success:
-                    self.logger.info("📋 ATTEMPT 2: Ultra-fast navigation...")
-                    try:
-                        navigation_success = await self.playwright_scraper.navigate_to_fast(url)
-                        if navigation_success:
-                            self.logger.info("✅ Ultra-fast navigation succeeded!")
-                    except Exception as e:
-                        self.logger.error(f"❌ Ultra-fast navigation threw exception: {e}")
-                
-                # Strategy 3: Minimal navigation
-                if not navigation_success:
-                    self.logger.info("📋 ATTEMPT 3: Minimal navigation (last resort)...")
-                    try:
-                        navigation_success = await self.playwright_scraper.navigate_to_minimal(url)
-                        if navigation_success:
-                            self.logger.info("✅ Minimal navigation succeeded!")
-                    except Exception as e:
-                        self.logger.error(f"❌ Minimal navigation threw exception: {e}")
-                
-                # Final check
-                if not navigation_success:
-                    self.logger.error("❌ ALL NAVIGATION METHODS FAILED")
-                    self.logger.error("🔍 Possible issues:")
-                    self.logger.error("   - Network connectivity problems")
-                    self.logger.error("   - Site blocking automated requests")
-                    self.logger.error("   - Playwright browser issues")
-                    self.logger.error("   - Firewall/proxy interference")
-                    errors.append(f"Failed to navigate to {url} after trying all methods")
+                self.logger.debug("🚀 Starting async scraping process...")
+                ready, api_capture = await self._open_template_page(template, errors)
+                if not ready:
                     return
                 
-                # Handle cookies
-                self.logger.info("🍪 Handling cookie banners...")
-                await self.playwright_scraper.handle_cookies()
-                
-                # Scrape based on type
-                if template.scraping_type == ScrapingType.SINGLE_PAGE:
-                    self.logger.info("📄 Scraping single page...")
-                    items.extend(await self._scrape_single_page_playwright(template))
-                else:
-                    self.logger.info("📋 Scraping list page...")
-                    items.extend(await self._scrape_list_page_playwright(template))
+                try:
+                    # Scrape based on type
+                    if template.scraping_type == ScrapingType.SINGLE_PAGE:
+                        self.logger.debug("📄 Scraping single page...")
+                        items.extend(await self._scrape_single_page_playwright(template))
+                    else:
+                        self.logger.debug("📋 Scraping list page...")
+                        items.extend(await self._scrape_list_page_playwright(template, api_capture))
+                finally:
+                    self._stop_api_capture(api_capture)
                     
-                self.logger.info(f"✅ Scraping completed. Found {len(items)} items")
+                self.logger.info("✅ Scraping completed. Found %d items", len(items))
                     
             except Exception as e:
                 self.logger.error(f"❌ Playwright scraping error: {e}")
                 errors.append(str(e))
         
         # Run async scraping
-        self.logger.info("⚙️  Running async scraping loop...")
-        asyncio.run(scrape_async())
+        self.logger.debug("⚙️  Running async scraping loop...")
+        self._run(scrape_async())
         
         # Create result
         result = ScrapeResult(
@@ -253,196 +494,714 @@ class EnhancedTemplateScraper:
             failed_items=0
         )
         
-        if export_formats:
-            self._export_results(result, export_formats)
+        return result
+    
+    def _iter_template_playwright(self, template: ScrapingTemplate) -> Iterator[ScrapedItem]:
+        """Drive the async item stream on the scraper's loop, one item at a time"""
+        self.logger.info("🎭 Streaming template with Playwright: %s", template.name)
+        if self.playwright_scraper is None:
+            self._init_playwright()
+        
+        stream = self._stream_template_playwright(template)
+        try:
+            while True:
+                try:
+                    item = self._run(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            self._run(stream.aclose())
+    
+    async def _stream_template_playwright(self, template: ScrapingTemplate) -> AsyncIterator[ScrapedItem]:
+        """Yield the template's items as each one is complete"""
+        ready, api_capture = await self._open_template_page(template, [])
+        if not ready:
+            return
+        
+        if template.scraping_type == ScrapingType.SINGLE_PAGE:
+            self._stop_api_capture(api_capture)
+            for item in await self._scrape_single_page_playwright(template):
+                yield item
+            return
+        
+        try:
+            items = await self._collect_list_items_playwright(template, api_capture)
+        finally:
+            self._stop_api_capture(api_capture)
+        if template.scraping_type == ScrapingType.LIST_DETAIL:
+            async for item in self._iter_detail_pages_playwright(items, template.detail_page_rules):
+                yield item
+        else:
+            for item in items:
+                yield item
+    
+    async def _open_template_page(self, template: ScrapingTemplate,
+                                  errors: List[str]) -> Tuple[bool, Optional[Tuple[list, asyncio.Event, Any]]]:
+        """
+        Navigate to the template's start page and get it ready for extraction
+        
+        Returns:
+            Whether the page is ready, and the API capture state if one was
+            started; the caller stops it with _stop_api_capture() once done
+        """
+        await self._install_resource_blocker(template)
+        api_capture = self._start_api_capture(template)
+        
+        try:
+            # Navigate to URL, trying the strategy that last worked for this domain first
+            url = template.site_info.url
+            navigation_success = await self._navigate_playwright(url)
+            
+            # Final check
+            if not navigation_success:
+                self.logger.error("❌ ALL NAVIGATION METHODS FAILED")
+                self.logger.error("🔍 Possible issues:")
+                self.logger.error("   - Network connectivity problems")
+                self.logger.error("   - Site blocking automated requests")
+                self.logger.error("   - Playwright browser issues")
+                self.logger.error("   - Firewall/proxy interference")
+                errors.append(f"Failed to navigate to {url} after trying all methods")
+                self._stop_api_capture(api_capture)
+                return False, None
+            
+            # Handle cookies
+            self.logger.debug("🍪 Handling cookie banners...")
+            await self.playwright_scraper.handle_cookies()
+        except BaseException:
+            self._stop_api_capture(api_capture)
+            raise
+        return True, api_capture
+    
+    def _iter_template_sync(self, template: ScrapingTemplate) -> Iterator[ScrapedItem]:
+        """Items for streaming on the Selenium or requests engine, which scrape in one pass"""
+        return iter(self._apply_template_sync(template).items)
+    
+    def _apply_template_sync(self, template: ScrapingTemplate) -> ScrapeResult:
+        """Apply template using the Selenium or requests engine"""
+        self.logger.info("Applying template with %s: %s", self.engine, template.name)
+        
+        start_time = datetime.now()
+        items: List[ScrapedItem] = []
+        errors: List[str] = []
+        url = template.site_info.url
+        
+        try:
+            if not self._navigate_sync(url, template):
+                errors.append(f"Failed to navigate to {url}")
+            elif template.scraping_type == ScrapingType.SINGLE_PAGE:
+                if template.detail_page_rules:
+                    items.append(ScrapedItem(
+                        url=url,
+                        timestamp=now_iso(),
+                        data=self._extract_detail_data_smart(template.detail_page_rules)
+                    ))
+            else:
+                items.extend(self._scrape_list_page_sync(template))
+        except Exception as e:
+            self.logger.error(f"Scraping error: {e}")
+            errors.append(str(e))
+        
+        result = ScrapeResult(
+            template_name=template.name,
+            start_time=start_time.isoformat(),
+            end_time=datetime.now().isoformat(),
+            total_items=len(items),
+            items=items,
+            errors=errors,
+            successful_items=0,
+            failed_items=0
+        )
         
         return result
     
+    def _navigate_sync(self, url: str, template: ScrapingTemplate) -> bool:
+        """Rate-limited navigation for the Selenium and requests engines"""
+        self.rate_limiter.acquire(url)
+        return self._navigate_engine(url, template)
+    
+    def _navigate_requests(self, url: str, template: ScrapingTemplate) -> bool:
+        """Fetch a page with the requests engine and point the extractor at it"""
+        soup = self.scraper.navigate_to(url)
+        if soup is None:
+            return False
+        self.extractor = RequestExtractor(soup, url)
+        return True
+    
+    def _navigate_selenium(self, url: str, template: ScrapingTemplate) -> bool:
+        """Load a page in the browser and dismiss its cookie banner"""
+        if not self.scraper.navigate_to(url):
+            return False
+        custom_selectors = [
+            selector for selector in (template.site_info.cookie_xpath, template.site_info.cookie_css)
+            if selector
+        ]
+        CookieHandler(self.scraper.driver, self.config).accept_cookies(custom_selectors)
+        return True
+    
+    def _find_items_sync(self, selector: str) -> list:
+        """Find repeating item elements with the current engine"""
+        return self._find_items_engine(selector)
+    
+    def _find_items_selenium(self, selector: str) -> list:
+        """Find repeating item elements in the browser"""
+        return self.scraper.driver.find_elements(By.CSS_SELECTOR, selector)
+    
+    def _find_items_requests(self, selector: str) -> list:
+        """Find repeating item elements in the fetched page"""
+        soup = self.extractor.soup
+        compiled = compile_css_selector(selector)
+        return compiled.select(soup) if compiled else soup.select(selector)
+    
+    def _scrape_list_page_sync(self, template: ScrapingTemplate) -> List[ScrapedItem]:
+        """Scrape list page (and detail pages) with the Selenium or requests engine"""
+        list_rules = template.list_page_rules
+        if not list_rules:
+            return []
+        
+        link_selector = None
+        if template.scraping_type == ScrapingType.LIST_DETAIL:
+            link_selector = list_rules.profile_link_selector
+        page_url = template.site_info.url
+        timestamp = now_iso()
+        
+        # Bound once; these run for every field of every item
+        fields = self._list_fields
+        extract_text = self.extractor.extract_text
+        extract_link = self.extractor.extract_link
+        
+        items = []
+        for element in self._find_items_sync(list_rules.repeating_item_selector):
+            item_data = {}
+            for field_name, selector in fields:
+                value = extract_text(selector, parent=element)
+                if value:
+                    item_data[field_name] = value
+            
+            detail_url = None
+            if link_selector:
+                link = extract_link(link_selector, parent=element)
+                detail_url = link['href'] if link else None
+            
+            if item_data or detail_url:
+                items.append(ScrapedItem(
+                    url=page_url,
+                    timestamp=timestamp,
+                    data=item_data,
+                    detail_url=detail_url
+                ))
+        
+        detail_rules = template.detail_page_rules
+        if template.scraping_type == ScrapingType.LIST_DETAIL and detail_rules:
+            for item in items:
+                if not item.detail_url:
+                    continue
+                try:
+                    detail_url = urljoin(page_url, item.detail_url)
+                    if self._detail_via_http:
+                        self.rate_limiter.acquire(detail_url)
+                        detail_data = self._fetch_detail_http(detail_url)
+                        if detail_data is None:
+                            item.errors.append(f"Failed to fetch {detail_url}")
+                        else:
+                            item.detail_data = detail_data
+                    elif self._navigate_sync(detail_url, template):
+                        item.detail_data = self._extract_detail_data_smart(detail_rules)
+                    else:
+                        item.errors.append(f"Failed to navigate to {detail_url}")
+                except Exception as e:
+                    self.logger.error(f"Error scraping detail page {item.detail_url}: {e}")
+                    item.errors.append(str(e))
+        
+        return items
+    
+    def _export_results(self, result: ScrapeResult, export_formats: List[ExportFormat]):
+        """Export results in each requested format"""
+        for export_format in export_formats:
+            exporter = self.exporters.get(export_format)
+            if not exporter:
+                self.logger.warning(f"No exporter for format: {export_format}")
+                continue
+            try:
+                path = exporter.export(result)
+                if path:
+                    self.logger.info(f"Exported {export_format.value} to {path}")
+            except Exception as e:
+                self.logger.error(f"Failed to export {export_format.value}: {e}")
+    
+    def _open_export_streams(self, template: ScrapingTemplate,
+                             export_formats: List[ExportFormat]) -> List[ExportStream]:
+        """Open an incremental export for each requested format that supports one"""
+        # Every column the template can produce, in template order
+        columns = ['url', 'timestamp', 'errors']
+        for name in [name for name, _ in self._list_fields + self._detail_fields] + \
+                [name for name, _ in self._compiled_patterns]:
+            if name not in columns:
+                columns.append(name)
+        
+        streams = []
+        for export_format in export_formats:
+            exporter = self.exporters.get(export_format)
+            stream = exporter.open_stream(template.name, columns) if exporter else None
+            if stream is None:
+                self.logger.warning(f"{export_format.value} cannot be exported while streaming; skipping")
+                continue
+            streams.append(stream)
+        return streams
+    
     async def _scrape_single_page_playwright(self, template: ScrapingTemplate) -> List[ScrapedItem]:
         """Scrape single page with Playwright"""
         page_rules = template.detail_page_rules
         if not page_rules:
             return []
         
-        data = {}
-        
-        # Extract using selectors
-        for field_name, selector in page_rules.fields.items():
-            value = await self.playwright_scraper.get_text(selector)
-            if value:
-                data[field_name] = value
+        # Extract using selectors, all fields in one evaluation when possible
+        data = await self._extract_page_fields_playwright(self.playwright_scraper.page)
         
         # Apply pattern extraction if enabled
-        if hasattr(page_rules, 'extraction_patterns'):
+        if self._patterns_missing(data):
             page_content = await self.playwright_scraper.get_page_content()
-            for field_name, pattern_config in page_rules.extraction_patterns.items():
-                if field_name not in data or not data[field_name]:
-                    value = self.pattern_extractor.extract(
-                        page_content,
-                        field_name,
-                        context=' '.join(pattern_config.get('context_keywords', []))
-                    )
-                    if value:
-                        data[field_name] = value
+            await self._loop.run_in_executor(
+                self._executor, self._apply_patterns, page_content, data, True
+            )
         
         return [ScrapedItem(
             url=self.playwright_scraper.current_url,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso(),
             data=data
         )]
     
-    async def _scrape_list_page_playwright(self, template: ScrapingTemplate) -> List[ScrapedItem]:
+    async def _extract_page_fields_playwright(self, page) -> Dict[str, Any]:
+        """Read the detail fields in one evaluation, or one field at a time if that fails"""
+        try:
+            return await page.evaluate(_EXTRACT_PAGE_FIELDS_JS, list(self._detail_fields))
+        except Exception as e:
+            # e.g. a Playwright-only selector querySelector rejects
+            self.logger.debug(f"Bulk field extraction failed, falling back per field: {e}")
+        
+        data = {}
+        for field_name, selector in self._detail_fields:
+            value = await self.playwright_scraper.get_text(selector, page)
+            if value:
+                data[field_name] = value
+        return data
+    
+    def _start_api_capture(self, template: ScrapingTemplate) -> Optional[Tuple[list, asyncio.Event, Any]]:
+        """Listen for the list page's JSON API response before navigating"""
+        list_rules = template.list_page_rules
+        if not list_rules or not list_rules.api_url_pattern:
+            return None
+        
+        pattern = re.compile(list_rules.api_url_pattern)
+        payloads: list = []
+        received = asyncio.Event()
+        
+        async def on_response(response):
+            if not pattern.search(response.url):
+                return
+            try:
+                payloads.append(await response.json())
+                received.set()
+            except Exception as e:
+                self.logger.debug("Ignoring non-JSON API response %s: %s", response.url, e)
+        
+        self.playwright_scraper.page.on('response', on_response)
+        self.logger.info(f"📡 Capturing API responses matching: {list_rules.api_url_pattern}")
+        return payloads, received, on_response
+    
+    def _stop_api_capture(self, api_capture: Optional[Tuple[list, asyncio.Event, Any]]):
+        """Remove the response listener added by _start_api_capture()"""
+        if api_capture:
+            self.playwright_scraper.page.remove_listener('response', api_capture[2])
+    
+    async def _collect_api_items(self, list_rules,
+                                 api_capture: Tuple[list, asyncio.Event, Any]) -> List[ScrapedItem]:
+        """Build list items from captured JSON responses"""
+        payloads, received, _ = api_capture
+        try:
+            await asyncio.wait_for(received.wait(), timeout=self.config.API_CAPTURE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning("No API response matched; falling back to DOM extraction")
+            return []
+        
+        records_path = [key for key in (list_rules.api_json_path or '').split('.') if key]
+        field_keys = list_rules.api_fields or {name: name for name in list_rules.fields}
+        key_paths = {name: tuple(key.split('.')) for name, key in field_keys.items()}
+        link_path = key_paths.pop('detail_url', None)
+        field_paths = tuple(key_paths.items())
+        
+        page_url = self.playwright_scraper.current_url
+        base_url = self.playwright_scraper.page.url
+        timestamp = now_iso()
+        items = []
+        for payload in payloads:
+            records = _resolve_json_path(payload, records_path)
+            if not isinstance(records, list):
+                continue
+            for record in records:
+                item_data = {}
+                for field_name, keys in field_paths:
+                    value = _resolve_json_path(record, keys)
+                    if isinstance(value, str):
+                        value = value.strip()
+                    if value not in (None, ''):
+                        item_data[field_name] = value
+                
+                detail_url = _resolve_json_path(record, link_path) if link_path else None
+                # APIs often return relative links or numeric ids; resolve them like page hrefs
+                if isinstance(detail_url, (str, int)) and not isinstance(detail_url, bool):
+                    detail_url = urljoin(base_url, str(detail_url).strip()) if str(detail_url).strip() else None
+                else:
+                    detail_url = None
+                if item_data or detail_url:
+                    items.append(ScrapedItem(
+                        url=page_url,
+                        timestamp=timestamp,
+                        data=item_data,
+                        detail_url=detail_url
+                    ))
+        
+        self.logger.info(f"📡 Built {len(items)} items from {len(payloads)} API response(s)")
+        return items
+    
+    async def _scrape_list_page_playwright(self, template: ScrapingTemplate,
+                                           api_capture: Optional[Tuple[list, asyncio.Event, Any]] = None) -> List[ScrapedItem]:
         """Scrape list page with Playwright"""
+        items = await self._collect_list_items_playwright(template, api_capture)
+        
+        # Handle detail pages if needed; items are filled in place, so list order is kept
+        if template.scraping_type == ScrapingType.LIST_DETAIL:
+            async for _ in self._iter_detail_pages_playwright(items, template.detail_page_rules):
+                pass
+        
+        return items
+    
+    async def _collect_list_items_playwright(self, template: ScrapingTemplate,
+                                             api_capture: Optional[Tuple[list, asyncio.Event, Any]] = None) -> List[ScrapedItem]:
+        """Read the list page's items, from captured API responses when possible"""
         list_rules = template.list_page_rules
         if not list_rules:
             return []
         
+        items = await self._collect_api_items(list_rules, api_capture) if api_capture else []
+        if not items:
+            items = await self._scrape_list_items_dom(template)
+        return items
+    
+    async def _scrape_list_items_dom(self, template: ScrapingTemplate) -> List[ScrapedItem]:
+        """Extract list items from the DOM with a single in-page evaluation"""
+        list_rules = template.list_page_rules
+        link_selector = None
+        if template.scraping_type == ScrapingType.LIST_DETAIL:
+            link_selector = list_rules.profile_link_selector
+        
+        try:
+            rows = await self.playwright_scraper.page.eval_on_selector_all(
+                list_rules.repeating_item_selector,
+                _EXTRACT_LIST_ITEMS_JS,
+                [list(self._list_fields), link_selector]
+            )
+        except Exception as e:
+            # e.g. a Playwright-only selector querySelector rejects; element handles still accept it
+            self.logger.debug("Bulk list extraction failed, extracting per element: %s", e)
+            return await self._scrape_list_items_per_element(template)
+        
+        # Every item on the page shares one URL and one timestamp
+        page_url = self.playwright_scraper.current_url
+        timestamp = now_iso()
+        return [
+            ScrapedItem(url=page_url, timestamp=timestamp, data=item_data, detail_url=detail_url)
+            for item_data, detail_url in rows
+            if item_data or detail_url
+        ]
+    
+    async def _scrape_list_items_per_element(self, template: ScrapingTemplate) -> List[ScrapedItem]:
+        """Extract list items one element handle at a time"""
+        list_rules = template.list_page_rules
         items = []
         
         # Get all list items
         item_selector = list_rules.repeating_item_selector
         item_elements = await self.playwright_scraper.page.query_selector_all(item_selector)
         
+        link_selector = None
+        if template.scraping_type == ScrapingType.LIST_DETAIL:
+            link_selector = list_rules.profile_link_selector
+        page_url = self.playwright_scraper.current_url
+        timestamp = now_iso()
+        
         for element in item_elements:
             item_data = {}
             
             # Extract fields
-            for field_name, selector in list_rules.fields.items():
+            for field_name, selector in self._list_fields:
                 try:
-                    field_element = await element.query_selector(selector)
-                    if field_element:
-                        value = await field_element.text_content()
-                        if value:
-                            item_data[field_name] = value.strip()
+                    # Query and read in one round trip; raises when nothing matches
+                    value = await element.eval_on_selector(selector, "el => el.textContent")
+                    if value:
+                        item_data[field_name] = value.strip()
                 except Exception as e:
-                    self.logger.debug(f"Error extracting {field_name}: {e}")
+                    self.logger.debug("Error extracting %s: %s", field_name, e)
             
             # Get detail URL if needed
             detail_url = None
-            if template.scraping_type == ScrapingType.LIST_DETAIL and list_rules.profile_link_selector:
+            if link_selector:
                 try:
-                    link_element = await element.query_selector(list_rules.profile_link_selector)
+                    link_element = await element.query_selector(link_selector)
                     if link_element:
-                        detail_url = await link_element.get_attribute('href')
+                        href = await link_element.get_attribute('href')
+                        detail_url = urljoin(page_url, href) if href else None
                 except Exception:
                     pass
             
             if item_data or detail_url:
                 items.append(ScrapedItem(
-                    url=self.playwright_scraper.current_url,
-                    timestamp=datetime.now().isoformat(),
+                    url=page_url,
+                    timestamp=timestamp,
                     data=item_data,
                     detail_url=detail_url
                 ))
         
-        # Handle detail pages if needed
-        if template.scraping_type == ScrapingType.LIST_DETAIL:
-            await self._scrape_detail_pages_playwright(items, template.detail_page_rules)
-        
         return items
     
-    async def _scrape_detail_pages_playwright(self, items: List[ScrapedItem], detail_rules):
-        """Scrape detail pages with Playwright"""
+    async def _iter_detail_pages_playwright(self, items: List[ScrapedItem],
+                                            detail_rules) -> AsyncIterator[ScrapedItem]:
+        """
+        Scrape detail pages with Playwright using a bounded pool of pages,
+        yielding each item as soon as it is complete
+        
+        Items without a detail page are yielded first, unchanged; the rest
+        follow in the order their detail pages finish.
+        """
+        pending = [item for item in items if item.detail_url] if detail_rules else []
         for item in items:
-            if not item.detail_url:
-                continue
+            if not (detail_rules and item.detail_url):
+                yield item
+        if not pending:
+            return
+        
+        # Never run more pages at once than the domain's burst budget allows
+        burst_size = self.rate_limiter.get_limiter(pending[0].detail_url).config.burst_size
+        workers = max(1, min(self.max_concurrency, burst_size, len(pending)))
+        
+        semaphore = asyncio.Semaphore(workers)
+        self.logger.info("Scraping %d detail pages with %d page(s)", len(pending), workers)
+        
+        running = {
+            asyncio.ensure_future(self._scrape_one_detail(item, detail_rules, semaphore)): item
+            for item in pending
+        }
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = running.pop(task)
+                    # One failed worker must not cancel the rest of the batch
+                    if task.exception():
+                        self.logger.error(f"Detail worker failed for {item.detail_url}: {task.exception()}")
+                        item.errors.append(str(task.exception()))
+                    yield item
+        finally:
+            # The consumer stopped early: don't leave workers holding pool pages
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+    
+    async def _scrape_one_detail(self, item: ScrapedItem, detail_rules, semaphore: asyncio.Semaphore):
+        """Scrape a single detail page on a page checked out from the shared pool"""
+        async with semaphore:
+            # Apply rate limiting without blocking the other workers
+            await self.rate_limiter.acquire_async(item.detail_url)
             
-            try:
-                # Apply rate limiting
-                self.rate_limiter.acquire(item.detail_url)
-                
-                # Navigate to detail page
-                await self.playwright_scraper.navigate_to(item.detail_url)
-                
-                # Extract data
-                detail_data = {}
-                for field_name, selector in detail_rules.fields.items():
-                    value = await self.playwright_scraper.get_text(selector)
-                    if value:
-                        detail_data[field_name] = value
-                
-                # Apply pattern extraction
-                if hasattr(detail_rules, 'extraction_patterns'):
-                    page_content = await self.playwright_scraper.get_page_content()
-                    for field_name, pattern_config in detail_rules.extraction_patterns.items():
-                        if field_name not in detail_data:
-                            value = self.pattern_extractor.extract(
-                                page_content,
-                                field_name
-                            )
-                            if value:
-                                detail_data[field_name] = value
-                
-                item.detail_data = detail_data
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping detail page {item.detail_url}: {e}")
-                item.errors.append(str(e))
+            if self._detail_via_http:
+                # No browser page needed; the fetch and parse run on the thread pool
+                detail_data = await self._loop.run_in_executor(
+                    self._executor, self._fetch_detail_http, item.detail_url
+                )
+                if detail_data is None:
+                    item.errors.append(f"Failed to fetch {item.detail_url}")
+                else:
+                    item.detail_data = detail_data
+                return
+            
+            async with self.playwright_scraper.acquire_page() as page:
+                await self._extract_detail_page(item, detail_rules, page)
     
-    def _extract_detail_data_smart(self, detail_rules) -> Dict[str, Any]:
+    async def _extract_detail_page(self, item: ScrapedItem, detail_rules, page):
+        """Navigate a pooled page to the item's detail URL and extract its fields"""
+        try:
+            await page.goto(item.detail_url, wait_until="load")
+            
+            # Extract every field in one evaluation when possible
+            detail_data = await self._extract_page_fields_playwright(page)
+            
+            # Apply pattern extraction off the event loop
+            if self._patterns_missing(detail_data):
+                page_content = await page.content()
+                await self._loop.run_in_executor(
+                    self._executor, self._apply_patterns, page_content, detail_data
+                )
+            
+            item.detail_data = detail_data
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping detail page {item.detail_url}: {e}")
+            item.errors.append(str(e))
+    
+    def _http_scraper(self) -> RequestScraper:
+        """The calling thread's requests scraper, created on first use"""
+        scraper = getattr(self._http_local, 'scraper', None)
+        if scraper is None:
+            scraper = self._http_local.scraper = RequestScraper(self.config)
+            self._http_scrapers.append(scraper)
+        return scraper
+    
+    def _fetch_detail_http(self, url: str) -> Optional[Dict[str, Any]]:
         """
-        Override parent method to use enhanced extraction
+        Fetch a detail page over plain HTTP and extract its fields
+        
+        Returns:
+            The detail data, or None if the page could not be fetched
         """
-        if self.engine != 'selenium':
-            return super()._extract_detail_data_smart(detail_rules)
+        html = self._http_scraper().fetch(url)
+        if html is None:
+            return None
         
+        extractor = RequestExtractor(BeautifulSoup(html, HTML_PARSER), url)
+        detail_data = {}
+        for field_name, selector in self._detail_fields:
+            value = extractor.extract_text(selector)
+            if value:
+                detail_data[field_name] = value
+        self._apply_label_fallbacks(extractor, detail_data)
+        
+        if self._compiled_patterns:
+            self._apply_patterns(html, detail_data)
+        return detail_data
+    
+    def _extract_detail_data_smart(self, detail_rules) -> Dict[str, Any]:
+        """
+        Extract detail fields from the current page, with pattern and
+        label fallbacks on Selenium
+        """
         detail_data = {}
         
         # Use enhanced extractor for Selenium
         if isinstance(self.extractor, EnhancedElementExtractor):
-            # Check if template has pattern configurations
-            patterns = {}
-            if hasattr(detail_rules, 'extraction_patterns'):
-                patterns = {
-                    field: config.get('pattern', field)
-                    for field, config in detail_rules.extraction_patterns.items()
-                }
-            
             # Extract with patterns
             detail_data = self.extractor.extract_with_patterns(
                 detail_rules.fields,
-                patterns
+                self._field_pattern_types
             )
             
-            # Try advanced strategies for missing fields
-            if hasattr(detail_rules, 'advanced_selectors'):
-                config = detail_rules.advanced_selectors
-                
-                for field_name, selector in detail_rules.fields.items():
-                    if field_name not in detail_data:
-                        # Try text-based selection
-                        if config.get('use_text_content', {}).get(field_name):
-                            text_to_find = config['use_text_content'][field_name]
-                            value = self.extractor.find_and_extract_by_label(
-                                text_to_find
-                            )
-                            if value:
-                                detail_data[field_name] = value
-                        
-                        # Try proximity-based selection
-                        elif config.get('use_proximity', {}).get(field_name):
-                            prox_config = config['use_proximity'][field_name]
-                            # Implementation depends on specific configuration
-                            pass
+            # Try text-based selection for missing fields
+            self._apply_label_fallbacks(self.extractor, detail_data)
         else:
-            # Fallback to parent implementation
-            detail_data = super()._extract_detail_data_smart(detail_rules)
+            # Plain selector extraction (requests engine)
+            for field_name, selector in self._detail_fields:
+                value = self.extractor.extract_text(selector)
+                if value:
+                    detail_data[field_name] = value
+            self._apply_label_fallbacks(self.extractor, detail_data)
+            
+            if self._patterns_missing(detail_data):
+                self._apply_patterns(self.scraper.get_page_source(), detail_data)
         
         return detail_data
     
+    def _apply_label_fallbacks(self, extractor, data: Dict[str, Any]):
+        """Fill fields still missing from data by the on-page label hinted for them"""
+        for field_name, label in self._label_fallbacks.items():
+            if field_name not in data:
+                value = extractor.find_and_extract_by_label(label)
+                if value:
+                    data[field_name] = value
+    
+    def _patterns_missing(self, data: Dict[str, Any]) -> bool:
+        """Whether a pattern field still lacks a value, so the page source is worth reading"""
+        return any(name not in data for name, _ in self._compiled_patterns)
+    
+    def _apply_patterns(self, page_content: str, data: Dict[str, Any],
+                        use_context: bool = False) -> Dict[str, Any]:
+        """
+        Fill fields missing from data using the compiled extraction patterns
+
+        Args:
+            page_content: Page HTML to scan
+            data: Extracted fields, updated in place
+            use_context: Require each pattern's context keywords to match
+
+        Returns:
+            The updated data
+        """
+        candidates = self.pattern_extractor.find_candidate_patterns(
+            page_content, (name for name, _ in self._compiled_patterns)
+        )
+        # One scan of the page covers every pattern still missing
+        missing = [name for name, _ in self._compiled_patterns
+                   if name in candidates and name not in data]
+        data.update(self.pattern_extractor.extract_many(
+            page_content, missing, dict(self._compiled_patterns) if use_context else None
+        ))
+        return data
+    
     def close(self):
         """Clean up resources"""
         self.logger.info("🧹 Cleaning up Enhanced Template Scraper resources...")
         
-        if hasattr(self, 'playwright_scraper'):
-            self.logger.info("🎭 Closing Playwright scraper...")
-            asyncio.run(self.playwright_scraper.close())
-            self.logger.info("✅ Playwright scraper closed")
+        # Let background exports finish writing; a failed export must not skip teardown
+        for future in self._pending_exports:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"Background export failed: {e}")
+        self._pending_exports = []
+        
+        # Each step is isolated so one failure cannot leak the browser, driver or threads
+        try:
+            if not self._loop.is_closed():
+                try:
+                    if self.playwright_scraper:
+                        self.logger.info("🎭 Closing Playwright scraper...")
+                        self._run(self.playwright_scraper.close())
+                        self.logger.info("✅ Playwright scraper closed")
+                finally:
+                    self.playwright_scraper = None
+                    self._shutdown_loop()
+        except Exception as e:
+            self.logger.error(f"Error shutting down Playwright: {e}")
+        finally:
+            self._executor.shutdown(wait=True)
+            for http_scraper in self._http_scrapers:
+                try:
+                    http_scraper.close()
+                except Exception as e:
+                    self.logger.warning(f"Error closing HTTP session: {e}")
+            self._http_scrapers = []
+            
+            if self.scraper:
+                self.logger.info("🔧 Closing engine scraper...")
+                try:
+                    self.scraper.close()
+                except Exception as e:
+                    self.logger.error(f"Error closing engine scraper: {e}")
+                self.scraper = None
         
-        self.logger.info("🔧 Closing parent scraper resources...")
-        super().close()
         self.logger.info("✅ Enhanced Template Scraper cleanup complete")
     
+    def _shutdown_loop(self):
+        """Finish abandoned item streams and stray tasks, then close the loop"""
+        try:
+            pending = asyncio.all_tasks(self._loop)
+            if pending:
+                # gather() with no tasks would bind its future to a different loop
+                for task in pending:
+                    task.cancel()
+                self._run(asyncio.gather(*pending, return_exceptions=True))
+            self._run(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
+    
     def get_scraping_stats(self) -> Dict[str, Any]:
         """Get scraping statistics including rate limiting"""
         stats = {
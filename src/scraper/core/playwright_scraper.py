@@ -5,11 +5,12 @@ Playwright-based scraper for JavaScript-heavy sites with better performance than
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Iterable, AsyncIterator
 from pathlib import Path
 
 try:
-    from playwright.async_api import async_playwright, Page, Browser, Playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -17,6 +18,12 @@ except ImportError:
 from ..config import Config
 from ..handlers import CookieHandler
 
+# Resource types that never carry scrapeable content
+BLOCKED_RESOURCE_TYPES = frozenset({
+    'image', 'stylesheet', 'font', 'media', 'beacon',
+    'csp_report', 'imageset', 'texttrack', 'websocket'
+})
+
 
 class PlaywrightScraper:
     """
@@ -43,7 +50,14 @@ class PlaywrightScraper:
         self.browser_type = browser_type
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Extra pages in the shared context, checked out by concurrent workers
+        self.page_pool: Optional[asyncio.Queue] = None
+        self._pool_size = 0
+        self._pool_pages: List[Page] = []
+        # Route handler installed by block_resources(), kept so it can be removed
+        self._resource_route = None
         self.current_url: Optional[str] = None
         self._loop = None
         
@@ -84,7 +98,7 @@ class PlaywrightScraper:
         
         # Create context with viewport and user agent
         self.logger.info("🖥️  Creating browser context with viewport 1920x1080...")
-        context = await self.browser.new_context(
+        self.context = context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             # Add network debugging
@@ -104,13 +118,88 @@ class PlaywrightScraper:
         self.page = await context.new_page()
         self.logger.info("✅ New page created")
         
-        # Set default timeout
+        # Set default timeout (on the context so extra pages inherit it)
         timeout_ms = self.config.DEFAULT_TIMEOUT * 1000
-        self.page.set_default_timeout(timeout_ms)
+        context.set_default_timeout(timeout_ms)
         self.logger.info(f"⏱️  Default timeout set to {timeout_ms}ms")
         
         self.logger.info(f"🎉 Playwright browser fully initialized ({self.browser_type})")
     
+    async def block_resources(self, resource_types: Optional[Iterable[str]] = None):
+        """
+        Abort requests for the given resource types on every page in the context
+        
+        Args:
+            resource_types: Types to block (defaults to BLOCKED_RESOURCE_TYPES)
+        """
+        await self.unblock_resources()
+        blocked = BLOCKED_RESOURCE_TYPES if resource_types is None else frozenset(resource_types)
+        if not blocked:
+            return
+        
+        async def handle_route(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await self.context.route('**/*', handle_route)
+        self._resource_route = handle_route
+        self.logger.info(f"🚫 Blocking resource types: {', '.join(sorted(blocked))}")
+    
+    async def unblock_resources(self):
+        """Remove the handler installed by block_resources(), if any"""
+        if self._resource_route is None:
+            return
+        handler, self._resource_route = self._resource_route, None
+        await self.context.unroute('**/*', handler)
+    
+    async def new_page(self) -> Page:
+        """Open an extra page in the shared browser context"""
+        return await self.context.new_page()
+    
+    async def open_page_pool(self, size: int):
+        """
+        Set up a pool of pages for concurrent work; they live until close()
+        
+        Args:
+            size: Maximum number of pages in the pool
+        """
+        self.page_pool = asyncio.Queue()
+        self._pool_size = size
+        self._pool_pages = []
+        self.logger.info(f"📄 Page pool ready (up to {size} pages)")
+    
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """
+        Check out a pool page for the duration of an `async with` block.
+        
+        Pages are opened on demand up to the pool size; beyond that callers
+        wait for one to be released. A page that was closed or crashed while
+        checked out is replaced on release.
+        """
+        if self.page_pool.empty() and len(self._pool_pages) < self._pool_size:
+            # Reserve the slot before awaiting so concurrent callers don't overshoot
+            self._pool_pages.append(None)
+            try:
+                page = await self.new_page()
+            except BaseException:
+                self._pool_pages.remove(None)
+                raise
+            self._pool_pages[self._pool_pages.index(None)] = page
+        else:
+            page = await self.page_pool.get()
+        
+        try:
+            yield page
+        finally:
+            if page.is_closed():
+                self._pool_pages.remove(page)
+                page = await self.new_page()
+                self._pool_pages.append(page)
+            self.page_pool.put_nowait(page)
+    
     async def navigate_to(self, url: str, wait_until: str = "networkidle") -> bool:
         """
         Navigate to URL with Playwright with fallback strategies
@@ -339,34 +428,31 @@ class PlaywrightScraper:
             self.logger.warning(f"⏰ Timeout waiting for selector: {selector}")
             return False
     
-    async def get_text(self, selector: str) -> Optional[str]:
-        """Get text content of element"""
-        self.logger.debug(f"🔍 Getting text for selector: {selector}")
+    async def get_text(self, selector: str, page: Optional[Page] = None) -> Optional[str]:
+        """Get text content of element, on the main page unless another is given"""
+        self.logger.debug("🔍 Getting text for selector: %s", selector)
         
         try:
-            element = await self.page.query_selector(selector)
+            element = await (page or self.page).query_selector(selector)
             if element:
                 text = await element.text_content()
-                text_preview = text[:100] + "..." if len(text) > 100 else text
-                self.logger.debug(f"✅ Text extracted: {text_preview}")
+                if text and self.logger.isEnabledFor(logging.DEBUG):
+                    text_preview = text[:100] + "..." if len(text) > 100 else text
+                    self.logger.debug("✅ Text extracted: %s", text_preview)
                 return text
             else:
-                self.logger.debug(f"❌ Element not found: {selector}")
+                self.logger.debug("❌ Element not found: %s", selector)
                 return None
         except Exception as e:
-            self.logger.debug(f"Error getting text from {selector}: {e}")
+            self.logger.debug("Error getting text from %s: %s", selector, e)
             return None
     
     async def get_texts(self, selector: str) -> List[str]:
         """Get text content of multiple elements"""
         try:
-            elements = await self.page.query_selector_all(selector)
-            texts = []
-            for element in elements:
-                text = await element.text_content()
-                if text:
-                    texts.append(text.strip())
-            return texts
+            # One round trip for every match instead of one per element
+            texts = await self.page.locator(selector).all_text_contents()
+            return [text.strip() for text in texts if text]
         except Exception as e:
             self.logger.debug(f"Error getting texts from {selector}: {e}")
             return []
@@ -513,6 +599,13 @@ class PlaywrightScraper:
         """Close browser and cleanup"""
         self.logger.info("🛑 Starting Playwright browser cleanup...")
         
+        if self.page_pool:
+            for page in self._pool_pages:
+                if page and not page.is_closed():
+                    await page.close()
+            self._pool_pages = []
+            self.page_pool = None
+        
         if self.page:
             self.logger.info("📄 Closing page...")
             await self.page.close()
@@ -531,25 +624,32 @@ class PlaywrightScraper:
         self.logger.info("🎉 Playwright browser fully closed")
     
     # Synchronous wrapper methods for compatibility
+    def _run_sync(self, coro):
+        """Run a coroutine on one event loop kept for all synchronous wrappers"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
     def navigate_to_sync(self, url: str) -> bool:
         """Synchronous wrapper for navigate_to"""
         self.logger.info(f"🔄 Running async navigate_to synchronously for: {url}")
-        return asyncio.run(self.navigate_to(url))
+        return self._run_sync(self.navigate_to(url))
     
     def get_text_sync(self, selector: str) -> Optional[str]:
         """Synchronous wrapper for get_text"""
         self.logger.debug(f"🔄 Running async get_text synchronously for: {selector}")
-        return asyncio.run(self.get_text(selector))
+        return self._run_sync(self.get_text(selector))
     
     def click_sync(self, selector: str) -> bool:
         """Synchronous wrapper for click"""
         self.logger.info(f"🔄 Running async click synchronously for: {selector}")
-        return asyncio.run(self.click(selector))
+        return self._run_sync(self.click(selector))
     
     def close_sync(self):
         """Synchronous wrapper for close"""
         self.logger.info("🔄 Running async close synchronously")
-        asyncio.run(self.close())
+        self._run_sync(self.close())
+        self._loop.close()
 
 
 class PlaywrightExtractor:
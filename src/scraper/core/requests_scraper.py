@@ -9,7 +9,22 @@ from typing import Optional
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_AVAILABLE = True
+    _REQUEST_ERRORS = (requests.RequestException, curl_requests.RequestsError)
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
+    _REQUEST_ERRORS = (requests.RequestException,)
+
 from ..config import Config
+from ..utils.selectors import compile_css_selector
 
 
 class RequestScraper:
@@ -22,44 +37,65 @@ class RequestScraper:
         """Initializes the RequestScraper."""
         self.logger = logging.getLogger(f'{__name__}.RequestScraper')
         self.config = config
-        self.session = requests.Session()
-        # Use a common browser user-agent
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        if CURL_CFFI_AVAILABLE and config.HTTP_IMPERSONATE:
+            # Browser TLS/HTTP2 fingerprint, with the matching user-agent built in
+            self.session = curl_requests.Session(impersonate=config.HTTP_IMPERSONATE)
+        else:
+            self.session = requests.Session()
+            # Use a common browser user-agent
+            self.session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
         self.current_url = None
         self.current_soup = None
 
-    def navigate_to(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch(self, url: str) -> Optional[str]:
         """
-        Fetches the content of a URL and parses it with BeautifulSoup.
+        Fetches a URL's HTML without making it the current page.
 
         Args:
             url: The URL to fetch.
 
         Returns:
-            A BeautifulSoup object if successful, otherwise None.
+            The response body if successful, otherwise None.
         """
-        self.logger.info(f"Fetching URL with requests: {url}")
         try:
             response = self.session.get(url, timeout=self.config.DEFAULT_TIMEOUT)
             # Raise an exception for bad status codes (4xx or 5xx)
             response.raise_for_status()
-            self.current_url = url
-            # Use html.parser, but lxml is faster if installed
-            self.current_soup = BeautifulSoup(response.text, 'html.parser')
-            return self.current_soup
-        except requests.RequestException as e:
+            return response.text
+        except _REQUEST_ERRORS as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             return None
 
+    def navigate_to(self, url: str) -> Optional[BeautifulSoup]:
+        """
+        Fetches the content of a URL and parses it with BeautifulSoup.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            A BeautifulSoup object if successful, otherwise None.
+        """
+        self.logger.info(f"Fetching URL with requests: {url}")
+        html = self.fetch(url)
+        if html is None:
+            return None
+        self.current_url = url
+        # lxml builds the tree several times faster than html.parser
+        self.current_soup = BeautifulSoup(html, HTML_PARSER)
+        return self.current_soup
+
     def extract_text(self, selector: str) -> Optional[str]:
         """Extract text from a single element"""
         if not self.current_soup:
             return None
         
         try:
-            element = self.current_soup.select_one(selector)
+            compiled = compile_css_selector(selector)
+            element = (compiled.select_one(self.current_soup) if compiled
+                       else self.current_soup.select_one(selector))
             if element:
                 return element.get_text(strip=True)
             return None
@@ -73,7 +109,9 @@ class RequestScraper:
             return []
         
         try:
-            elements = self.current_soup.select(selector)
+            compiled = compile_css_selector(selector)
+            elements = (compiled.select(self.current_soup) if compiled
+                        else self.current_soup.select(selector))
             return [elem.get_text(strip=True) for elem in elements]
         except Exception as e:
             self.logger.debug(f"Failed to extract multiple texts with selector {selector}: {e}")
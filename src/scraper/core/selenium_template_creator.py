@@ -2,14 +2,53 @@
 Selenium-specific template creator with proper list->detail page flow
 """
 
+import os
 import time
 import logging
 from typing import Dict, List, Optional, Any
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 
 from ..models import ScrapingTemplate, ScrapingType, TemplateRules, SiteInfo
 from ..config import Config
+from ..utils.selectors import remove_nth_of_type, split_child_combinators, count_matches
+
+# Item count plus the detail hrefs of the first few items, resolved in the page:
+# the profile link selector is tried first, then any link, and non-anchor
+# matches are walked up to their enclosing <a>
+_FIRST_DETAIL_LINKS_JS = """
+const items = document.querySelectorAll(arguments[0]);
+const linkSelector = arguments[1];
+const links = [];
+for (const item of Array.from(items).slice(0, arguments[2])) {
+    let link = null;
+    if (linkSelector) {
+        try { link = item.querySelector(linkSelector); } catch (e) {}
+    }
+    link = link || item.querySelector('a');
+    const anchor = link && link.closest('a');
+    links.push(anchor ? anchor.href : (link && link.getAttribute('href')));
+}
+return [items.length, links];
+"""
+
+# [tag, count] for the container's direct children, in first-seen order
+_CHILD_TAG_COUNTS_JS = """
+const counts = new Map();
+for (const child of arguments[0].children) {
+    const tag = child.tagName.toLowerCase();
+    counts.set(tag, (counts.get(tag) || 0) + 1);
+}
+return Array.from(counts);
+"""
+
+# [class, count] over every descendant of the container, in first-seen order
+_CLASS_COUNTS_JS = """
+const counts = new Map();
+for (const el of arguments[0].querySelectorAll('*')) {
+    for (const cls of el.classList) counts.set(cls, (counts.get(cls) || 0) + 1);
+}
+return Array.from(counts);
+"""
 
 
 class SeleniumTemplateCreator:
@@ -17,8 +56,11 @@ class SeleniumTemplateCreator:
     
     def __init__(self, scraper):
         self.scraper = scraper  # UnifiedInteractiveScraper instance
+        self.driver = scraper.scraper.driver  # WebDriver behind the wrapper
         self.logger = logging.getLogger(__name__)
         self.config = Config()
+        # Selector of the clicked list item, used to make field selectors relative
+        self._current_item_selector: Optional[str] = None
         
     def create_list_detail_template(self, url: str) -> Optional[ScrapingTemplate]:
         """Create a list+detail template with proper flow"""
@@ -47,6 +89,10 @@ class SeleniumTemplateCreator:
             return None
         list_rules.profile_link_selector = link_selector
         
+        counts = self.scraper.count_links_in_items(list_rules.repeating_item_selector, link_selector)
+        if counts:
+            print(f"🔗 Link found in {counts[0]} of {counts[1]} items")
+        
         # Step 2: Navigate to a detail page
         print("\n" + "="*60)
         print("📄 STEP 2: Configure Detail Page")
@@ -86,35 +132,40 @@ class SeleniumTemplateCreator:
         
         return template
         
-    def _configure_repeating_item(self, rules: TemplateRules) -> bool:
+    def _configure_repeating_item(self, rules: TemplateRules, max_attempts: int = 3) -> bool:
         """Configure repeating item selector with validation"""
         
-        print("\n🎯 Click on ONE individual item (not the container)")
-        print("Examples: one attorney card, one product, one article")
-        
-        # Clear any previous selection
-        self._clear_selection()
-        
-        # Inject selector
-        if not self.scraper.inject_interactive_selector("Click ONE item"):
-            return False
-            
-        # Wait for selection
-        selector = self._wait_for_selection()
-        if not selector:
-            return False
+        for attempt in range(max_attempts):
+            print("\n🎯 Click on ONE individual item (not the container)")
+            print("Examples: one attorney card, one product, one article")
             
-        # Validate and improve the selector
-        validated_selector = self._validate_and_improve_selector(selector)
-        if not validated_selector:
-            print("\n❌ Invalid selection. Please try again.")
-            return self._configure_repeating_item(rules)
+            # Clear any previous selection
+            self._clear_selection()
             
-        rules.repeating_item_selector = validated_selector
-        print(f"✅ Using selector: {validated_selector}")
-        
+            # Inject selector
+            if not self.scraper.inject_interactive_selector("Click ONE item"):
+                return False
+                
+            # Wait for selection
+            selector = self._wait_for_selection()
+            if not selector:
+                return False
+                
+            # Validate and improve the selector
+            validated_selector = self._validate_and_improve_selector(selector)
+            if validated_selector:
+                rules.repeating_item_selector = validated_selector
+                print(f"✅ Using selector: {validated_selector}")
+                
+                self.scraper.cleanup_interactive_selector()
+                return True
+                
+            if attempt + 1 < max_attempts:
+                print("\n❌ Invalid selection. Please try again.")
+                
+        print(f"\n❌ No valid item selected after {max_attempts} attempts")
         self.scraper.cleanup_interactive_selector()
-        return True
+        return False
         
     def _configure_fields(self, context: str) -> Dict[str, str]:
         """Configure fields with click-first approach"""
@@ -123,17 +174,14 @@ class SeleniumTemplateCreator:
         print(f"Click elements first, then name them.")
         print("Click 'Done' when finished.\n")
         
-        field_count = 0
-        while True:
-            field_count += 1
-            
-            # Clear previous selection
-            self._clear_selection()
+        # Clear previous selection
+        self._clear_selection()
+        
+        # Inject selector once; it stays open until Done
+        if not self.scraper.inject_interactive_selector("Select a field or Done", persistent=True):
+            return fields
             
-            # Inject selector
-            if not self.scraper.inject_interactive_selector(f"Select field #{field_count} or Done"):
-                break
-                
+        while True:
             # Wait for selection
             data = self._wait_for_selection(return_data=True)
             if not data:
@@ -158,15 +206,15 @@ class SeleniumTemplateCreator:
                 
                 if field_name:
                     # Make selector relative if possible
-                    if hasattr(self, '_current_item_selector'):
+                    if self._current_item_selector:
                         selector = self._make_relative(selector, self._current_item_selector)
                     
                     fields[field_name] = selector
                     print(f"✅ Saved as '{field_name}'")
                     
-            self.scraper.cleanup_interactive_selector()
             print("-" * 40)
             
+        self.scraper.cleanup_interactive_selector()
         return fields
         
     def _get_link_selector(self) -> Optional[str]:
@@ -183,7 +231,7 @@ class SeleniumTemplateCreator:
         selector = self._wait_for_selection()
         if selector:
             # Make the link selector relative to the item
-            if hasattr(self, '_current_item_selector'):
+            if self._current_item_selector:
                 relative_selector = self._make_relative(selector, self._current_item_selector)
                 print(f"✅ Link selector (relative): {relative_selector}")
                 selector = relative_selector
@@ -201,52 +249,33 @@ class SeleniumTemplateCreator:
         print("\n🔄 Navigating to first detail page...")
         
         try:
-            # Find all items
-            items = self.scraper.scraper.driver.find_elements(
-                By.CSS_SELECTOR, 
-                list_rules.repeating_item_selector
+            # Count items and resolve links in the first 3 with one script call
+            total, links = self.driver.execute_script(
+                _FIRST_DETAIL_LINKS_JS,
+                list_rules.repeating_item_selector,
+                list_rules.profile_link_selector,
+                3
             )
             
-            if not items:
+            if not total:
                 print("❌ No items found with selector")
                 return False
                 
-            print(f"📊 Found {len(items)} items")
+            print(f"📊 Found {total} items")
             
-            # Try to find a link in the first few items
-            for i, item in enumerate(items[:3]):  # Check first 3 items
-                try:
-                    # First try the profile link selector
-                    if list_rules.profile_link_selector:
-                        try:
-                            link = item.find_element(
-                                By.CSS_SELECTOR, 
-                                list_rules.profile_link_selector
-                            )
-                        except:
-                            # Try simpler selector within item
-                            link = item.find_element(By.CSS_SELECTOR, "a")
-                    else:
-                        # No specific selector, find first link
-                        link = item.find_element(By.CSS_SELECTOR, "a")
+            for i, url in enumerate(links):
+                if url and not url.endswith('#'):
+                    print(f"📍 Found detail URL in item {i+1}: {url}")
                     
-                    url = link.get_attribute('href')
+                    # Navigate
+                    self.scraper.navigate_to(url)
+                    time.sleep(3)  # Give more time to load
                     
-                    if url and not url.endswith('#'):
-                        print(f"📍 Found detail URL in item {i+1}: {url}")
-                        
-                        # Navigate
-                        self.scraper.navigate_to(url)
-                        time.sleep(3)  # Give more time to load
-                        
-                        # Verify we're on a different page
-                        new_url = self.scraper.scraper.driver.current_url
-                        if new_url != self.scraper.current_url:
-                            print("✅ Successfully navigated to detail page")
-                            return True
-                        
-                except NoSuchElementException:
-                    continue
+                    # Verify we're on a different page
+                    new_url = self.driver.current_url
+                    if new_url != self.scraper.current_url:
+                        print("✅ Successfully navigated to detail page")
+                        return True
                     
             print("❌ Could not find valid links in items")
                 
@@ -262,7 +291,7 @@ class SeleniumTemplateCreator:
     def _clear_selection(self):
         """Clear any previous selection"""
         try:
-            self.scraper.scraper.driver.execute_script("""
+            self.driver.execute_script("""
                 const input = document.getElementById('selected_element_data');
                 if (input) {
                     input.value = '';
@@ -274,16 +303,13 @@ class SeleniumTemplateCreator:
     def _wait_for_selection(self, return_data: bool = False, timeout: int = 30):
         """Wait for user to select an element"""
         
-        for _ in range(timeout * 2):  # Check every 0.5s
-            time.sleep(0.5)
-            data = self.scraper.get_selected_element_data()
-            
-            if data:
-                if return_data:
-                    return data
-                else:
-                    return data.get('selector', '')
-                    
+        data = self.scraper.wait_for_selection(timeout)
+        if data:
+            if return_data:
+                return data
+            else:
+                return data.get('selector', '')
+                
         print("⏱️  Selection timeout")
         return None
         
@@ -300,10 +326,8 @@ class SeleniumTemplateCreator:
         
     def _process_item_selector(self, selector: str) -> str:
         """Process item selector to make it general"""
-        import re
-        
         # Remove nth-of-type
-        processed = re.sub(r':nth-of-type\(\d+\)', '', selector)
+        processed = remove_nth_of_type(selector)
         
         # Store for relative selectors
         self._current_item_selector = selector
@@ -314,16 +338,11 @@ class SeleniumTemplateCreator:
         """Make field selector relative to item"""
         
         # Split into parts
-        field_parts = field_selector.split(' > ')
-        item_parts = item_selector.split(' > ')
-        
-        # Find common prefix
-        common = 0
-        for i in range(min(len(field_parts), len(item_parts))):
-            if field_parts[i].strip() == item_parts[i].strip():
-                common = i + 1
-            else:
-                break
+        field_parts = split_child_combinators(field_selector)
+        item_parts = split_child_combinators(item_selector)
+        
+        # Find common prefix (commonprefix compares list items pairwise)
+        common = len(os.path.commonprefix([field_parts, item_parts]))
                 
         # Return relative part
         if common > 0:
@@ -339,8 +358,7 @@ class SeleniumTemplateCreator:
         
         try:
             # Count matching elements
-            elements = self.scraper.scraper.driver.find_elements(By.CSS_SELECTOR, selector)
-            count = len(elements)
+            count = count_matches(self.driver, selector)
             
             print(f"\n🔍 Found {count} matching elements")
             
@@ -371,8 +389,9 @@ class SeleniumTemplateCreator:
                 # Show sample of what was found
                 if count > 3:
                     print(f"   Showing first 3 of {count} items:")
-                    for i in range(min(3, count)):
-                        text = elements[i].text.strip()[:50]
+                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)[:3]
+                    for i, element in enumerate(elements):
+                        text = element.text.strip()[:50]
                         if text:
                             print(f"   {i+1}. {text}...")
                             
@@ -404,7 +423,7 @@ class SeleniumTemplateCreator:
                 print(f"   Adjusted selector: {container_selector}")
             
         try:
-            container = self.scraper.scraper.driver.find_element(By.CSS_SELECTOR, container_selector)
+            container = self.driver.find_element(By.CSS_SELECTOR, container_selector)
             
             # Common patterns for repeating items (ordered by likelihood)
             item_patterns = [
@@ -421,22 +440,20 @@ class SeleniumTemplateCreator:
             
             for pattern in item_patterns:
                 try:
-                    items = container.find_elements(By.CSS_SELECTOR, pattern)
-                    if len(items) > 1:
+                    if count_matches(self.driver, pattern, container) > 1:
                         # Found multiple items!
                         full_selector = f"{container_selector} > {pattern}"
                         
                         # Verify with full page
-                        all_items = self.scraper.scraper.driver.find_elements(
-                            By.CSS_SELECTOR, full_selector
-                        )
+                        total = count_matches(self.driver, full_selector)
                         
-                        if len(all_items) > 1:
-                            print(f"✅ Found {len(all_items)} repeating items: {pattern}")
+                        if total > 1:
+                            print(f"✅ Found {total} repeating items: {pattern}")
                             
                             # Show sample
-                            for i in range(min(3, len(all_items))):
-                                text = all_items[i].text.strip()[:50]
+                            sample_items = self.driver.find_elements(By.CSS_SELECTOR, full_selector)[:3]
+                            for i, item in enumerate(sample_items):
+                                text = item.text.strip()[:50]
                                 if text:
                                     print(f"   {i+1}. {text}...")
                                     
@@ -448,13 +465,10 @@ class SeleniumTemplateCreator:
                     continue
                     
             # Try direct children if no patterns work
-            children = container.find_elements(By.XPATH, "./*")
-            if len(children) > 1:
+            tag_counts = self.driver.execute_script(_CHILD_TAG_COUNTS_JS, container)
+            if sum(count for _, count in tag_counts) > 1:
                 # Check if children have same tag
-                tags = {}
-                for child in children:
-                    tag = child.tag_name
-                    tags[tag] = tags.get(tag, 0) + 1
+                tags = dict(tag_counts)
                     
                 # Find most common tag with multiple instances
                 for tag, count in sorted(tags.items(), key=lambda x: x[1], reverse=True):
@@ -463,7 +477,7 @@ class SeleniumTemplateCreator:
                         print(f"✅ Found {count} repeating <{tag}> elements")
                         
                         # Show sample
-                        sample_items = self.scraper.scraper.driver.find_elements(
+                        sample_items = self.driver.find_elements(
                             By.CSS_SELECTOR, full_selector
                         )[:3]
                         for i, item in enumerate(sample_items):
@@ -479,15 +493,12 @@ class SeleniumTemplateCreator:
             print("\n🔍 Searching for repeated structures...")
             
             # Try to find elements with same class pattern
-            all_elements = container.find_elements(By.XPATH, ".//*")
-            class_counts = {}
-            for elem in all_elements:
-                classes = elem.get_attribute('class')
-                if classes:
-                    # Look for meaningful classes
-                    for cls in classes.split():
-                        if cls and not cls.isdigit() and len(cls) > 2:
-                            class_counts[cls] = class_counts.get(cls, 0) + 1
+            class_counts = {
+                cls: count
+                for cls, count in self.driver.execute_script(_CLASS_COUNTS_JS, container)
+                # Look for meaningful classes
+                if not cls.isdigit() and len(cls) > 2
+            }
                             
             # Find classes that appear multiple times
             for cls, count in sorted(class_counts.items(), key=lambda x: x[1], reverse=True):
@@ -11,7 +11,6 @@ import asyncio
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urlparse
-from datetime import datetime
 
 # Engine-specific imports with fallbacks
 try:
@@ -39,8 +38,14 @@ from ..models import (
 )
 from ..handlers.cookie_handler import CookieHandler
 from ..extractors.pattern_extractor import PatternExtractor
+from ..utils.selectors import remove_nth_of_type
+from ..utils.input_validators import get_validated_selector
 from ..config import Config
 
+# Fields offered when picking interactively; the first two are the default
+COMMON_FIELDS = ("title", "link", "description", "author", "date", "price")
+DEFAULT_FIELDS = COMMON_FIELDS[:2]
+
 
 class UnifiedInteractiveScraper:
     """
@@ -69,8 +74,18 @@ class UnifiedInteractiveScraper:
         # State tracking
         self.current_url = None
         self.is_initialized = False
+        # Domains whose cookie banner was already accepted in this browser
+        self._cookies_handled = set()
+        # Event loop the Playwright browser is bound to, created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         self.logger.info(f"Unified scraper created with {engine} engine")
+    
+    def _run(self, coro):
+        """Run a coroutine on the scraper's long-lived event loop"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
 
     def initialize(self) -> bool:
         """Initialize the selected scraping engine"""
@@ -119,7 +134,7 @@ class UnifiedInteractiveScraper:
         try:
             self.scraper = PlaywrightScraper(headless=self.headless)
             # Initialize browser asynchronously
-            asyncio.run(self.scraper._init_browser())
+            self._run(self.scraper._init_browser())
             
             self.is_initialized = True
             self.logger.info("Playwright engine initialized successfully")
@@ -141,8 +156,14 @@ class UnifiedInteractiveScraper:
             self.logger.error(f"Requests initialization failed: {e}")
             return False
 
-    def navigate_to(self, url: str) -> bool:
-        """Navigate to URL with engine-specific handling"""
+    def navigate_to(self, url: str, wait_until: str = "domcontentloaded") -> bool:
+        """
+        Navigate to URL with engine-specific handling.
+        
+        Template creation only needs a parsed DOM to click on, so Selenium
+        stops waiting at DOMContentLoaded by default instead of the full load.
+        Playwright picks its own wait condition in navigate_to_smart.
+        """
         if not self.is_initialized:
             self.logger.error("Scraper not initialized")
             return False
@@ -151,9 +172,9 @@ class UnifiedInteractiveScraper:
         
         try:
             if self.engine == 'selenium':
-                success = self.scraper.navigate_to(url)
+                success = self.scraper.navigate_to(url, wait_until=wait_until)
             elif self.engine == 'playwright':
-                success = asyncio.run(self.scraper.navigate_to_smart(url))
+                success = self._run(self.scraper.navigate_to_smart(url))
             else:  # requests
                 # For requests, validate and fetch the page
                 if self._validate_url(url):
@@ -187,12 +208,23 @@ class UnifiedInteractiveScraper:
         if self.engine == 'requests':
             return True  # No cookies to handle
         
+        domain = urlparse(self.current_url).netloc if self.current_url else None
+        if not custom_selectors and domain in self._cookies_handled:
+            self.logger.debug(f"Cookie banner already handled for {domain}")
+            return True
+        
         try:
             if self.engine == 'selenium' and self.cookie_handler:
-                result = self.cookie_handler.accept_cookies(custom_selectors)
+                if not custom_selectors and self.cookie_handler.consent_already_given():
+                    self.logger.info("Consent cookie already set, skipping cookie banner scan")
+                    result = True
+                else:
+                    result = self.cookie_handler.accept_cookies(custom_selectors)
+                if result and domain:
+                    self._cookies_handled.add(domain)
                 return bool(result)
             elif self.engine == 'playwright':
-                result = asyncio.run(self.scraper.handle_cookies(custom_selectors))
+                result = self._run(self.scraper.handle_cookies(custom_selectors))
                 return bool(result)
             
         except Exception as e:
@@ -200,7 +232,9 @@ class UnifiedInteractiveScraper:
         
         return False
 
-    def inject_interactive_selector(self, context_message: str = "Select elements") -> bool:
+    def inject_interactive_selector(self, context_message: str = "Select elements",
+                                    labels: Optional[List[str]] = None,
+                                    persistent: bool = False) -> bool:
         """Inject interactive selector for element selection"""
         if self.engine not in ['selenium', 'playwright']:
             self.logger.warning(f"Interactive selection not supported for {self.engine} engine")
@@ -209,7 +243,7 @@ class UnifiedInteractiveScraper:
         try:
             self.logger.info(f"Injecting interactive selector with message: '{context_message}'")
             if self.engine == 'selenium':
-                result = self.scraper.inject_interactive_selector(context_message)
+                result = self.scraper.inject_interactive_selector(context_message, labels, persistent)
                 if not result:
                     self.logger.error("Failed to inject interactive selector in BaseScraper")
                 return result
@@ -232,18 +266,8 @@ class UnifiedInteractiveScraper:
         
         try:
             if self.engine == 'selenium':
-                data = self.scraper.get_selected_element_data()
-                
-                # Clear the selection after reading to prevent auto-fill
-                if data and not data.get('done'):
-                    self.scraper.driver.execute_script("""
-                        const input = document.getElementById('selected_element_data');
-                        if (input) {
-                            input.value = '';
-                        }
-                    """)
-                
-                return data
+                # The read also clears the selection, preventing auto-fill
+                return self.scraper.get_selected_element_data()
             else:  # playwright
                 # Implement for Playwright
                 return None
@@ -252,6 +276,43 @@ class UnifiedInteractiveScraper:
             self.logger.error(f"Failed to get selected element data: {e}")
             return None
 
+    def wait_for_selection(self, timeout: float = 15) -> Optional[Dict[str, Any]]:
+        """Block until an element is selected, the user clicks Done, or timeout"""
+        if self.engine != 'selenium':
+            return None
+        
+        return self.scraper.wait_for_selected_element_data(timeout)
+
+    def run_multi_field_picker(self, field_names: List[str], context_message: str = "Select fields",
+                               timeout: float = 300) -> Dict[str, str]:
+        """Pick selectors for all fields in one overlay session and one round-trip"""
+        if self.engine != 'selenium':
+            return {}
+        
+        return self.scraper.pick_fields(field_names, context_message, timeout)
+
+    def count_links_in_items(self, item_selector: str, link_selector: str) -> Optional[Tuple[int, int]]:
+        """
+        Count how many repeating items contain a detail link, in one script call.
+        
+        Returns:
+            (items with a link, total items), or None if it can't be checked
+        """
+        if self.engine != 'selenium' or not item_selector or not link_selector:
+            return None
+        
+        try:
+            return tuple(self.scraper.driver.execute_script(
+                "const items = document.querySelectorAll(arguments[0]);"
+                "let withLink = 0;"
+                "for (const item of items) { if (item.querySelector(arguments[1])) withLink++; }"
+                "return [withLink, items.length];",
+                item_selector, link_selector
+            ))
+        except Exception as e:
+            self.logger.debug(f"Could not count detail links: {e}")
+            return None
+
     def cleanup_interactive_selector(self):
         """Clean up interactive selector overlay"""
         if self.engine not in ['selenium', 'playwright']:
@@ -280,7 +341,7 @@ class UnifiedInteractiveScraper:
             if self.engine == 'selenium':
                 self.scraper.driver.execute_script(cleanup_js)
             else:  # playwright
-                asyncio.run(self.scraper.page.evaluate(cleanup_js))
+                self._run(self.scraper.page.evaluate(cleanup_js))
                 
             self.logger.info("Interactive selector cleaned up")
             
@@ -302,9 +363,9 @@ class UnifiedInteractiveScraper:
                     
             elif self.engine == 'playwright':
                 if attribute == 'text':
-                    return asyncio.run(self.scraper.get_text(selector))
+                    return self._run(self.scraper.get_text(selector))
                 else:
-                    return asyncio.run(self.scraper.get_attribute(selector, attribute))
+                    return self._run(self.scraper.get_attribute(selector, attribute))
                     
             else:  # requests
                 # Use requests scraper
@@ -325,7 +386,7 @@ class UnifiedInteractiveScraper:
                 return [elem.text for elem in elements]
                 
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.get_texts(selector))
+                return self._run(self.scraper.get_texts(selector))
                 
             else:  # requests
                 return self.scraper.extract_multiple_texts(selector)
@@ -346,7 +407,7 @@ class UnifiedInteractiveScraper:
                 return True
                 
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.click(selector))
+                return self._run(self.scraper.click(selector))
                 
         except Exception as e:
             self.logger.error(f"Click failed for {selector}: {e}")
@@ -376,7 +437,7 @@ class UnifiedInteractiveScraper:
                 return scrolls
                 
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.scroll_to_bottom(pause_time))
+                return self._run(self.scraper.scroll_to_bottom(pause_time))
                 
         except Exception as e:
             self.logger.error(f"Scroll failed: {e}")
@@ -397,7 +458,7 @@ class UnifiedInteractiveScraper:
                 return True
                 
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.wait_for_selector(selector, timeout))
+                return self._run(self.scraper.wait_for_selector(selector, timeout))
                 
         except Exception as e:
             self.logger.debug(f"Wait failed for {selector}: {e}")
@@ -412,7 +473,7 @@ class UnifiedInteractiveScraper:
             if self.engine == 'selenium':
                 return self.scraper.driver.page_source
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.get_page_content())
+                return self._run(self.scraper.get_page_content())
             else:  # requests
                 return self.scraper.get_page_source() if hasattr(self.scraper, 'get_page_source') else ""
                 
@@ -433,7 +494,7 @@ class UnifiedInteractiveScraper:
                 self.scraper.driver.save_screenshot(path)
                 return path
             elif self.engine == 'playwright':
-                return asyncio.run(self.scraper.take_screenshot(path))
+                return self._run(self.scraper.take_screenshot(path))
                 
         except Exception as e:
             self.logger.error(f"Screenshot failed: {e}")
@@ -454,8 +515,7 @@ class UnifiedInteractiveScraper:
                 scraping_type=scraping_type,
                 list_page_rules=TemplateRules() if scraping_type != ScrapingType.SINGLE_PAGE else None,
                 detail_page_rules=TemplateRules(),
-                version="2.1",
-                created_at=datetime.now().isoformat()
+                version="2.1"
             )
             
             # Configure rules based on scraping type
@@ -475,31 +535,47 @@ class UnifiedInteractiveScraper:
 
     def _configure_list_rules_interactive(self, template: ScrapingTemplate) -> bool:
         """Configure list rules using interactive selection"""
-        if self.engine == 'requests':
-            return self._configure_list_rules_manual(template)
+        return self._configure_list_rules(template, interactive=self.engine != 'requests')
+
+    def _configure_list_rules_manual(self, template: ScrapingTemplate) -> bool:
+        """Configure list rules manually"""
+        return self._configure_list_rules(template, interactive=False)
+
+    def _configure_list_rules(self, template: ScrapingTemplate, interactive: bool) -> bool:
+        """
+        Configure repeating items, fields and detail links for the list page.
         
+        Args:
+            template: Template whose list_page_rules are filled in
+            interactive: Offer in-page selection instead of typed selectors only
+            
+        Returns:
+            True if a repeating item selector was configured
+        """
         rules = template.list_page_rules
         
         # Get repeating item selector
-        print("\n🎯 Identify Repeating Items")
-        print("What selector represents each item in the list?")
-        
-        manual_selector = input("Enter CSS selector (or press Enter for interactive): ").strip()
-        
-        if manual_selector:
-            rules.repeating_item_selector = manual_selector
+        if interactive:
+            print("\n🎯 Identify Repeating Items")
+            print("What selector represents each item in the list?")
+            selector = get_validated_selector("Enter CSS selector (or press Enter for interactive): ")
         else:
-            # Interactive selection
-            if not self._detect_repeating_items(rules):
-                return False
+            selector = get_validated_selector("CSS selector for repeating items: ")
+        
+        if selector:
+            rules.repeating_item_selector = selector
+        elif not interactive or not self._detect_repeating_items(rules):
+            return False
         
         # Configure fields
-        fields = self._configure_fields_interactive("list item")
-        rules.fields = fields
+        if interactive:
+            rules.fields = self._configure_fields_interactive("list item")
+        else:
+            rules.fields = self._configure_fields_manual("list item")
         
         # Set profile link for list+detail
         if template.scraping_type == ScrapingType.LIST_DETAIL:
-            link_selector = input("CSS selector for detail page links: ").strip()
+            link_selector = get_validated_selector("CSS selector for detail page links: ")
             if link_selector:
                 rules.profile_link_selector = link_selector
         
@@ -515,13 +591,8 @@ class UnifiedInteractiveScraper:
             self.cleanup_interactive_selector()
             input("Press Enter when ready...")
         
-        # Configure fields
-        if self.engine == 'requests':
-            fields = self._configure_fields_manual("detail page")
-        else:
-            fields = self._configure_fields_interactive("detail page")
-        
-        rules.fields = fields
+        # Configure fields (falls back to typed selectors for requests)
+        rules.fields = self._configure_fields_interactive("detail page")
         return True
 
     def _detect_repeating_items(self, rules: TemplateRules) -> bool:
@@ -535,27 +606,20 @@ class UnifiedInteractiveScraper:
             return False
         
         # Wait for selection
-        for _ in range(30):
-            time.sleep(0.5)
-            data = self.get_selected_element_data()
-            if data:
-                selector = data.get('selector', '')
-                if selector:
-                    # Process selector to make it general
-                    processed_selector = self._process_selector_for_repetition(selector)
-                    rules.repeating_item_selector = processed_selector
-                    print(f"✅ Using selector: {processed_selector}")
-                    self.cleanup_interactive_selector()
-                    return True
+        if selector := (self.wait_for_selection() or {}).get('selector'):
+            # Process selector to make it general
+            processed_selector = self._process_selector_for_repetition(selector)
+            rules.repeating_item_selector = processed_selector
+            print(f"✅ Using selector: {processed_selector}")
+            self.cleanup_interactive_selector()
+            return True
         
         return False
 
     def _process_selector_for_repetition(self, selector: str) -> str:
         """Process selector to make it work for all repeating items"""
-        import re
-        
         # Remove nth-of-type selectors
-        processed = re.sub(r':nth[-‐]of[-‐]type\(\d+\)', '', selector)
+        processed = remove_nth_of_type(selector)
         
         # If selector becomes empty or too generic, ask user
         if not processed.strip() or processed.strip() in ['div', 'span', '']:
@@ -575,27 +639,21 @@ class UnifiedInteractiveScraper:
         
         print(f"\nConfigure fields for {context}:")
         
-        common_fields = ["title", "link", "description", "author", "date", "price"]
+        # Only walk through the fields the user actually wants
+        print(f"Common fields: {', '.join(COMMON_FIELDS)} (any other name works too)")
+        answer = input(f"Which to capture? (comma-separated, Enter for {', '.join(DEFAULT_FIELDS)}): ")
+        requested = [name.strip() for name in answer.split(',') if name.strip()]
+        selected_fields = list(dict.fromkeys(requested)) if requested else list(DEFAULT_FIELDS)
         
-        for field_name in common_fields:
-            print(f"\n🔍 Select {field_name} (or skip)")
-            
-            if self.inject_interactive_selector(f"Select {field_name}"):
-                # Wait for selection
-                for _ in range(30):
-                    time.sleep(0.5)
-                    data = self.get_selected_element_data()
-                    if data:
-                        if data.get('done'):
-                            break
-                        selector = data.get('selector', '')
-                        if selector:
-                            fields[field_name] = selector
-                            print(f"✅ {field_name}: {selector}")
-                        break
-                
-                if data and data.get('done'):
-                    break
+        # One overlay walks through the selected fields; Skip or Done in the page
+        print(f"\n🔍 Select {', '.join(selected_fields)} in the browser (Skip to leave one out)")
+        picks = self.run_multi_field_picker(selected_fields, f"Select fields for {context}")
+        self.cleanup_interactive_selector()
+        
+        for field_name, selector in picks.items():
+            if selector:
+                fields[field_name] = selector
+                print(f"✅ {field_name}: {selector}")
         
         # Custom fields
         while True:
@@ -604,15 +662,9 @@ class UnifiedInteractiveScraper:
                 break
             
             if self.inject_interactive_selector(f"Select {custom_name}"):
-                for _ in range(30):
-                    time.sleep(0.5)
-                    data = self.get_selected_element_data()
-                    if data:
-                        selector = data.get('selector', '')
-                        if selector:
-                            fields[custom_name] = selector
-                            print(f"✅ {custom_name}: {selector}")
-                        break
+                if selector := (self.wait_for_selection() or {}).get('selector'):
+                    fields[custom_name] = selector
+                    print(f"✅ {custom_name}: {selector}")
         
         self.cleanup_interactive_selector()
         return fields
@@ -627,34 +679,12 @@ class UnifiedInteractiveScraper:
             if not field_name:
                 break
             
-            selector = input(f"CSS selector for {field_name}: ").strip()
+            selector = get_validated_selector(f"CSS selector for {field_name}: ")
             if selector:
                 fields[field_name] = selector
         
         return fields
 
-    def _configure_list_rules_manual(self, template: ScrapingTemplate) -> bool:
-        """Configure list rules manually"""
-        rules = template.list_page_rules
-        
-        # Repeating item selector
-        selector = input("CSS selector for repeating items: ").strip()
-        if not selector:
-            return False
-        rules.repeating_item_selector = selector
-        
-        # Fields
-        fields = self._configure_fields_manual("list item")
-        rules.fields = fields
-        
-        # Profile link
-        if template.scraping_type == ScrapingType.LIST_DETAIL:
-            link_selector = input("CSS selector for detail links: ").strip()
-            if link_selector:
-                rules.profile_link_selector = link_selector
-        
-        return True
-
     def close(self):
         """Clean up and close scraper"""
         try:
@@ -662,22 +692,11 @@ class UnifiedInteractiveScraper:
                 if self.engine == 'selenium':
                     self.scraper.driver.quit()
                 elif self.engine == 'playwright':
-                    try:
-                        # Try to get the existing event loop
-                        loop = asyncio.get_event_loop()
-                        if loop.is_closed():
-                            # If the loop is closed, create a new one
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        loop.run_until_complete(self.scraper.close())
-                    except RuntimeError as e:
-                        # Event loop is closed, try synchronous cleanup
-                        if "Event loop is closed" in str(e):
-                            self.logger.warning("Event loop closed, attempting direct cleanup")
-                            # Just log the error since we can't do async cleanup
-                        else:
-                            raise
+                    self._run(self.scraper.close())
                 # Requests scraper doesn't need closing
+            
+            if self._loop and not self._loop.is_closed():
+                self._loop.close()
                 
             self.is_initialized = False
             self.logger.info("Scraper closed successfully")
@@ -1,7 +1,7 @@
 # src/scraper/exporters/__init__.py
 """Data export modules"""
 
-from .base_exporter import BaseExporter
+from .base_exporter import BaseExporter, ExportStream
 from .json_exporter import JsonExporter
 from .csv_exporter import CsvExporter
 from .excel_exporter import ExcelExporter
@@ -9,6 +9,7 @@ from .html_exporter import HtmlExporter
 
 __all__ = [
     "BaseExporter",
+    "ExportStream",
     "JsonExporter",
     "CsvExporter",
     "ExcelExporter",
@@ -8,9 +8,44 @@ import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from ..config import Config
-from ..models import ScrapeResult, ExportFormat
+from ..models import ScrapeResult, ScrapedItem, ExportFormat
+
+
+class ExportStream(ABC):
+    """An export file written one item at a time, as items are scraped."""
+
+    def __init__(self, filepath: Path):
+        """
+        Initializes the stream.
+
+        Args:
+            filepath: The file the items are written to.
+        """
+        self.filepath = filepath
+        self.count = 0
+
+    @abstractmethod
+    def append(self, item: ScrapedItem):
+        """
+        Writes one item to the export file.
+
+        Args:
+            item: The scraped item to write.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Flushes and closes the export file."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class BaseExporter(ABC):
@@ -46,6 +81,22 @@ class BaseExporter(ABC):
         filename = f"{template_name}_{timestamp}.{self.export_format.value}"
         return self.output_dir / filename
 
+    def open_stream(self, template_name: str, columns: List[str]) -> Optional[ExportStream]:
+        """
+        Opens an export file that items can be appended to one at a time.
+
+        Formats that need the whole result up front do not override this.
+
+        Args:
+            template_name: The name of the template used for scraping.
+            columns: Every column the template can produce, for formats
+                     with a fixed header.
+
+        Returns:
+            The open stream, or None if the format cannot be streamed.
+        """
+        return None
+
     @abstractmethod
     def export(self, data: ScrapeResult) -> Optional[Path]:
         """
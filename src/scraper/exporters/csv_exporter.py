@@ -4,14 +4,37 @@ Concrete implementation of BaseExporter for exporting data to CSV format.
 Handles flattening of nested data structures.
 """
 
+import csv
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 import pandas as pd
 
-from .base_exporter import BaseExporter
-from ..models import ScrapeResult, ExportFormat
+from .base_exporter import BaseExporter, ExportStream
+from ..config import Config
+from ..models import ScrapeResult, ScrapedItem, ExportFormat
+
+
+class CsvStream(ExportStream):
+    """Writes flattened rows under a header fixed when the stream opens."""
+
+    def __init__(self, filepath: Path, columns: List[str],
+                 flatten: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]):
+        super().__init__(filepath)
+        self._flatten = flatten
+        self._file = open(filepath, 'w', newline='', encoding=Config.EXPORT_FORMATS['csv']['encoding'])
+        # Values outside the template's columns have no place in a fixed header
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def append(self, item: ScrapedItem):
+        self._writer.writerows(self._flatten([item.to_dict()]))
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
 
 
 class CsvExporter(BaseExporter):
@@ -48,6 +71,21 @@ class CsvExporter(BaseExporter):
             rows.append(row)
         return rows
 
+    def open_stream(self, template_name: str, columns: List[str]) -> Optional[ExportStream]:
+        """
+        Opens a CSV file with the template's columns as its header.
+
+        Args:
+            template_name: The name of the template used for scraping.
+            columns: Every column the template can produce.
+
+        Returns:
+            The open stream.
+        """
+        filepath = self._get_filepath(template_name)
+        self.logger.info(f"Streaming data to CSV file: {filepath}")
+        return CsvStream(filepath, columns, self._flatten_data)
+
     def export(self, data: ScrapeResult) -> Optional[Path]:
         """
         Flattens the scraped data and saves it to a CSV file.
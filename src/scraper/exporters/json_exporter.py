@@ -3,13 +3,29 @@
 Concrete implementation of BaseExporter for exporting data to JSON format.
 """
 
-import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 from dataclasses import asdict
 
-from .base_exporter import BaseExporter
-from ..models import ScrapeResult, ExportFormat
+from .base_exporter import BaseExporter, ExportStream
+from ..models import ScrapeResult, ScrapedItem, ExportFormat
+from ..utils.file_io import write_json, dump_json_bytes
+
+
+class JsonLinesStream(ExportStream):
+    """Writes one compact JSON document per line (JSON Lines)."""
+
+    def __init__(self, filepath: Path):
+        super().__init__(filepath)
+        self._file = open(filepath, 'wb')
+
+    def append(self, item: ScrapedItem):
+        self._file.write(dump_json_bytes(item.to_dict(), indent=None) + b'\n')
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
 
 
 class JsonExporter(BaseExporter):
@@ -19,6 +35,21 @@ class JsonExporter(BaseExporter):
         """Initializes the JsonExporter."""
         super().__init__(ExportFormat.JSON, output_dir)
 
+    def open_stream(self, template_name: str, columns: List[str]) -> Optional[ExportStream]:
+        """
+        Opens a JSON Lines file, since a JSON document can't be appended to.
+
+        Args:
+            template_name: The name of the template used for scraping.
+            columns: Unused; every item keeps all of its fields.
+
+        Returns:
+            The open stream.
+        """
+        filepath = self._get_filepath(template_name).with_suffix('.jsonl')
+        self.logger.info(f"Streaming data to JSON Lines file: {filepath}")
+        return JsonLinesStream(filepath)
+
     def export(self, data: ScrapeResult) -> Optional[Path]:
         """
         Serializes the ScrapeResult to a JSON file with pretty-printing.
@@ -39,8 +70,7 @@ class JsonExporter(BaseExporter):
             # Use the to_dict method from the data models for clean serialization
             export_data = data.to_dict()
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            write_json(filepath, export_data)
 
             self.logger.info(f"Successfully exported {len(data.items)} items to {filepath}")
             return filepath
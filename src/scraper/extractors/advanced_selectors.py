@@ -18,6 +18,15 @@ try:
 except ImportError:
     AI_AVAILABLE = False
 
+# Every ancestor below <html>, nearest first, in one WebDriver call
+_ANCESTORS_JS = """
+const ancestors = [];
+for (let el = arguments[0].parentElement; el && el.tagName.toLowerCase() !== 'html'; el = el.parentElement) {
+    ancestors.push(el);
+}
+return ancestors;
+"""
+
 
 @dataclass
 class ProximityContext:
@@ -306,18 +315,7 @@ class AdvancedSelectors:
                 return anchor_element.find_elements(By.XPATH, "./*")
             
             elif relationship == "ancestor":
-                ancestors = []
-                current = anchor_element
-                while True:
-                    try:
-                        parent = current.find_element(By.XPATH, "..")
-                        if parent.tag_name == "html":
-                            break
-                        ancestors.append(parent)
-                        current = parent
-                    except:
-                        break
-                return ancestors
+                return self.driver.execute_script(_ANCESTORS_JS, anchor_element) or []
             
             else:
                 self.logger.warning(f"Unknown relationship type: {relationship}")
@@ -411,7 +409,7 @@ class AdvancedSelectors:
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings"""
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
         
         if len(s2) == 0:
             return len(s1)
@@ -10,6 +10,16 @@ from selenium.common.exceptions import NoSuchElementException, StaleElementRefer
 
 from ..utils.selectors import normalize_selector
 
+# Element -> enclosing <a> -> [href, text, title] in one WebDriver call;
+# null when the element is missing, [] when it is not inside a link
+_LINK_INFO_JS = """
+const el = (arguments[1] || document).querySelector(arguments[0]);
+if (!el) return null;
+const a = el.closest('a');
+if (!a) return [];
+return [a.hasAttribute('href') ? a.href : null, (el.innerText || '').trim(), a.title || ''];
+"""
+
 
 class ElementExtractor:
     """Extract data from various HTML elements"""
@@ -97,24 +107,16 @@ class ElementExtractor:
         """
         try:
             selector = normalize_selector(selector)
-            search_context = parent or self.driver
-            element = search_context.find_element(By.CSS_SELECTOR, selector)
-
-            # Traverse up to find the parent 'a' tag if the selected element isn't one
-            link_element = element
-            while link_element.tag_name.lower() != 'a' and link_element.tag_name.lower() != 'body':
-                try:
-                    # Use XPath to get the parent element
-                    link_element = link_element.find_element(By.XPATH, '..')
-                except NoSuchElementException:
-                    self.logger.debug(f"Could not find parent for element with selector {selector}")
-                    return None
-
-            if link_element.tag_name.lower() != 'a':
-                 self.logger.debug(f"No parent 'a' tag found for selector: {selector}")
-                 return None
-
-            href = link_element.get_attribute("href")
+            # Resolve the element, its enclosing 'a' tag and the link fields in one round trip
+            link = self.driver.execute_script(_LINK_INFO_JS, selector, parent)
+            if link is None:
+                self.logger.debug(f"Link not found: {selector}")
+                return None
+            if not link:
+                self.logger.debug(f"No parent 'a' tag found for selector: {selector}")
+                return None
+
+            href, text, title = link
             if absolute and href and not href.startswith(('http://', 'https://', 'mailto:', 'tel:')):
                 # Convert relative URLs to absolute
                 from urllib.parse import urljoin
@@ -123,8 +125,8 @@ class ElementExtractor:
 
             return {
                 "href": href,
-                "text": element.text.strip(), # Keep original text
-                "title": link_element.get_attribute("title") or ""
+                "text": text, # Keep original text
+                "title": title
             }
 
         except NoSuchElementException:
@@ -5,6 +5,7 @@ advanced selectors, and fallback strategies.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -15,6 +16,45 @@ from .pattern_extractor import PatternExtractor
 from .advanced_selectors import AdvancedSelectors, FallbackSelector
 from ..utils.selectors import normalize_selector
 
+# Field-name keywords that hint at a pattern type, checked in order
+_PATTERN_KEYWORDS = {
+    'email': ('email', 'mail', 'contact'),
+    'phone': ('phone', 'tel', 'mobile', 'cell'),
+    'date': ('date', 'posted', 'updated', 'created'),
+    'price': ('price', 'cost', 'fee', 'amount'),
+    'address': ('address', 'location', 'street'),
+    'zip_code': ('zip', 'postal'),
+    'education': ('education', 'degree', 'university', 'college'),
+    'bar_admission': ('bar', 'admission', 'license'),
+}
+
+# Reads the visible text of every field in one WebDriver round trip.
+# Unrendered elements and selectors querySelector rejects are left out,
+# so the caller's per-field path decides those exactly as before.
+_READ_FIELDS_JS = """
+const [fields, root] = arguments;
+const scope = root || document;
+const data = {};
+for (const [name, selector] of fields) {
+    let el = null;
+    try { el = scope.querySelector(selector); } catch (e) { continue; }
+    if (!el || !el.getClientRects().length) continue;
+    const text = (el.innerText || '').trim();
+    if (text) data[name] = text;
+}
+return data;
+"""
+
+
+@lru_cache(maxsize=1024)
+def _pattern_type_for(field_name: str) -> Optional[str]:
+    """Guess a pattern type from keywords in the field name"""
+    field_lower = field_name.lower()
+    for pattern_type, keywords in _PATTERN_KEYWORDS.items():
+        if any(keyword in field_lower for keyword in keywords):
+            return pattern_type
+    return None
+
 
 class EnhancedElementExtractor(ElementExtractor):
     """Enhanced extractor with pattern matching and advanced selection strategies"""
@@ -29,7 +69,8 @@ class EnhancedElementExtractor(ElementExtractor):
     
     def extract_smart(self, field_name: str, selector: str = None, 
                      pattern_type: str = None, fallback_strategies: List[Dict] = None,
-                     parent: Optional[WebElement] = None) -> Optional[Any]:
+                     parent: Optional[WebElement] = None,
+                     context_text: Optional[str] = None) -> Optional[Any]:
         """
         Smart extraction using multiple strategies
         
@@ -39,6 +80,7 @@ class EnhancedElementExtractor(ElementExtractor):
             pattern_type: Pattern type for extraction (email, phone, etc.)
             fallback_strategies: List of fallback strategies
             parent: Parent element to search within
+            context_text: Text to run patterns over, if already read
             
         Returns:
             Extracted value or None
@@ -52,8 +94,8 @@ class EnhancedElementExtractor(ElementExtractor):
         # Try pattern extraction if no value found
         if not value and pattern_type:
             # Get broader context for pattern matching
-            context_element = parent or self.driver.find_element(By.TAG_NAME, "body")
-            context_text = context_element.text
+            if context_text is None:
+                context_text = self._context_text(parent)
             
             # Use field name as context
             value = self.pattern_extractor.extract(
@@ -93,19 +135,38 @@ class EnhancedElementExtractor(ElementExtractor):
         results = {}
         patterns = patterns or {}
         
+        # Read every selector in one round trip; only misses take the slow path
+        fields = [(name, normalize_selector(selector)) for name, selector in selectors.items() if selector]
+        try:
+            found = self.driver.execute_script(_READ_FIELDS_JS, fields, parent) or {}
+            batched = True
+        except Exception as e:
+            self.logger.debug(f"Batched field read failed, extracting per field: {e}")
+            found, batched = {}, False
+        
+        context_text = None
         for field_name, selector in selectors.items():
+            if found.get(field_name):
+                results[field_name] = found[field_name]
+                continue
+            
             # Determine pattern type
             pattern_type = patterns.get(field_name)
             if not pattern_type:
                 # Auto-detect pattern type from field name
                 pattern_type = self._guess_pattern_type(field_name)
             
-            # Extract with smart strategy
+            # The page text is read once and shared by every pattern fallback
+            if pattern_type and context_text is None:
+                context_text = self._context_text(parent)
+            
+            # Extract with smart strategy; a selector the batch missed won't match now
             value = self.extract_smart(
                 field_name,
-                selector,
+                None if batched else selector,
                 pattern_type,
-                parent=parent
+                parent=parent,
+                context_text=context_text
             )
             
             if value:
@@ -113,6 +174,10 @@ class EnhancedElementExtractor(ElementExtractor):
         
         return results
     
+    def _context_text(self, parent: Optional[WebElement] = None) -> str:
+        """Visible text of the parent element, or of the whole page"""
+        return (parent or self.driver.find_element(By.TAG_NAME, "body")).text
+    
     def extract_structured_data_enhanced(self, container_selector: str,
                                        field_map: Dict[str, str],
                                        use_patterns: bool = True,
@@ -296,24 +361,7 @@ class EnhancedElementExtractor(ElementExtractor):
     # Helper methods
     def _guess_pattern_type(self, field_name: str) -> Optional[str]:
         """Guess pattern type from field name"""
-        field_lower = field_name.lower()
-        
-        patterns = {
-            'email': ['email', 'mail', 'contact'],
-            'phone': ['phone', 'tel', 'mobile', 'cell'],
-            'date': ['date', 'posted', 'updated', 'created'],
-            'price': ['price', 'cost', 'fee', 'amount'],
-            'address': ['address', 'location', 'street'],
-            'zip_code': ['zip', 'postal'],
-            'education': ['education', 'degree', 'university', 'college'],
-            'bar_admission': ['bar', 'admission', 'license']
-        }
-        
-        for pattern_type, keywords in patterns.items():
-            if any(keyword in field_lower for keyword in keywords):
-                return pattern_type
-        
-        return None
+        return _pattern_type_for(field_name)
     
     def _matches_field_name(self, field_name: str, label_text: str) -> bool:
         """Check if label text matches field name"""
@@ -10,6 +10,9 @@ from typing import Dict, Any
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 
+# Meta names like 'og:title' or 'twitter.card' become 'og_title', 'twitter_card'
+_META_KEY_TRANSLATION = str.maketrans(':.', '__')
+
 
 class MetadataExtractor:
     """Extracts metadata from the current page."""
@@ -50,7 +53,7 @@ class MetadataExtractor:
                     content = tag.get_attribute("content")
                     if name and content:
                         # Sanitize key for easier use
-                        meta_key = f"meta_{name.replace(':', '_').replace('.', '_')}"
+                        meta_key = f"meta_{name.translate(_META_KEY_TRANSLATION)}"
                         metadata[meta_key] = content
                 except Exception:
                     # Ignore individual broken meta tags
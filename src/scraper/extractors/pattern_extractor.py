@@ -5,9 +5,30 @@ Pattern-based extraction for common data types like emails, phones, addresses, e
 
 import re
 import logging
-from typing import Dict, List, Optional, Any, Pattern
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Pattern, Iterable, Set, Tuple
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+_NON_DIGITS = re.compile(r'\D')
+
+# Currency symbol and thousands separators dropped before parsing a price
+_PRICE_STRIP = str.maketrans('', '', '$,')
+
+# Flags that can be scoped to one alternative of a combined pattern
+_SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+
+@lru_cache(maxsize=512)
+def _compiled(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a regex once per process, shared by every extractor instance"""
+    return re.compile(pattern, flags)
+
 
 @dataclass
 class PatternConfig:
@@ -24,32 +45,40 @@ class PatternExtractor:
     def __init__(self):
         self.logger = logging.getLogger(f'{__name__}.PatternExtractor')
         self.patterns = self._initialize_patterns()
+        # Compiled Hyperscan databases keyed by the pattern names they cover
+        self._hs_databases: Dict[Tuple[str, ...], Any] = {}
+        # Combined single-scan patterns keyed by the pattern names they cover
+        self._combined_patterns: Dict[Tuple[str, ...], Optional[Pattern]] = {}
+        # The current template's patterns and their combined scan, built by prime()
+        self._primed: Tuple[frozenset, Optional[Pattern]] = (frozenset(), None)
+        # Context checks keyed by (pattern type, context); templates repeat the same context per page
+        self._context_matches: Dict[Tuple[str, str], bool] = {}
     
     def _initialize_patterns(self) -> Dict[str, PatternConfig]:
         """Initialize common extraction patterns"""
         return {
             'email': PatternConfig(
-                pattern=re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+                pattern=_compiled(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
                 context_keywords=['email', 'contact', 'mail', '@'],
                 validation_func=self._validate_email
             ),
             'phone': PatternConfig(
-                pattern=re.compile(r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'),
+                pattern=_compiled(r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'),
                 context_keywords=['phone', 'tel', 'call', 'mobile', 'cell', 'direct', 'office'],
                 post_process_func=self._format_phone
             ),
             'phone_international': PatternConfig(
-                pattern=re.compile(r'\+?[1-9]\d{0,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+                pattern=_compiled(r'\+?[1-9]\d{0,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
                 context_keywords=['phone', 'tel', 'international'],
                 validation_func=self._validate_international_phone
             ),
             'zip_code': PatternConfig(
-                pattern=re.compile(r'\b\d{5}(?:-\d{4})?\b'),
+                pattern=_compiled(r'\b\d{5}(?:-\d{4})?\b'),
                 context_keywords=['zip', 'postal', 'code'],
                 validation_func=lambda x: len(x.replace('-', '')) in [5, 9]
             ),
             'education': PatternConfig(
-                pattern=re.compile(
+                pattern=_compiled(
                     r'(?:J\.?D\.?|LL\.?M\.?|B\.?A\.?|B\.?S\.?|M\.?A\.?|M\.?S\.?|Ph\.?D\.?|M\.?B\.?A\.?|'
                     r'JD|LLM|BA|BS|MA|MS|PhD|MBA)'
                     r'[^,\n]*?(?:,\s*(?:19|20)\d{2})?',
@@ -59,7 +88,7 @@ class PatternExtractor:
                 post_process_func=self._clean_education
             ),
             'bar_admission': PatternConfig(
-                pattern=re.compile(
+                pattern=_compiled(
                     r'(?:Admitted to|Member of|Licensed in|Bar Admission[s]?)[^.]+?'
                     r'(?:Bar|Court|Practice)[^.]*\.?',
                     re.IGNORECASE
@@ -67,7 +96,7 @@ class PatternExtractor:
                 context_keywords=['bar', 'admission', 'licensed', 'admitted', 'court', 'practice']
             ),
             'social_media': PatternConfig(
-                pattern=re.compile(
+                pattern=_compiled(
                     r'(?:(?:https?://)?(?:www\.)?'
                     r'(?:linkedin\.com/in/|twitter\.com/|facebook\.com/)'
                     r'[A-Za-z0-9_.-]+)',
@@ -77,12 +106,12 @@ class PatternExtractor:
                 post_process_func=self._normalize_social_url
             ),
             'price': PatternConfig(
-                pattern=re.compile(r'\$\s*\d+(?:,\d{3})*(?:\.\d{2})?'),
+                pattern=_compiled(r'\$\s*\d+(?:,\d{3})*(?:\.\d{2})?'),
                 context_keywords=['price', 'cost', 'fee', 'rate', '$'],
                 post_process_func=self._parse_price
             ),
             'date': PatternConfig(
-                pattern=re.compile(
+                pattern=_compiled(
                     r'\b(?:'
                     r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}|'
                     r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|'
@@ -94,7 +123,7 @@ class PatternExtractor:
                 post_process_func=self._normalize_date
             ),
             'address': PatternConfig(
-                pattern=re.compile(
+                pattern=_compiled(
                     r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Plaza|Place|Pl)'
                     r'(?:[,\s]+(?:Suite|Ste|Floor|Fl)?[,\s]*\d*)?'
                     r'[,\s]+[A-Za-z\s]+[,\s]+[A-Z]{2}\s+\d{5}(?:-\d{4})?',
@@ -124,21 +153,24 @@ class PatternExtractor:
         config = self.patterns[pattern_type]
         
         # Check context if provided
-        if context and config.context_keywords:
-            context_lower = context.lower()
-            if not any(keyword in context_lower for keyword in config.context_keywords):
-                self.logger.debug(f"Context doesn't match for {pattern_type}")
-                return None
+        if context and not self._context_allows(pattern_type, context):
+            self.logger.debug(f"Context doesn't match for {pattern_type}")
+            return None
         
-        # Find matches
-        matches = config.pattern.findall(text)
-        if not matches:
+        # Only the first match is used, so stop scanning there
+        found = config.pattern.search(text)
+        if not found:
             return None
         
-        # Get first match
-        match = matches[0]
-        if isinstance(match, tuple):
-            match = ''.join(match)
+        return self._finish_match(config, found)
+    
+    def _finish_match(self, config: PatternConfig, found: re.Match) -> Optional[Any]:
+        """Validate and post-process a pattern's first match"""
+        # Mirror findall(): joined groups when the pattern has any
+        if config.pattern.groups:
+            match = ''.join(group or '' for group in found.groups())
+        else:
+            match = found.group()
         
         # Validate if function provided
         if config.validation_func and not config.validation_func(match):
@@ -150,6 +182,17 @@ class PatternExtractor:
         
         return match
     
+    def _context_allows(self, pattern_type: str, context: str) -> bool:
+        """Check whether context mentions one of the pattern's keywords (memoized)"""
+        key = (pattern_type, context)
+        allowed = self._context_matches.get(key)
+        if allowed is None:
+            keywords = self.patterns[pattern_type].context_keywords
+            context_lower = context.lower()
+            allowed = not keywords or any(keyword in context_lower for keyword in keywords)
+            self._context_matches[key] = allowed
+        return allowed
+    
     def extract_all(self, text: str, pattern_type: str, context: Optional[str] = None) -> List[Any]:
         """Extract all occurrences of a pattern"""
         if pattern_type not in self.patterns:
@@ -158,10 +201,8 @@ class PatternExtractor:
         config = self.patterns[pattern_type]
         
         # Check context
-        if context and config.context_keywords:
-            context_lower = context.lower()
-            if not any(keyword in context_lower for keyword in config.context_keywords):
-                return []
+        if context and not self._context_allows(pattern_type, context):
+            return []
         
         matches = config.pattern.findall(text)
         results = []
@@ -180,17 +221,190 @@ class PatternExtractor:
         
         return results
     
-    def extract_multiple_patterns(self, text: str, patterns: List[str]) -> Dict[str, Any]:
-        """Extract multiple pattern types from text"""
-        results = {}
+    def compile_hyperscan(self, pattern_names: Iterable[str]) -> Optional[Any]:
+        """
+        Compile the given patterns into a single Hyperscan database.
         
-        for pattern_type in patterns:
-            value = self.extract(text, pattern_type)
-            if value:
-                results[pattern_type] = value
+        Patterns are compiled in prefilter mode, so the database may report
+        false positives but never misses a text that the `re` pattern matches.
+        
+        Args:
+            pattern_names: Names of patterns to include
+            
+        Returns:
+            Compiled database, or None if Hyperscan is unavailable or fails
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        names = tuple(name for name in pattern_names if name in self.patterns)
+        if not names:
+            return None
+        if names in self._hs_databases:
+            return self._hs_databases[names]
+        
+        base_flags = (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER |
+                      hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        flags = []
+        for name in names:
+            pattern = self.patterns[name].pattern
+            flags.append(base_flags | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0))
+        
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[self.patterns[name].pattern.pattern.encode('utf-8') for name in names],
+                ids=list(range(len(names))),
+                elements=len(names),
+                flags=flags
+            )
+        except Exception as e:
+            self.logger.debug(f"Hyperscan compilation failed, using re only: {e}")
+            db = None
+        
+        self._hs_databases[names] = db
+        return db
+    
+    def find_candidate_patterns(self, text: str, pattern_names: Iterable[str]) -> Set[str]:
+        """
+        Find which patterns can possibly match text, in a single scan.
+        
+        Args:
+            text: Text to scan
+            pattern_names: Names of patterns to check
+            
+        Returns:
+            Subset of pattern_names worth running through `re`
+        """
+        names = tuple(name for name in pattern_names if name in self.patterns)
+        db = self.compile_hyperscan(names)
+        if db is None:
+            return set(names)
+        
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(names[pattern_id])
+            return len(hits) == len(names)
+        
+        try:
+            db.scan(text.encode('utf-8'), match_event_handler=on_match)
+        except Exception as e:
+            # Scanning was terminated early by the callback or failed
+            if len(hits) != len(names):
+                self.logger.debug(f"Hyperscan scan failed, using re only: {e}")
+                return set(names)
+        
+        return hits
+    
+    def _combined_pattern(self, names: Tuple[str, ...]) -> Optional[Pattern]:
+        """
+        Compile a zero-width alternation of the given patterns.
+        
+        Nothing is consumed, so every position where any pattern matches is
+        reported and overlapping matches of different patterns are not lost.
+        
+        Args:
+            names: Names of patterns to combine
+            
+        Returns:
+            Compiled pattern, or None if the patterns cannot be combined
+        """
+        if names in self._combined_patterns:
+            return self._combined_patterns[names]
+        
+        alternatives = []
+        for name in names:
+            pattern = self.patterns[name].pattern
+            scoped = ''.join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+            alternatives.append(f'(?{scoped}:{pattern.pattern})')
+        
+        try:
+            combined = re.compile('(?=' + '|'.join(alternatives) + ')')
+        except re.error as e:
+            # e.g. custom patterns with global inline flags
+            self.logger.debug(f"Cannot combine patterns {names}, scanning separately: {e}")
+            combined = None
+        
+        self._combined_patterns[names] = combined
+        return combined
+    
+    def prime(self, pattern_types: Iterable[str]):
+        """
+        Build the combined scan and Hyperscan database for a template's
+        patterns up front, so every page reuses them whichever fields it lacks.
+        
+        Args:
+            pattern_types: Every pattern type the template extracts
+        """
+        names = tuple(name for name in dict.fromkeys(pattern_types) if name in self.patterns)
+        combined = self._combined_pattern(names) if len(names) > 1 else None
+        self._primed = (frozenset(names), combined)
+        self.compile_hyperscan(names)
+    
+    def extract_many(self, text: str, pattern_types: Iterable[str],
+                     contexts: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Extract several pattern types from text in a single scan.
+        
+        Results are the same as calling extract() for each type, but the
+        text is walked once instead of once per pattern.
+        
+        Args:
+            text: Text to extract from
+            pattern_types: Types of patterns to use
+            contexts: Optional context per pattern type for validation
+            
+        Returns:
+            Dictionary of pattern type to extracted value
+        """
+        contexts = contexts or {}
+        pending = [
+            name for name in dict.fromkeys(pattern_types)
+            if name in self.patterns
+            and not (contexts.get(name) and not self._context_allows(name, contexts[name]))
+        ]
+        results = {}
+        if not pending:
+            return results
+        
+        primed_names, primed_pattern = self._primed
+        if len(pending) == 1:
+            combined = None
+        elif primed_pattern is not None and primed_names.issuperset(pending):
+            # Hits for patterns no longer pending are simply skipped below
+            combined = primed_pattern
+        else:
+            combined = self._combined_pattern(tuple(pending))
+        if combined is None:
+            for name in pending:
+                value = self.extract(text, name)
+                if value:
+                    results[name] = value
+            return results
+        
+        # name -> (config, bound match), looked up once rather than per hit
+        matchers = {name: (self.patterns[name], self.patterns[name].pattern.match) for name in pending}
+        for hit in combined.finditer(text):
+            position = hit.start()
+            # The earliest position a pattern matches at is where search() would find it
+            for name, (config, match) in tuple(matchers.items()):
+                found = match(text, position)
+                if found:
+                    del matchers[name]
+                    value = self._finish_match(config, found)
+                    if value:
+                        results[name] = value
+            if not matchers:
+                break
         
         return results
     
+    def extract_multiple_patterns(self, text: str, patterns: List[str]) -> Dict[str, Any]:
+        """Extract multiple pattern types from text"""
+        candidates = self.find_candidate_patterns(text, patterns)
+        return self.extract_many(text, (name for name in patterns if name in candidates))
+    
     def extract_with_context(self, text: str, pattern_type: str, window_size: int = 50) -> Optional[Dict[str, Any]]:
         """Extract pattern with surrounding context"""
         if pattern_type not in self.patterns:
@@ -242,7 +456,7 @@ class PatternExtractor:
     def _validate_international_phone(self, phone: str) -> bool:
         """Validate international phone number"""
         # Remove all non-digits
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGITS.sub('', phone)
         
         # International numbers should have 10-15 digits
         return 10 <= len(digits) <= 15
@@ -251,7 +465,7 @@ class PatternExtractor:
     def _format_phone(self, phone: str) -> str:
         """Format phone number to standard format"""
         # Extract digits
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGITS.sub('', phone)
         
         if len(digits) == 10:
             return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
@@ -293,7 +507,7 @@ class PatternExtractor:
     def _parse_price(self, price: str) -> float:
         """Parse price string to float"""
         # Remove $ and commas
-        price_clean = price.replace('$', '').replace(',', '').strip()
+        price_clean = price.translate(_PRICE_STRIP).strip()
         
         try:
             return float(price_clean)
@@ -330,10 +544,14 @@ class PatternExtractor:
                           validation_func: callable = None, post_process_func: callable = None):
         """Add a custom pattern for extraction"""
         self.patterns[name] = PatternConfig(
-            pattern=re.compile(pattern),
+            pattern=_compiled(pattern),
             context_keywords=context_keywords or [],
             validation_func=validation_func,
             post_process_func=post_process_func
         )
+        self._hs_databases.clear()
+        self._combined_patterns.clear()
+        self._primed = (frozenset(), None)
+        self._context_matches.clear()
         
         self.logger.info(f"Added custom pattern: {name}")
\ No newline at end of file
@@ -4,10 +4,40 @@ Element extraction functionality for static HTML using BeautifulSoup.
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Union
+from difflib import SequenceMatcher
+from itertools import islice
+from typing import Dict, List, Optional, Any, Union, Iterable, Iterator, Tuple
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+from ..utils.selectors import compile_css_selector
+
+# Text nodes never shown on the page, skipped when looking for labels
+_NON_VISIBLE_TAGS = frozenset({'script', 'style', 'noscript', 'template', 'head', 'title'})
+
+
+
+def _select(context: Tag, selector: str) -> List[Tag]:
+    """Select all matches, reusing the compiled selector when available"""
+    compiled = compile_css_selector(selector)
+    return compiled.select(context) if compiled else context.select(selector)
+
+
+def _select_one(context: Tag, selector: str) -> Optional[Tag]:
+    """Select the first match, reusing the compiled selector when available"""
+    compiled = compile_css_selector(selector)
+    return compiled.select_one(context) if compiled else context.select_one(selector)
+
+
+def _visible_strings(nodes: Iterable[NavigableString]) -> Iterator[Tuple[NavigableString, str]]:
+    """(node, stripped text) for non-empty text nodes that render on the page"""
+    for node in nodes:
+        if isinstance(node, Comment) or node.parent.name in _NON_VISIBLE_TAGS:
+            continue
+        text = node.strip()
+        if text:
+            yield node, text
 
 
 class RequestExtractor:
@@ -34,10 +64,10 @@ class RequestExtractor:
             
         try:
             if multiple:
-                elements = search_context.select(selector)
+                elements = _select(search_context, selector)
                 return [elem.get_text(strip=True) for elem in elements if elem.get_text(strip=True)]
             else:
-                element = search_context.select_one(selector)
+                element = _select_one(search_context, selector)
                 return element.get_text(strip=True) if element else None
         except Exception as e:
             self.logger.warning(f"Error extracting text from {selector}: {e}")
@@ -53,10 +83,10 @@ class RequestExtractor:
 
         try:
             if multiple:
-                elements = search_context.select(selector)
+                elements = _select(search_context, selector)
                 return [elem.get(attribute) for elem in elements if elem.get(attribute)]
             else:
-                element = search_context.select_one(selector)
+                element = _select_one(search_context, selector)
                 return element.get(attribute) if element else None
         except Exception as e:
             self.logger.warning(f"Error extracting attribute '{attribute}' from {selector}: {e}")
@@ -71,7 +101,7 @@ class RequestExtractor:
         
         try:
             # Find the link element itself
-            link_element = search_context.select_one(selector)
+            link_element = _select_one(search_context, selector)
             if not link_element:
                 return None
             
@@ -96,4 +126,45 @@ class RequestExtractor:
             }
         except Exception as e:
             self.logger.warning(f"Error extracting link from {selector}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def find_and_extract_by_label(self, label_text: str, min_similarity: float = 0.8,
+                                  max_following: int = 5) -> Optional[str]:
+        """
+        Find a visible label and return the value that follows it.
+
+        Static HTML has no layout, so where the Selenium extractor looks for
+        the nearest element on screen this takes the next few text nodes in
+        document order.
+
+        Args:
+            label_text: Text of the label to find
+            min_similarity: Minimum similarity for a fuzzy label match
+            max_following: How many following text nodes to consider
+
+        Returns:
+            Extracted value or None
+        """
+        search_text = label_text.strip().lower()
+        # The label is the cached second sequence; each candidate only resets the first
+        matcher = SequenceMatcher(None, '', search_text)
+        best, best_score = None, 0.0
+        for node, text in _visible_strings(self.soup.find_all(string=True)):
+            matcher.set_seq1(text.lower().rstrip(':').strip())
+            if matcher.real_quick_ratio() < min_similarity or matcher.quick_ratio() < min_similarity:
+                continue
+            score = matcher.ratio()
+            if score >= min_similarity and score > best_score:
+                best, best_score = node, score
+                if score == 1.0:
+                    break
+
+        if best is None:
+            return None
+
+        following = _visible_strings(best.find_all_next(string=True))
+        for _, text in islice(following, max_following):
+            # Skip the label itself and anything that looks like another label
+            if text.lower() != search_text and not text.endswith(':') and len(text) < 200:
+                return text
+        return None
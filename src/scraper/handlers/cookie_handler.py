@@ -12,6 +12,38 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 
+# Finds the first usable cookie button for a prioritised list of XPath and CSS
+# selectors in a single round-trip. Mirrors _is_valid_cookie_button's checks.
+_FIND_COOKIE_BUTTON_JS = """
+const xpaths = arguments[0], cssSelectors = arguments[1];
+const vw = window.innerWidth, vh = window.innerHeight;
+function usable(el) {
+    if (!el || el.disabled) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden') return false;
+    const rect = el.getBoundingClientRect();
+    if (rect.width < 20 || rect.height < 20) return false;
+    return rect.top >= -100 && rect.top <= vh + 100 && rect.left >= -100 && rect.left <= vw + 100;
+}
+for (const xpath of xpaths) {
+    try {
+        const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            if (usable(snapshot.snapshotItem(i))) return [xpath, snapshot.snapshotItem(i)];
+        }
+    } catch (e) {}
+}
+for (const css of cssSelectors) {
+    try {
+        for (const el of document.querySelectorAll(css)) {
+            if (usable(el)) return [css, el];
+        }
+    } catch (e) {}
+}
+return null;
+"""
+
+
 class CookieHandler:
     """Handle cookie consent popups and banners"""
     
@@ -70,21 +102,7 @@ class CookieHandler:
         # Add instance custom selectors
         selectors_to_try.extend(self.custom_selectors)
         
-        # Add default XPath selectors
-        for xpath in self.config.COOKIE_XPATHS:
-            selectors_to_try.append({
-                'selector': xpath,
-                'type': 'xpath'
-            })
-        
-        # Add default CSS selectors
-        for css in self.config.COOKIE_CSS_SELECTORS:
-            selectors_to_try.append({
-                'selector': css,
-                'type': 'css'
-            })
-        
-        # Try each selector
+        # Try each custom selector
         for selector_info in selectors_to_try:
             selector = selector_info['selector']
             selector_type = selector_info['type']
@@ -93,9 +111,60 @@ class CookieHandler:
                 self.logger.info(f"Cookie banner accepted using {selector_type}: {selector}")
                 return selector
         
+        # Probe all default selectors in one script call
+        try:
+            selector = self._try_default_selectors()
+        except Exception as e:
+            self.logger.debug(f"Batched cookie detection failed, probing one by one: {e}")
+            selector = self._try_default_selectors_individually(timeout)
+        
+        if selector:
+            self.logger.info(f"Cookie banner accepted using: {selector}")
+            return selector
+        
         self.logger.debug("No cookie banner found or accepted")
         return None
     
+    def _try_default_selectors(self) -> Optional[str]:
+        """
+        Find and click the first usable default cookie button in one round-trip.
+        
+        Returns:
+            Selector that matched, or None if no button was found
+        """
+        match = self.driver.execute_script(
+            _FIND_COOKIE_BUTTON_JS,
+            list(self.config.COOKIE_XPATHS),
+            list(self.config.COOKIE_CSS_SELECTORS)
+        )
+        if not match:
+            return None
+        
+        selector, element = match
+        if self._click_element(element):
+            # Wait a bit for cookie banner to disappear
+            time.sleep(1)
+            return selector
+        return None
+    
+    def _try_default_selectors_individually(self, timeout: int) -> Optional[str]:
+        """
+        Try default selectors one at a time.
+        
+        Args:
+            timeout: Timeout in seconds
+            
+        Returns:
+            Selector that worked, or None
+        """
+        for xpath in self.config.COOKIE_XPATHS:
+            if self._try_selector(xpath, 'xpath', timeout):
+                return xpath
+        for css in self.config.COOKIE_CSS_SELECTORS:
+            if self._try_selector(css, 'css', timeout):
+                return css
+        return None
+    
     def _try_selector(self, selector: str, selector_type: str, timeout: int) -> bool:
         """
         Try a single selector to find and click cookie button.
@@ -212,6 +281,20 @@ class CookieHandler:
         result = self.accept_cookies(custom_selectors=custom_selectors, timeout=timeout)
         return result is not None
     
+    def consent_already_given(self) -> bool:
+        """
+        Check the browser's cookies for a known consent-manager cookie.
+        
+        Returns:
+            True if consent was already recorded for the current site
+        """
+        try:
+            names = {cookie.get('name') for cookie in self.driver.get_cookies()}
+        except Exception as e:
+            self.logger.debug(f"Could not read cookies: {e}")
+            return False
+        return not names.isdisjoint(self.config.COOKIE_CONSENT_NAMES)
+    
     def detect_cookie_banner(self) -> bool:
         """
         Check if a cookie banner is currently visible.
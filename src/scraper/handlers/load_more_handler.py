@@ -18,6 +18,7 @@ from selenium.common.exceptions import (
 
 from ..config import Config
 from ..models import LoadStrategy, LoadStrategyConfig
+from ..utils.selectors import count_matches
 
 
 class LoadMoreHandler:
@@ -199,7 +200,7 @@ class LoadMoreHandler:
         if not selector:
             return 0
         try:
-            return len(self.driver.find_elements(By.CSS_SELECTOR, selector))
+            return count_matches(self.driver, selector)
         except Exception as e:
             self.logger.debug(f"Error counting items with selector '{selector}': {e}")
             return 0
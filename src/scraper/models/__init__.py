@@ -11,7 +11,8 @@ from .data_models import (
     LoadStrategyConfig,
     TemplateRules,
     SiteInfo,
-    ScrapingTemplate
+    ScrapingTemplate,
+    now_iso
 )
 
 __all__ = [
@@ -25,5 +26,6 @@ __all__ = [
     'LoadStrategyConfig',
     'TemplateRules',
     'SiteInfo',
-    'ScrapingTemplate'
+    'ScrapingTemplate',
+    'now_iso'
 ]
\ No newline at end of file
@@ -3,13 +3,21 @@
 Data models and structures for the interactive scraper.
 """
 
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
 
+def now_iso() -> str:
+    """Current local time in datetime.isoformat() layout, without building a datetime"""
+    ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))}.{remainder // 1000:06d}"
+
+
 class ExportFormat(Enum):
     """Supported export formats"""
 
@@ -72,7 +80,7 @@ class ScrapedItem:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = now_iso()
 
     def is_successful(self) -> bool:
         """Check if item was scraped successfully"""
@@ -95,6 +103,8 @@ class ScrapeResult:
     items: List[ScrapedItem]
     errors: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Set when exports run in the background; result() waits for the files
+    export_future: Optional[Future] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         # Calculate success/failure counts if not provided
@@ -205,14 +215,38 @@ class TemplateRules:
     repeating_item_selector: Optional[str] = None
     profile_link_selector: Optional[str] = None
     load_strategy: LoadStrategyConfig = field(default_factory=LoadStrategyConfig)
+    # v2.1: fallback hints, e.g. {"use_text_content": {field: label}}
+    advanced_selectors: Dict[str, Any] = field(default_factory=dict)
+    # Read list items from a JSON/XHR response instead of the DOM.
+    # api_json_path is a dotted path to the record list; api_fields maps
+    # field names to dotted keys in each record (default: the field name).
+    # A "detail_url" entry in api_fields supplies the item's detail link.
+    api_url_pattern: Optional[str] = None
+    api_json_path: Optional[str] = None
+    api_fields: Dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
-        return {
+        result = {
             "fields": self.fields,
             "repeating_item_selector": self.repeating_item_selector,
             "profile_link_selector": self.profile_link_selector,
             "load_strategy": self.load_strategy.to_dict(),
         }
+        if self.advanced_selectors:
+            result["advanced_selectors"] = self.advanced_selectors
+        if self.api_url_pattern:
+            result["api_url_pattern"] = self.api_url_pattern
+            result["api_json_path"] = self.api_json_path
+            if self.api_fields:
+                result["api_fields"] = self.api_fields
+        return result
+
+
+# Keys ScrapingTemplate.from_dict passes through to TemplateRules
+_TEMPLATE_RULES_KEYS = frozenset(TemplateRules.__dataclass_fields__)
+
+# Values ScrapingTemplate.detail_engine may take besides None
+_DETAIL_ENGINES = frozenset({'requests'})
 
 
 @dataclass
@@ -241,12 +275,17 @@ class ScrapingTemplate:
     list_page_rules: Optional[TemplateRules] = None
     detail_page_rules: Optional[TemplateRules] = None
     field_mappings: Dict[str, str] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=now_iso)
     version: str = "1.0"
     # New v2.1 fields
     rate_limiting: Optional[Dict[str, Any]] = None
     extraction_patterns: Optional[Dict[str, Any]] = None
     fallback_strategies: Optional[Dict[str, Any]] = None
+    # Playwright resource blocking; None uses the engine's default set
+    block_resources: bool = True
+    resource_block: Optional[List[str]] = None
+    # 'requests' fetches JS-free detail pages over plain HTTP instead of the template's engine
+    detail_engine: Optional[str] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -273,6 +312,12 @@ class ScrapingTemplate:
             result["extraction_patterns"] = self.extraction_patterns
         if self.fallback_strategies is not None:
             result["fallback_strategies"] = self.fallback_strategies
+        if not self.block_resources:
+            result["block_resources"] = False
+        if self.resource_block is not None:
+            result["resource_block"] = self.resource_block
+        if self.detail_engine:
+            result["detail_engine"] = self.detail_engine
             
         return result
 
@@ -288,7 +333,7 @@ class ScrapingTemplate:
             # Filter out fields that TemplateRules doesn't support
             filtered_data = {
                 k: v for k, v in rules_data.items() 
-                if k in ['fields', 'repeating_item_selector', 'profile_link_selector', 'load_strategy']
+                if k in _TEMPLATE_RULES_KEYS
             }
             if "load_strategy" in filtered_data:
                 filtered_data["load_strategy"] = LoadStrategyConfig.from_dict(
@@ -302,7 +347,7 @@ class ScrapingTemplate:
             # Filter out fields that TemplateRules doesn't support
             filtered_data = {
                 k: v for k, v in rules_data.items() 
-                if k in ['fields', 'repeating_item_selector', 'profile_link_selector', 'load_strategy']
+                if k in _TEMPLATE_RULES_KEYS
             }
             if "load_strategy" in filtered_data:
                 filtered_data["load_strategy"] = LoadStrategyConfig.from_dict(
@@ -310,6 +355,10 @@ class ScrapingTemplate:
                 )
             detail_rules = TemplateRules(**filtered_data)
 
+        detail_engine = data.get("detail_engine")
+        if detail_engine is not None and detail_engine not in _DETAIL_ENGINES:
+            raise ValueError(f"Unsupported detail engine: {detail_engine}")
+
         return cls(
             name=data.get("name", "unnamed"),
             engine=data.get("engine", "selenium"),
@@ -318,29 +367,26 @@ class ScrapingTemplate:
             list_page_rules=list_rules,
             detail_page_rules=detail_rules,
             field_mappings=data.get("field_mappings", {}),
-            created_at=data.get("created_at", datetime.now().isoformat()),
+            created_at=data.get("created_at") or now_iso(),
             version=data.get("version", "1.0"),
             # v2.1 fields
             rate_limiting=data.get("rate_limiting"),
             extraction_patterns=data.get("extraction_patterns"),
             fallback_strategies=data.get("fallback_strategies"),
+            block_resources=data.get("block_resources", True),
+            resource_block=data.get("resource_block"),
+            detail_engine=detail_engine,
         )
 
     def save(self, filepath: Union[str, Path]):
         """Save template to JSON file"""
-        import json
-
-        filepath = Path(filepath)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        from ..utils.file_io import write_json
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(filepath, self.to_dict())
 
     @classmethod
     def load(cls, filepath: Union[str, Path]) -> "ScrapingTemplate":
         """Load template from JSON file"""
-        import json
+        from ..utils.file_io import read_json
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(read_json(filepath))
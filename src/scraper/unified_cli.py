@@ -7,29 +7,89 @@ Consolidates all functionality into a single, comprehensive CLI
 import argparse
 import logging
 import sys
-import os
-import time
-import json
+import re
 import asyncio
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-from urllib.parse import urlparse
 
 # Import core functionality
 from .core.enhanced_template_scraper import EnhancedTemplateScraper
-from .core.unified_interactive_scraper import UnifiedInteractiveScraper
-from .models import ExportFormat, ScrapingTemplate, ScrapingType, SiteInfo, TemplateRules, LoadStrategyConfig
+from .core.unified_interactive_scraper import UnifiedInteractiveScraper, PLAYWRIGHT_AVAILABLE
+from .models import ExportFormat, ScrapingTemplate, ScrapingType
 from .utils.logging_config import setup_logging
 from .utils.user_experience import UserExperience, ValidationHelper
 from .utils.rate_limiter import RATE_LIMIT_PRESETS
-from .extractors.pattern_extractor import PatternExtractor
+from .utils.file_io import read_json, write_json
 from .config import Config
 
 # Colors for output
 from colorama import Fore, Style, init
 init(autoreset=True)
 
+# How often a menu is re-asked before the flow gives up
+MAX_CHOICE_ATTEMPTS = 3
+
+# Engine menu, resolved once against the installed packages
+ENGINE_CHOICES = {
+    "selenium": "Selenium - Reliable, full JavaScript support",
+    "playwright": "Playwright - Modern, fast, full JavaScript"
+                  + ("" if PLAYWRIGHT_AVAILABLE else " (NOT INSTALLED)"),
+    "requests": "Requests - Blazing fast, no JavaScript"
+}
+
+SCRAPING_TYPE_CHOICES = {
+    "1": "List + Detail Pages - Extract from list, then follow links to detail pages",
+    "2": "List Only - Extract data from list page only",
+    "3": "Single Page - Extract from current page only"
+}
+
+SCRAPING_TYPE_MAP = {
+    "1": ScrapingType.LIST_DETAIL,
+    "2": ScrapingType.LIST_ONLY,
+    "3": ScrapingType.SINGLE_PAGE
+}
+
+RATE_LIMIT_CHOICES = {
+    "respectful_bot": "Respectful Bot - 0.2 req/sec, very slow but safe",
+    "conservative": "Conservative - 0.5 req/sec, slow but respectful",
+    "moderate": "Moderate - 1 req/sec, balanced approach",
+    "aggressive": "Aggressive - 5 req/sec, fast but may trigger blocks",
+    "none": "No rate limiting - Maximum speed (not recommended)"
+}
+
+YES_NO_CHOICES = {"y": "Yes", "n": "No"}
+
+
+def _render_menu(options: Dict[str, str]) -> str:
+    """Render menu options the way _get_choice_input prints them"""
+    return "\n".join(f"  {key}: {desc}" for key, desc in options.items())
+
+
+# Menus that never change are rendered once
+ENGINE_MENU = _render_menu(ENGINE_CHOICES)
+SCRAPING_TYPE_MENU = _render_menu(SCRAPING_TYPE_CHOICES)
+RATE_LIMIT_MENU = _render_menu(RATE_LIMIT_CHOICES)
+YES_NO_MENU = _render_menu(YES_NO_CHOICES)
+
+MAIN_MENU_ITEMS = (
+    ("1", "🔧 Create a new scraping template", "Design a reusable template"),
+    ("2", "📋 Apply an existing template", "Run a saved template"),
+    ("3", "📦 Batch process templates", "Run multiple templates"),
+    ("4", "📊 View existing templates", "List all saved templates"),
+    ("5", "🎓 Interactive Tutorial", "Learn how to use the tool"),
+    ("6", "🔧 Common Issues & Solutions", "Troubleshooting help"),
+    ("7", "⚙️  Settings & Configuration", "Adjust tool settings"),
+    ("8", "🚪 Exit", "Close the application")
+)
+MAIN_MENU = "\nMain Menu:\n" + "\n".join(
+    f"  {Fore.YELLOW}{num}{Style.RESET_ALL}. {title}\n     {Fore.CYAN}{desc}{Style.RESET_ALL}"
+    for num, title, desc in MAIN_MENU_ITEMS
+)
+
+# Template names: anything outside this set is rejected, spaces/dashes become underscores
+_TEMPLATE_NAME_INVALID_RE = re.compile(r'[^A-Za-z0-9_ -]')
+_TEMPLATE_NAME_TRANSLATION = str.maketrans(" -", "__")
+
 
 class UnifiedCLI:
     """
@@ -40,13 +100,36 @@ class UnifiedCLI:
         self.ux = UserExperience()
         self.validator = ValidationHelper()
         self.config = Config
-        self.pattern_extractor = PatternExtractor()
+        self._pattern_extractor = None
+        self._out_buf: List[str] = []
         self.first_time_user = self._check_first_time_user()
         
         # Initialize unified scraper as None - will be created when needed
         self.interactive_scraper = None
         self.current_engine = None
         
+        # Set while a template is being configured
+        self.current_url: Optional[str] = None
+        
+    @property
+    def pattern_extractor(self):
+        """Pattern extractor, created on first use to keep startup cheap"""
+        if self._pattern_extractor is None:
+            from .extractors.pattern_extractor import PatternExtractor
+            self._pattern_extractor = PatternExtractor()
+        return self._pattern_extractor
+        
+    def _emit(self, line: str = ""):
+        """Queue a line of output until the next flush"""
+        self._out_buf.append(line)
+        
+    def _flush(self):
+        """Write all queued output in a single call"""
+        if self._out_buf:
+            sys.stdout.write("\n".join(self._out_buf) + "\n")
+            sys.stdout.flush()
+            self._out_buf.clear()
+        
     def _check_first_time_user(self) -> bool:
         """Check if this is a first-time user"""
         config_file = Path.home() / '.interactive_scraper' / 'user_config.json'
@@ -59,13 +142,11 @@ class UnifiedCLI:
         
         config = {}
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = read_json(config_file)
         
         config[key] = value
         
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        write_json(config_file, config)
 
     def run(self):
         """Main entry point"""
@@ -135,21 +216,8 @@ class UnifiedCLI:
         """Show enhanced main menu"""
         self.ux.print_header("INTERACTIVE WEB SCRAPER", "Extract data from any website", "🕷️")
         
-        menu_items = [
-            ("1", "🔧 Create a new scraping template", "Design a reusable template"),
-            ("2", "📋 Apply an existing template", "Run a saved template"),
-            ("3", "📦 Batch process templates", "Run multiple templates"),
-            ("4", "📊 View existing templates", "List all saved templates"),
-            ("5", "🎓 Interactive Tutorial", "Learn how to use the tool"),
-            ("6", "🔧 Common Issues & Solutions", "Troubleshooting help"),
-            ("7", "⚙️  Settings & Configuration", "Adjust tool settings"),
-            ("8", "🚪 Exit", "Close the application")
-        ]
-        
-        print("\nMain Menu:")
-        for num, title, desc in menu_items:
-            print(f"  {Fore.YELLOW}{num}{Style.RESET_ALL}. {title}")
-            print(f"     {Fore.CYAN}{desc}{Style.RESET_ALL}")
+        self._emit(MAIN_MENU)
+        self._flush()
         
         return input(f"\n{Fore.GREEN}Enter your choice (1-8): {Style.RESET_ALL}").strip()
 
@@ -172,8 +240,13 @@ class UnifiedCLI:
             if not self._initialize_scraper(engine):
                 return
             
-            # Step 4: Navigate to URL
-            if not self._navigate_to_url(url):
+            # Step 4: Navigate to URL, retrying in place rather than restarting the flow
+            for _ in range(MAX_CHOICE_ATTEMPTS):
+                if self._navigate_to_url(url):
+                    break
+                if not self.ux.confirm_action("Retry loading the page?", default=True):
+                    return
+            else:
                 return
             
             # Step 5: Handle cookies
@@ -202,20 +275,16 @@ class UnifiedCLI:
                 return
             
             # Step 9: Configure advanced features
-            template_dict = template.to_dict()
-            template_dict['rate_limiting'] = rate_limiting
+            template.rate_limiting = rate_limiting
             
             # Pattern extraction
-            pattern_config = self._configure_pattern_extraction()
-            if pattern_config:
-                template_dict['extraction_patterns'] = pattern_config
+            template.extraction_patterns = self._configure_pattern_extraction()
             
             # Fallback strategies
-            fallback_config = self._configure_fallback_strategies()
-            template_dict['fallback_strategies'] = fallback_config
+            template.fallback_strategies = self._configure_fallback_strategies()
             
             # Step 10: Save template
-            self._save_template(template_dict, engine)
+            self._save_template(template, engine)
             
         except Exception as e:
             self.ux.print_error(f"Failed to create template: {e}")
@@ -245,45 +314,41 @@ class UnifiedCLI:
 
     def _select_engine(self) -> Optional[str]:
         """Select scraping engine with detailed explanations"""
-        print(f"\n{Fore.CYAN}Select Scraping Engine:{Style.RESET_ALL}")
-        print("=" * 40)
+        self._emit(f"\n{Fore.CYAN}Select Scraping Engine:{Style.RESET_ALL}")
+        self._emit("=" * 40)
         
         # Show engine comparison
         self._show_engine_comparison()
         
-        engines = {
-            "selenium": "Selenium - Reliable, full JavaScript support",
-            "playwright": "Playwright - Modern, fast, full JavaScript",
-            "requests": "Requests - Blazing fast, no JavaScript"
-        }
-        
-        # Check Playwright availability
-        try:
-            import playwright
-            playwright_available = True
-        except ImportError:
-            playwright_available = False
-            engines["playwright"] += " (NOT INSTALLED)"
-        
-        choice = self._get_choice_input(
-            "Choose engine",
-            engines,
-            default="selenium"
-        )
-        
-        if choice == "playwright" and not playwright_available:
-            self.ux.print_error("Playwright is not installed.")
-            print("\nTo install Playwright:")
-            print(f"  {Fore.YELLOW}pip install playwright{Style.RESET_ALL}")
-            print(f"  {Fore.YELLOW}playwright install{Style.RESET_ALL}")
-            return None
+        for _ in range(MAX_CHOICE_ATTEMPTS):
+            choice = self._get_choice_input(
+                "Choose engine",
+                ENGINE_CHOICES,
+                default="selenium",
+                pre_rendered=ENGINE_MENU
+            )
+            
+            if choice not in ENGINE_CHOICES:
+                self.ux.print_error(f"Unknown engine: {choice}")
+                continue
+            
+            if choice == "playwright" and not PLAYWRIGHT_AVAILABLE:
+                self.ux.print_error("Playwright is not installed.")
+                print("\nTo install Playwright:")
+                print(f"  {Fore.YELLOW}pip install playwright{Style.RESET_ALL}")
+                print(f"  {Fore.YELLOW}playwright install{Style.RESET_ALL}")
+                if not self.ux.confirm_action("Choose a different engine?", default=True):
+                    return None
+                continue
+            
+            return choice
         
-        return choice
+        return None
 
     def _show_engine_comparison(self):
         """Show detailed engine comparison"""
-        print(f"\n{Fore.CYAN}Engine Comparison:{Style.RESET_ALL}")
-        print("-" * 50)
+        self._emit(f"\n{Fore.CYAN}Engine Comparison:{Style.RESET_ALL}")
+        self._emit("-" * 50)
         
         engines = [
             {
@@ -310,16 +375,17 @@ class UnifiedCLI:
         ]
         
         for engine in engines:
-            print(f"\n{Fore.YELLOW}{engine['name']}{Style.RESET_ALL}")
-            print(f"Speed: {engine['speed']}")
-            print(f"Best for: {engine['best_for']}")
-            print("Pros:")
+            self._emit(f"\n{Fore.YELLOW}{engine['name']}{Style.RESET_ALL}")
+            self._emit(f"Speed: {engine['speed']}")
+            self._emit(f"Best for: {engine['best_for']}")
+            self._emit("Pros:")
             for pro in engine['pros']:
-                print(f"  ✓ {pro}")
-            print("Cons:")
+                self._emit(f"  ✓ {pro}")
+            self._emit("Cons:")
             for con in engine['cons']:
-                print(f"  ✗ {con}")
-            print("-" * 50)
+                self._emit(f"  ✗ {con}")
+            self._emit("-" * 50)
+        self._flush()
 
     def _initialize_scraper(self, engine: str) -> bool:
         """Initialize the unified scraper for the selected engine"""
@@ -410,43 +476,25 @@ class UnifiedCLI:
 
     def _select_scraping_type(self) -> Optional[ScrapingType]:
         """Select scraping type with better descriptions"""
-        types = {
-            "1": "List + Detail Pages - Extract from list, then follow links to detail pages",
-            "2": "List Only - Extract data from list page only", 
-            "3": "Single Page - Extract from current page only"
-        }
-        
         choice = self._get_choice_input(
             "📋 Select scraping type",
-            types,
-            default="1"
+            SCRAPING_TYPE_CHOICES,
+            default="1",
+            pre_rendered=SCRAPING_TYPE_MENU
         )
         
-        type_map = {
-            "1": ScrapingType.LIST_DETAIL,
-            "2": ScrapingType.LIST_ONLY,
-            "3": ScrapingType.SINGLE_PAGE
-        }
-        
-        return type_map.get(choice)
+        return SCRAPING_TYPE_MAP.get(choice)
 
     def _configure_rate_limiting(self) -> Dict[str, Any]:
         """Configure rate limiting"""
-        print(f"\n{Fore.CYAN}⏱️  Configure Rate Limiting:{Style.RESET_ALL}")
-        print("=" * 40)
-        
-        presets = {
-            "respectful_bot": "Respectful Bot - 0.2 req/sec, very slow but safe",
-            "conservative": "Conservative - 0.5 req/sec, slow but respectful", 
-            "moderate": "Moderate - 1 req/sec, balanced approach",
-            "aggressive": "Aggressive - 5 req/sec, fast but may trigger blocks",
-            "none": "No rate limiting - Maximum speed (not recommended)"
-        }
+        self._emit(f"\n{Fore.CYAN}⏱️  Configure Rate Limiting:{Style.RESET_ALL}")
+        self._emit("=" * 40)
         
         choice = self._get_choice_input(
             "Select rate limiting preset",
-            presets,
-            default="respectful_bot"
+            RATE_LIMIT_CHOICES,
+            default="respectful_bot",
+            pre_rendered=RATE_LIMIT_MENU
         )
         
         if choice == "none":
@@ -457,468 +505,12 @@ class UnifiedCLI:
                 "preset": choice
             }
 
-    def _create_template_object(self, url: str, engine: str, scraping_type: ScrapingType) -> ScrapingTemplate:
-        """Create the base template object"""
-        site_info = SiteInfo(url=url)
-        
-        template = ScrapingTemplate(
-            name="new_template",
-            engine=engine,
-            site_info=site_info,
-            scraping_type=scraping_type,
-            list_page_rules=(
-                TemplateRules() if scraping_type != ScrapingType.SINGLE_PAGE else None
-            ),
-            detail_page_rules=TemplateRules(),
-            version="2.1",
-            created_at=datetime.now().isoformat()
-        )
-        
-        return template
-
-    def _configure_list_rules(self, template: ScrapingTemplate) -> bool:
-        """Configure list page rules"""
-        print(f"\n{Fore.CYAN}📋 List Page Configuration{Style.RESET_ALL}")
-        print("=" * 40)
-        
-        rules = template.list_page_rules
-        
-        if self.current_engine in ['selenium', 'playwright']:
-            return self._configure_list_rules_interactive(template)
-        else:
-            return self._configure_list_rules_manual(template)
-
-    def _configure_list_rules_interactive(self, template: ScrapingTemplate) -> bool:
-        """Configure list rules with interactive selection"""
-        rules = template.list_page_rules
-        
-        # First, get the repeating item selector
-        print("\n" + "="*50)
-        print("🎯 STEP 1: Identify List Items")
-        print("="*50)
-        print("\nWe need to identify what represents each item in the list.")
-        print("For example:")
-        print("  • Attorney cards on a law firm directory")
-        print("  • Product cards in an online store")
-        print("  • Article items in a blog")
-        
-        print("\n" + Fore.YELLOW + "Options:" + Style.RESET_ALL)
-        print("  1. Click to select (recommended) - Visual selection")
-        print("  2. Enter CSS selector manually - If you know the selector")
-        
-        choice = input("\nChoose [1/2] (default: 1): ").strip() or "1"
-        
-        if choice == "2":
-            # Manual entry
-            print("\nCommon selectors:")
-            print("  • .person-card")
-            print("  • .attorney-item")
-            print("  • article")
-            print("  • li")
-            print("  • .row")
-            selector = input("\nEnter CSS selector: ").strip()
-            if selector:
-                rules.repeating_item_selector = selector
-                self.ux.print_success(f"Using selector: {selector}")
-            else:
-                return False
-        else:
-            # Interactive selection
-            print("\n" + Fore.CYAN + "Interactive Selection Mode" + Style.RESET_ALL)
-            print("1. An overlay will appear on the page")
-            print("2. Hover over items to see them highlighted in blue")
-            print("3. Click on any item from the list")
-            print("4. The tool will detect the pattern automatically")
-            
-            input("\n" + Fore.GREEN + "Press Enter when ready..." + Style.RESET_ALL)
-            
-            if not self._interactive_selector_detection(rules):
-                return False
-        
-        # Configure fields within items
-        print("\n" + "="*50)
-        print("🔍 STEP 2: Select Fields to Extract")
-        print("="*50)
-        print("\nNow we need to select what data to extract from each item.")
-        fields = self._configure_fields_interactive("list item")
-        rules.fields = fields
-        
-        # Set profile link selector for list+detail
-        if template.scraping_type == ScrapingType.LIST_DETAIL:
-            print("\n" + "="*50)
-            print("🔗 STEP 3: Detail Page Links")
-            print("="*50)
-            print("\nFor list+detail scraping, we need the link to each detail page.")
-            print("This is typically an <a> tag within each list item.")
-            
-            link_selector = input("\nCSS selector for links (e.g., 'a', 'a.profile-link') [default: a]: ").strip() or "a"
-            rules.profile_link_selector = link_selector
-        
-        # Configure load strategy
-        print("\n" + "="*50)
-        print("📄 STEP 4: Page Loading Strategy")
-        print("="*50)
-        load_strategy = self._configure_load_strategy()
-        rules.load_strategy = LoadStrategyConfig(**load_strategy)
-        
-        return True
-
-    def _interactive_selector_detection(self, rules: TemplateRules) -> bool:
-        """Use interactive selection to detect repeating items"""
-        print("\n🎯 IMPORTANT: Click on ONE INDIVIDUAL ITEM from the list")
-        print("   Examples:")
-        print("   • One person card (not the whole grid)")
-        print("   • One product tile (not the container)")
-        print("   • One article item (not the list)")
-        print("\n⚠️  Make sure to click a specific item, not the container!")
-        
-        if not self.interactive_scraper.inject_interactive_selector("Click ONE item (e.g., one person card)"):
-            self.ux.print_error("Failed to inject interactive selector")
-            return False
-        
-        # Wait for selection
-        selected_data = None
-        for _ in range(30):  # 15 second timeout
-            time.sleep(0.5)
-            data = self.interactive_scraper.get_selected_element_data()
-            if data:
-                if data.get('done'):
-                    break
-                selected_data = data
-                print(f"\n📍 Selected element: {data.get('selector', 'Unknown')}")
-                selected_text = data.get('text', '')[:100]
-                if selected_text:
-                    print(f"   Text preview: '{selected_text}...'")
-                break
-        
-        if not selected_data:
-            self.ux.print_error("No element selected")
-            return False
-        
-        # Process the selected selector
-        item_selector = selected_data.get('selector', '')
-        if item_selector:
-            # Check if this looks like a container (common patterns)
-            container_indicators = ['container', 'grid', 'list', 'wrapper', 'loading', 'results']
-            might_be_container = any(indicator in item_selector.lower() for indicator in container_indicators)
-            
-            if might_be_container:
-                print("\n⚠️  This might be a container, not an individual item!")
-                print("   Selected:", item_selector)
-                confirm = input("\nIs this correct? [y/N]: ").strip().lower()
-                if confirm != 'y':
-                    print("Please try again and select an individual item.")
-                    return False
-            
-            # Try to generalize the selector
-            parts = item_selector.split(' > ')
-            if len(parts) > 1:
-                container_selector = ' > '.join(parts[:-1])
-                last_part = parts[-1]
-                
-                # Remove nth-of-type to make it match all items
-                import re
-                general_item_selector = re.sub(r':nth[-‐]of[-‐]type\(\d+\)', '', last_part)
-                if not general_item_selector or general_item_selector.strip() == '':
-                    general_item_selector = last_part.split(':')[0] if ':' in last_part else 'div'
-                    print(f"\n⚠️  Selector seems too generic: '{general_item_selector}'")
-                    
-                # Always ask for confirmation/improvement
-                print(f"\n📋 Generated repeating item selector: {general_item_selector}")
-                print("   This will be used to find ALL similar items")
-                better_selector = input("\nModify selector or press Enter to accept: ").strip()
-                if better_selector:
-                    general_item_selector = better_selector
-                
-                rules.container_selector = container_selector
-                rules.repeating_item_selector = general_item_selector
-                
-                # Store the full selector for making relative selectors later
-                self._last_item_selector = item_selector
-                self._generalized_item_selector = general_item_selector
-            else:
-                rules.repeating_item_selector = item_selector
-                self._last_item_selector = item_selector
-                self._generalized_item_selector = item_selector
-        
-        print(f"\n✅ Configuration complete:")
-        print(f"   Container: {getattr(rules, 'container_selector', None) or 'body'}")
-        print(f"   Item selector: {rules.repeating_item_selector}")
-        
-        # Clean up selector overlay
-        self._cleanup_interactive_selector()
-        
-        return True
-
-    def _configure_fields_interactive(self, context: str) -> Dict[str, str]:
-        """Configure fields using interactive selection"""
-        fields = {}
-        
-        print(f"\n💡 Now click on elements WITHIN a single {context} to extract data")
-        print("Click elements first, then I'll ask what to call them.")
-        print("Click 'Done' when finished selecting fields.")
-        
-        # Provide site-specific hints if we detect certain URLs
-        if hasattr(self, 'current_url') and self.current_url:
-            if 'gibsondunn.com/people' in self.current_url:
-                print("\n💡 For Gibson Dunn attorney cards, try clicking:")
-                print("   • Attorney name")
-                print("   • Title/position") 
-                print("   • Office location")
-                print("   • Practice areas")
-                print("   • Email/phone if visible")
-        
-        print()
-        
-        field_count = 0
-        while True:
-            field_count += 1
-            
-            # Let user select an element
-            if not self.interactive_scraper.inject_interactive_selector(f"Click field #{field_count} or Done"):
-                break
-            
-            # Wait for selection
-            field_data = None
-            for _ in range(60):  # 30 second timeout
-                time.sleep(0.5)
-                data = self.interactive_scraper.get_selected_element_data()
-                if data:
-                    field_data = data
-                    break
-            
-            if not field_data:
-                print("⚠️  No selection made")
-                break
-                
-            if field_data.get('done') or field_data == 'DONE_SELECTING':
-                print("✅ Done selecting fields")
-                break
-            
-            # Get the selector
-            selector = field_data.get('selector', '')
-            if not selector:
-                continue
-            
-            # Make selector relative to the repeating item if possible
-            original_selector = selector
-            if hasattr(self, '_last_item_selector') and self._last_item_selector:
-                # Try to make it relative to the actual clicked item
-                relative_selector = self._make_selector_relative(selector, self._last_item_selector)
-                
-                # If we have a generalized selector, adjust for that too
-                if hasattr(self, '_generalized_item_selector'):
-                    # The relative selector should work from the generalized item
-                    selector = relative_selector
-                    print(f"📍 Selected element within item: {relative_selector}")
-                else:
-                    if relative_selector != selector:
-                        selector = relative_selector
-                        print(f"📍 Relative to item: {relative_selector}")
-                    else:
-                        print(f"📍 Selected: {selector}")
-            else:
-                print(f"📍 Selected: {selector}")
-            
-            # Show what was selected
-            selected_text = field_data.get('text', '')[:50]
-            if selected_text:
-                print(f"   Text: '{selected_text}...'")
-            
-            # Ask what to call this field
-            print("\nWhat is this field?")
-            print("Common options: name, title, email, phone, location, department, bio")
-            field_name = input("Field name (or press Enter to skip): ").strip()
-            
-            if field_name:
-                fields[field_name] = selector
-                print(f"✅ Saved as '{field_name}'")
-            else:
-                print("⚠️  Skipped this selection")
-            
-            print("-" * 40)
-        
-        # Clean up selector overlay
-        self._cleanup_interactive_selector()
-        
-        if not fields:
-            print("\n⚠️  No fields configured!")
-        else:
-            print(f"\n✅ Configured {len(fields)} fields:")
-            for name, sel in fields.items():
-                print(f"   • {name}: {sel}")
-        
-        return fields
-    
-    def _make_selector_relative(self, field_selector: str, item_selector: str) -> str:
-        """Make a field selector relative to the repeating item selector"""
-        # If the field selector already looks relative, return as-is
-        if field_selector.startswith('.') or field_selector.startswith('#') or '>' not in field_selector:
-            return field_selector
-        
-        # Split both selectors into parts
-        field_parts = [p.strip() for p in field_selector.split('>')]
-        item_parts = [p.strip() for p in item_selector.split('>')]
-        
-        # Find where they diverge
-        common_length = 0
-        for i in range(min(len(field_parts), len(item_parts))):
-            if field_parts[i] == item_parts[i]:
-                common_length = i + 1
-            else:
-                break
-        
-        # If the field is within the item, make it relative
-        if common_length >= len(item_parts) - 1:
-            # Get the parts after the item selector
-            relative_parts = field_parts[common_length:]
-            if relative_parts:
-                return ' > '.join(relative_parts)
-        
-        # If we can't make it relative, try a simpler approach
-        # Just get the last meaningful part
-        last_part = field_parts[-1] if field_parts else field_selector
-        
-        # Clean up nth-of-type if it's there
-        import re
-        last_part = re.sub(r':nth-of-type\(\d+\)', '', last_part)
-        
-        return last_part.strip() or field_selector
-
-    def _configure_list_rules_manual(self, template: ScrapingTemplate) -> bool:
-        """Configure list rules manually for requests engine"""
-        rules = template.list_page_rules
-        
-        print("\n📝 Manual Configuration (Requests Engine)")
-        
-        # Repeating item selector
-        selector = input("Enter CSS selector for repeating items (e.g., '.person-card'): ").strip()
-        if not selector:
-            return False
-        rules.repeating_item_selector = selector
-        
-        # Fields
-        fields = {}
-        print("\n📝 Define fields to extract from each item:")
-        while True:
-            field_name = input("Field name (or Enter to finish): ").strip()
-            if not field_name:
-                break
-            
-            field_selector = input(f"CSS selector for {field_name}: ").strip()
-            if field_selector:
-                fields[field_name] = field_selector
-        
-        rules.fields = fields
-        
-        # Profile link for list+detail
-        if template.scraping_type == ScrapingType.LIST_DETAIL:
-            link_selector = input("CSS selector for detail page link: ").strip()
-            if link_selector:
-                rules.profile_link_selector = link_selector
-        
-        # Load strategy
-        load_strategy = self._configure_load_strategy()
-        rules.load_strategy = LoadStrategyConfig(**load_strategy)
-        
-        return True
-
-    def _configure_detail_rules(self, template: ScrapingTemplate) -> bool:
-        """Configure detail page rules"""
-        print(f"\n{Fore.CYAN}📄 Detail Page Configuration{Style.RESET_ALL}")
-        print("=" * 40)
-        
-        rules = template.detail_page_rules
-        
-        # Navigate to detail page if needed
-        if template.scraping_type == ScrapingType.LIST_DETAIL:
-            print("\n📄 Please navigate to a detail/article page first")
-            print("(You can click on any link from the list page)")
-            
-            if self.current_engine in ['selenium', 'playwright']:
-                print("\n🧹 Cleaning up selector overlay to allow normal navigation...")
-                self._cleanup_interactive_selector()
-            
-            input("Press Enter when you're on a detail page...")
-        
-        # Configure fields
-        if self.current_engine in ['selenium', 'playwright']:
-            fields = self._configure_fields_interactive("detail page")
-        else:
-            fields = self._configure_fields_manual("detail page")
-        
-        rules.fields = fields
-        
-        return True
-
-    def _configure_fields_manual(self, context: str) -> Dict[str, str]:
-        """Configure fields manually"""
-        fields = {}
-        print(f"\n📝 Define fields to extract from {context}:")
-        
-        while True:
-            field_name = input("Field name (or Enter to finish): ").strip()
-            if not field_name:
-                break
-            
-            field_selector = input(f"CSS selector for {field_name}: ").strip()
-            if field_selector:
-                fields[field_name] = field_selector
-        
-        return fields
-
-    def _configure_load_strategy(self) -> Dict[str, Any]:
-        """Configure load strategy"""
-        print(f"\n{Fore.CYAN}📄 Load Strategy Configuration:{Style.RESET_ALL}")
-        
-        strategies = {
-            "auto": "Auto-detect (try to find load more buttons)",
-            "button": "Click a specific button",
-            "scroll": "Infinite scroll",
-            "pagination": "Traditional pagination (next button)",
-            "none": "No dynamic loading"
-        }
-        
-        strategy_type = self._get_choice_input(
-            "How does the site load more content?",
-            strategies,
-            default="auto"
-        )
-        
-        config = {
-            "type": strategy_type,
-            "pause_time": 2.0,
-            "consecutive_failure_limit": 3,
-            "extended_wait_multiplier": 2.0
-        }
-        
-        if strategy_type == "button":
-            selector = input("Enter CSS selector for load more button: ").strip()
-            if selector:
-                config["button_selector"] = selector
-        elif strategy_type == "pagination":
-            selector = input("Enter CSS selector for next page button: ").strip()
-            if selector:
-                config["pagination_next_selector"] = selector
-        
-        return config
-
     def _configure_pattern_extraction(self) -> Optional[Dict[str, Any]]:
         """Configure pattern-based extraction"""
-        print(f"\n{Fore.CYAN}🔍 Configure Pattern-Based Extraction:{Style.RESET_ALL}")
-        print("=" * 40)
-        print("Pattern extraction can automatically find common data types without selectors.")
-        
-        enable = self._get_choice_input(
-            "Enable pattern-based extraction?",
-            {"y": "Yes (Recommended)", "n": "No"},
-            default="y"
-        )
-        
-        if enable != "y":
-            return None
+        self._emit(f"\n{Fore.CYAN}🔍 Configure Pattern-Based Extraction:{Style.RESET_ALL}")
+        self._emit("=" * 40)
+        self._emit("Pattern extraction can automatically find common data types without selectors.")
         
-        patterns = {}
         available_patterns = {
             "email": "Email addresses",
             "phone": "Phone numbers (US format)",
@@ -930,27 +522,27 @@ class UnifiedCLI:
             "bar_admission": "Bar admissions and licenses"
         }
         
-        print("\nSelect patterns to enable:")
-        for pattern, description in available_patterns.items():
-            enable = self._get_choice_input(
-                f"  Enable {pattern} extraction ({description})?",
-                {"y": "Yes", "n": "No"},
-                default="y" if pattern in ["email", "phone", "education"] else "n"
-            )
-            
-            if enable == "y":
-                patterns[pattern] = {
-                    "enabled": True,
-                    "context_keywords": self.pattern_extractor.patterns[pattern].context_keywords
-                }
+        enabled = self._get_toggle_input(
+            "Select patterns to enable (Recommended: keep the defaults):",
+            available_patterns,
+            defaults={"email", "phone", "education"}
+        )
+        
+        patterns = {
+            pattern: {
+                "enabled": True,
+                "context_keywords": self.pattern_extractor.patterns[pattern].context_keywords
+            }
+            for pattern in available_patterns if pattern in enabled
+        }
         
         return patterns if patterns else None
 
     def _configure_fallback_strategies(self) -> Dict[str, Any]:
         """Configure fallback selector strategies"""
-        print(f"\n{Fore.CYAN}🛡️  Configure Fallback Strategies:{Style.RESET_ALL}")
-        print("=" * 40)
-        print("Fallback strategies help find elements when primary selectors fail.")
+        self._emit(f"\n{Fore.CYAN}🛡️  Configure Fallback Strategies:{Style.RESET_ALL}")
+        self._emit("=" * 40)
+        self._emit("Fallback strategies help find elements when primary selectors fail.")
         
         strategies = {
             "text_based_selection": "Find elements by their text content",
@@ -958,48 +550,59 @@ class UnifiedCLI:
             "pattern_matching_primary": "Use pattern extraction as primary method"
         }
         
-        config = {}
-        for strategy, description in strategies.items():
-            enable = self._get_choice_input(
-                f"Enable {description}?",
-                {"y": "Yes", "n": "No"},
-                default="y"
-            )
-            config[strategy] = (enable == "y")
+        enabled = self._get_toggle_input(
+            "Select strategies to enable:",
+            strategies,
+            defaults=set(strategies)
+        )
+        
+        return {strategy: strategy in enabled for strategy in strategies}
+
+    def _get_template_name(self, prompt: str, default: Optional[str] = None) -> Optional[str]:
+        """Read a template name, normalising spaces and dashes to underscores"""
+        for _ in range(MAX_CHOICE_ATTEMPTS):
+            name = input(prompt).strip()
+            if not name:
+                return default
+            if not _TEMPLATE_NAME_INVALID_RE.search(name):
+                return name.translate(_TEMPLATE_NAME_TRANSLATION)
+            self.ux.print_error("Template names may only contain letters, numbers, spaces, '-' and '_'")
         
-        return config
+        return default
 
-    def _save_template(self, template_dict: Dict[str, Any], engine: str):
+    def _save_template(self, template: ScrapingTemplate, engine: str):
         """Save the template to file"""
         print(f"\n{Fore.CYAN}💾 Save Template{Style.RESET_ALL}")
         
-        template_name = input("💾 Enter template name (letters, numbers, underscores only): ").strip()
-        if not template_name:
-            template_name = "my_template"
-        
-        # Clean template name
-        template_name = template_name.replace(" ", "_").replace("-", "_")
-        template_dict['name'] = f"{template_name}_{engine}"
+        template_name = self._get_template_name(
+            "💾 Enter template name (letters, numbers, underscores only): ",
+            default="my_template"
+        )
+        template.name = f"{template_name}_{engine}"
         
-        template_path = self.config.TEMPLATES_DIR / f"{template_dict['name']}.json"
+        templates_dir = self.config.TEMPLATES_DIR
+        template_path = templates_dir / f"{template.name}.json"
         
-        # Check if file exists
-        if template_path.exists():
+        # Check if file exists, asking again until the name is free or overwrite is confirmed
+        while template_path.is_file():
             overwrite = self._get_choice_input(
-                f"Template '{template_name}' already exists. Overwrite?",
-                {"y": "Yes", "n": "No"},
-                default="n"
+                f"Template '{template.name}' already exists. Overwrite?",
+                YES_NO_CHOICES,
+                default="n",
+                pre_rendered=YES_NO_MENU
             )
-            if overwrite != "y":
-                new_name = input("Enter new template name: ").strip()
-                if new_name:
-                    template_dict['name'] = f"{new_name}_{engine}"
-                    template_path = self.config.TEMPLATES_DIR / f"{template_dict['name']}.json"
+            if overwrite == "y":
+                break
+            new_name = self._get_template_name("Enter new template name: ")
+            if not new_name:
+                break
+            template.name = f"{new_name}_{engine}"
+            template_path = templates_dir / f"{template.name}.json"
         
         # Save template
         try:
-            with open(template_path, 'w', encoding='utf-8') as f:
-                json.dump(template_dict, f, indent=2, ensure_ascii=False)
+            template_dict = template.to_dict()
+            write_json(template_path, template_dict)
             
             self.ux.print_success(f"Template saved successfully to: {template_path}")
             self._display_template_summary(template_dict)
@@ -1011,39 +614,44 @@ class UnifiedCLI:
 
     def _display_template_summary(self, template: Dict[str, Any]):
         """Display comprehensive template summary"""
-        print(f"\n{Fore.CYAN}📊 Template Summary:{Style.RESET_ALL}")
-        print("=" * 40)
-        print(f"  - Name: {template['name']}")
-        print(f"  - Version: {template.get('version', '1.0')}")
-        print(f"  - Engine: {template.get('engine', 'selenium')}")
-        print(f"  - Type: {template['scraping_type']}")
-        
-        if template.get('list_page_rules'):
-            rules = template['list_page_rules']
-            print(f"  - List fields: {len(rules.get('fields', {}))}")
-            print(f"  - Load strategy: {rules.get('load_strategy', {}).get('type', 'none')}")
-        
-        if template.get('detail_page_rules'):
-            rules = template['detail_page_rules']
-            print(f"  - Detail fields: {len(rules.get('fields', {}))}")
-        
-        if template.get('extraction_patterns'):
-            print(f"  - Pattern extraction: {len(template['extraction_patterns'])} patterns enabled")
-        
-        if template.get('rate_limiting', {}).get('enabled'):
-            print(f"  - Rate limiting: {template['rate_limiting']['preset']}")
-
-    def _cleanup_interactive_selector(self):
-        """Clean up interactive selector overlay"""
-        if self.current_engine not in ['selenium', 'playwright']:
-            return
-        
-        try:
-            # Use the unified scraper's cleanup method
-            self.interactive_scraper.cleanup_interactive_selector()
-                
-        except Exception as e:
-            logging.error(f"Failed to cleanup interactive selector: {e}")
+        list_rules = template.get('list_page_rules') or {}
+        detail_rules = template.get('detail_page_rules') or {}
+        patterns = template.get('extraction_patterns') or {}
+        rate = template.get('rate_limiting') or {}
+        fallbacks = template.get('fallback_strategies') or {}
+        
+        self._emit(f"\n{Fore.CYAN}📊 Template Summary:{Style.RESET_ALL}")
+        self._emit("=" * 40)
+        self._emit(f"  - Name: {template['name']}")
+        self._emit(f"  - Version: {template.get('version', '1.0')}")
+        self._emit(f"  - Engine: {template.get('engine', 'selenium')}")
+        self._emit(f"  - Type: {template['scraping_type']}")
+        
+        if list_rules:
+            load_strategy = list_rules.get('load_strategy') or {}
+            self._emit(f"  - List fields: {len(list_rules.get('fields') or {})}")
+            self._emit(f"  - Load strategy: {load_strategy.get('type', 'none')}")
+        
+        if detail_rules:
+            self._emit(f"  - Detail fields: {len(detail_rules.get('fields') or {})}")
+        
+        if patterns:
+            self._emit(f"  - Pattern extraction: {len(patterns)} patterns enabled")
+        
+        if rate.get('enabled'):
+            self._emit(f"  - Rate limiting: {rate.get('preset')}")
+        
+        label_hints = (detail_rules.get('advanced_selectors') or {}).get('use_text_content')
+        features = [name for enabled, name in (
+            (patterns, "pattern extraction"),
+            (rate.get('enabled'), "rate limiting"),
+            (fallbacks.get('text_based_selection'), "text-based fallback"),
+            (fallbacks.get('proximity_selection'), "proximity fallback"),
+            (fallbacks.get('pattern_matching_primary'), "pattern-first matching"),
+            (label_hints, "field label hints"),
+        ) if enabled]
+        self._emit(f"  - Features: {', '.join(features) if features else 'none'}")
+        self._flush()
 
     def _apply_template_flow(self):
         """Apply existing template flow"""
@@ -1090,8 +698,7 @@ class UnifiedCLI:
         
         for template_file in templates_dir.glob("*.json"):
             try:
-                with open(template_file, 'r') as f:
-                    template_data = json.load(f)
+                template_data = read_json(template_file)
                 
                 templates.append({
                     'file': template_file.name,
@@ -1136,8 +743,7 @@ class UnifiedCLI:
             self.ux.print_success("Loading template - Done!")
 
             # Load template data to determine the engine
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_data = json.load(f)
+            template_data = read_json(template_path)
             engine = template_data.get('engine', 'selenium')  # Default to selenium
             self.ux.print_info(f"Template requires '{engine}' engine.")
 
@@ -1147,12 +753,17 @@ class UnifiedCLI:
 
             # Apply template
             self.ux.print_info("Applying template...")
-            result = scraper.apply_template(template_path, export_formats)
-
-            # Display results
-            self._display_scraping_results(result)
-
-            scraper.close()
+            result = None
+            try:
+                result = scraper.apply_template(template_path, export_formats)
+            finally:
+                # Closing waits for the background exports, so the files exist before we report them;
+                # the browser is released even if scraping failed, and a teardown error never hides results
+                try:
+                    scraper.close()
+                finally:
+                    if result is not None:
+                        self._display_scraping_results(result)
             
         except Exception as e:
             self.ux.print_error(f"Error running template: {e}")
@@ -1282,20 +893,59 @@ class UnifiedCLI:
         
         print("\nTo modify settings, edit the configuration files or environment variables.")
 
-    def _get_choice_input(self, prompt: str, options: Dict[str, str], default: str = None) -> Optional[str]:
-        """Get user choice from options"""
-        print(f"\n{prompt}")
-        for key, desc in options.items():
-            print(f"  {key}: {desc}")
+    def _get_choice_input(self, prompt: str, options: Dict[str, str], default: str = None,
+                          pre_rendered: Optional[str] = None) -> Optional[str]:
+        """Get user choice from options, optionally using a menu rendered ahead of time"""
+        self._emit(f"\n{prompt}")
+        self._emit(pre_rendered if pre_rendered is not None else _render_menu(options))
+        self._flush()
         
+        keys = '/'.join(options)
         if default:
-            choice = input(f"Choose [{'/'.join(options.keys())}] (default: {default}): ").strip()
+            choice = input(f"Choose [{keys}] (default: {default}): ").strip()
             return choice if choice else default
         else:
-            choice = input(f"Choose [{'/'.join(options.keys())}]: ").strip()
+            choice = input(f"Choose [{keys}]: ").strip()
             return choice if choice in options else None
 
 
+    def _get_toggle_input(self, prompt: str, options: Dict[str, str], defaults: set) -> set:
+        """Get a set of enabled options from a single numbered checklist prompt"""
+        keys = list(options)
+        self._emit(f"\n{prompt}")
+        for number, key in enumerate(keys, 1):
+            mark = "x" if key in defaults else " "
+            self._emit(f"  {number}) [{mark}] {key}: {options[key]}")
+        
+        self._emit("Press Enter to accept defaults, 'none' to disable all,")
+        self._emit("'+3,-phone' to adjust, or '1,2,4' to pick exactly those options.")
+        self._flush()
+        raw = input("Options: ").strip()
+        if not raw:
+            return set(defaults)
+        if raw.lower() == "none":
+            return set()
+        
+        tokens = [token.strip() for token in raw.split(",") if token.strip()]
+        if all(token[0] in "+-" for token in tokens):
+            enabled = set(defaults)
+        else:
+            enabled = set()
+        
+        for token in tokens:
+            name = token.lstrip("+-").strip()
+            if name.isdigit() and 1 <= int(name) <= len(keys):
+                name = keys[int(name) - 1]
+            if name not in options:
+                self.ux.print_warning(f"Unknown option ignored: {name}")
+                continue
+            if token.startswith("-"):
+                enabled.discard(name)
+            else:
+                enabled.add(name)
+        
+        return enabled
+
 def main():
     """Main entry point"""
     # Set up logging
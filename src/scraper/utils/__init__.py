@@ -4,7 +4,10 @@ from .selectors import (
     normalize_selector,
     generalize_selector,
     make_relative_selector,
-    validate_selector
+    remove_nth_of_type,
+    compile_css_selector,
+    validate_selector,
+    count_matches
 )
 from .retry import (
     retry_on_exception,
@@ -17,7 +20,10 @@ __all__ = [
     'normalize_selector',
     'generalize_selector',
     'make_relative_selector',
+    'remove_nth_of_type',
+    'compile_css_selector',
     'validate_selector',
+    'count_matches',
     'retry_on_exception',
     'retry_with_refresh',
     'wait_and_retry',
@@ -0,0 +1,134 @@
+# src/scraper/utils/file_io.py
+"""
+File writing helpers for templates and other JSON documents.
+"""
+
+import json
+import math
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Process umask, read once at import: os.umask() can only be queried by
+# setting it, which would race with files created on export threads
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def dump_json_bytes(data: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize data to UTF-8 encoded, pretty-printed JSON (compact when indent is None).
+
+    Uses orjson when it is installed and the requested indent is one it
+    supports, falling back to the standard library otherwise.
+
+    Args:
+        data: JSON-serializable object
+        indent: Indentation width, or None for a single line
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib encoder handle them
+            pass
+    try:
+        return json.dumps(data, indent=indent, ensure_ascii=False, allow_nan=False).encode('utf-8')
+    except ValueError:
+        # NaN/Infinity are not JSON; write null for them, as orjson does
+        return json.dumps(_finite(data), indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def _finite(data: Any) -> Any:
+    """Copy of data with non-finite floats replaced by None"""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+
+def read_json(filepath: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file in one read, using orjson when installed.
+
+    Args:
+        filepath: Path of the JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    payload = Path(filepath).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _target_mode(filepath: Path) -> int:
+    """Permission bits for a rewritten file: the existing file's, else 0o666 minus the umask"""
+    try:
+        return stat.S_IMODE(filepath.stat().st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def write_json(filepath: Union[str, Path], data: Any, indent: int = 2,
+               skip_unchanged: bool = False) -> Path:
+    """
+    Write JSON to a file with a single buffered write and an atomic replace.
+
+    The document is serialized up front, written to a temporary file in the
+    target directory, fsynced and then renamed over the destination, so a
+    crash mid-save never leaves a truncated template behind.
+
+    Args:
+        filepath: Destination path
+        data: JSON-serializable object
+        indent: Indentation width
+        skip_unchanged: Leave the file alone if it already holds these exact bytes
+
+    Returns:
+        Path of the written file
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    payload = dump_json_bytes(data, indent)
+
+    if skip_unchanged:
+        try:
+            if filepath.read_bytes() == payload:
+                return filepath
+        except OSError:
+            pass
+
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file 0600; give it the mode a plain open() would have
+        os.chmod(tmp_path, _target_mode(filepath))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return filepath
@@ -10,6 +10,12 @@ from typing import Optional, Tuple, List, Dict, Any, Union
 from urllib.parse import urlparse
 from pathlib import Path
 
+try:
+    import soupsieve
+    SOUPSIEVE_AVAILABLE = True
+except ImportError:
+    SOUPSIEVE_AVAILABLE = False
+
 
 class InputValidator:
     """Centralized input validation for user prompts"""
@@ -103,9 +109,16 @@ class InputValidator:
         
         selector = selector.strip()
         
-        if selector_type == 'css':
-            # Basic CSS selector validation
-            invalid_chars = ['<', '>', '{', '}', '|', '\\']
+        if selector_type == 'css' and SOUPSIEVE_AVAILABLE:
+            # Parse with the same engine BeautifulSoup uses
+            try:
+                soupsieve.compile(selector)
+            except soupsieve.SelectorSyntaxError as e:
+                return False, f"Invalid CSS selector: {str(e).splitlines()[0]}"
+        
+        elif selector_type == 'css':
+            # Basic CSS selector validation ('>' is the child combinator)
+            invalid_chars = ['<', '{', '}', '\\']
             for char in invalid_chars:
                 if char in selector:
                     return False, f"Invalid character in CSS selector: {char}"
@@ -647,6 +660,43 @@ def get_validated_field_name(prompt: str = "Enter field name: ",
     )
 
 
+def get_validated_selector(prompt: str = "CSS selector: ",
+                           allow_empty: bool = True,
+                           max_attempts: int = 3) -> Optional[str]:
+    """
+    Get and validate a CSS selector from user, re-prompting in place on typos.
+    
+    Args:
+        prompt: Prompt message
+        allow_empty: Whether an empty answer (skip) is accepted
+        max_attempts: Maximum attempts
+        
+    Returns:
+        Valid selector, empty string if skipped, or None
+    """
+    validator = InputValidator()
+    error_handler = ErrorHandler()
+    
+    def get_selector():
+        response = input(prompt).strip()
+        
+        if not response:
+            if allow_empty:
+                return response
+            raise ValueError("Selector cannot be empty")
+        
+        is_valid, error = validator.validate_selector(response)
+        if not is_valid:
+            raise ValueError(error)
+        return response
+    
+    return error_handler.wrap_input_operation(
+        get_selector,
+        context="selector input",
+        max_attempts=max_attempts
+    )
+
+
 def get_validated_choice(prompt: str,
                         choices: Dict[str, str],
                         default: str = None,
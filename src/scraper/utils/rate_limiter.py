@@ -11,7 +11,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque
 from threading import Lock
-from functools import wraps
+from functools import lru_cache, wraps
+from urllib.parse import urlparse
+
+# Token fractions are counted in units of 1e-12 so refills stay exact integers
+_TOKEN_UNITS = 1_000_000 * 1_000_000
 
 
 @dataclass
@@ -26,6 +30,63 @@ class RateLimitConfig:
     max_retries: int = 3
 
 
+@lru_cache(maxsize=1024)
+def _domain_of(url: str) -> str:
+    """Lower-cased network location of a URL"""
+    return urlparse(url).netloc.lower()
+
+
+class _TokenBucket:
+    """
+    Token bucket refilled with integer arithmetic, so long runs don't drift.
+    
+    The fill rate is held in tokens per million seconds and elapsed time in
+    whole microseconds; the remainder of every refill carries over to the next.
+    Not thread-safe on its own: callers hold their lock.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.capacity = capacity
+        self._fill_rate = max(1, round(rate * 1_000_000))
+        self.reset()
+    
+    def reset(self):
+        """Fill the bucket"""
+        self.tokens = self.capacity
+        self._leftover = 0
+        self._last_ns = time.monotonic_ns()
+    
+    def refill(self):
+        """Add the tokens earned since the last refill"""
+        now = time.monotonic_ns()
+        if self.tokens >= self.capacity:
+            # A full bucket earns nothing
+            self._last_ns = now
+            return
+        
+        us_past = (now - self._last_ns) // 1000
+        # Advance by whole microseconds only, keeping the sub-microsecond rest
+        self._last_ns += us_past * 1000
+        scaled = self._fill_rate * us_past + self._leftover
+        self.tokens += scaled // _TOKEN_UNITS
+        self._leftover = scaled % _TOKEN_UNITS
+        
+        if self.tokens >= self.capacity:
+            self.tokens = self.capacity
+            self._leftover = 0
+    
+    def wait_time(self) -> float:
+        """Seconds until a whole token is available, 0 if one already is"""
+        if self.tokens > 0:
+            return 0.0
+        needed_us = -(-(_TOKEN_UNITS - self._leftover) // self._fill_rate)
+        return needed_us / 1_000_000
+    
+    def level(self) -> float:
+        """Current number of tokens, including the partial one"""
+        return self.tokens + self._leftover / _TOKEN_UNITS
+
+
 class RateLimiter:
     """
     Thread-safe rate limiter with multiple time windows and burst support.
@@ -41,13 +102,10 @@ class RateLimiter:
         self._minute_requests = deque()
         self._hour_requests = deque()
         
-        # Calculate minimum delay between requests
-        self._min_delay = 1.0 / self.config.requests_per_second
         self._last_request_time = 0
         
         # Burst bucket
-        self._burst_tokens = self.config.burst_size
-        self._last_refill = time.time()
+        self._bucket = _TokenBucket(self.config.requests_per_second, self.config.burst_size)
         
         # Statistics
         self.stats = {
@@ -56,23 +114,9 @@ class RateLimiter:
             'average_delay': 0
         }
     
-    def _refill_burst_tokens(self):
-        """Refill burst tokens based on elapsed time"""
-        now = time.time()
-        elapsed = now - self._last_refill
-        
-        # Refill tokens based on rate
-        tokens_to_add = elapsed * self.config.requests_per_second
-        self._burst_tokens = min(
-            self.config.burst_size,
-            self._burst_tokens + tokens_to_add
-        )
-        
-        self._last_refill = now
-    
     def _clean_old_requests(self):
         """Remove old request timestamps"""
-        now = time.time()
+        now = time.monotonic()
         
         # Clean per-minute tracking
         if self.config.requests_per_minute:
@@ -86,6 +130,73 @@ class RateLimiter:
             while self._hour_requests and self._hour_requests[0] < hour_ago:
                 self._hour_requests.popleft()
     
+    def _try_acquire(self) -> Optional[float]:
+        """
+        Take a request slot if one is free.
+        
+        Returns:
+            None if permission was granted, otherwise the time to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._clean_old_requests()
+            self._bucket.refill()
+            
+            # Check per-second rate; the wait is exactly until the next whole token
+            wait_time = self._bucket.wait_time()
+            can_proceed = wait_time == 0
+            
+            # Check per-minute rate
+            if self.config.requests_per_minute:
+                if len(self._minute_requests) >= self.config.requests_per_minute:
+                    # Wait until oldest request expires
+                    wait_time = max(
+                        wait_time,
+                        60 - (now - self._minute_requests[0])
+                    )
+                    can_proceed = False
+            
+            # Check per-hour rate
+            if self.config.requests_per_hour:
+                if len(self._hour_requests) >= self.config.requests_per_hour:
+                    # Wait until oldest request expires
+                    wait_time = max(
+                        wait_time,
+                        3600 - (now - self._hour_requests[0])
+                    )
+                    can_proceed = False
+            
+            if can_proceed:
+                # Consume a burst token
+                self._bucket.tokens -= 1
+                
+                # Record request
+                self._request_times.append(now)
+                self._minute_requests.append(now)
+                self._hour_requests.append(now)
+                
+                # Update stats
+                self.stats['total_requests'] += 1
+                
+                # Calculate average delay
+                if len(self._request_times) > 1:
+                    delays = [
+                        self._request_times[i] - self._request_times[i-1]
+                        for i in range(1, len(self._request_times))
+                    ]
+                    self.stats['average_delay'] = sum(delays) / len(delays)
+                
+                return None
+            
+            return wait_time
+    
+    def _timed_out(self, start_time: float, wait_time: float, timeout: Optional[float]) -> bool:
+        """Check whether waiting wait_time more would exceed the timeout"""
+        if timeout is not None and time.monotonic() - start_time + wait_time > timeout:
+            self.stats['rate_limited'] += 1
+            return True
+        return False
+    
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
         Acquire permission to make a request.
@@ -96,88 +207,55 @@ class RateLimiter:
         Returns:
             True if permission granted, False if timeout
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         while True:
-            with self._lock:
-                now = time.time()
-                self._clean_old_requests()
-                self._refill_burst_tokens()
-                
-                # Check rate limits
-                can_proceed = True
-                wait_time = 0
-                
-                # Check per-second rate
-                if self._burst_tokens < 1:
-                    # Need to wait for token refill
-                    wait_time = max(wait_time, self._min_delay)
-                    can_proceed = False
-                
-                # Check per-minute rate
-                if self.config.requests_per_minute:
-                    if len(self._minute_requests) >= self.config.requests_per_minute:
-                        # Wait until oldest request expires
-                        wait_time = max(
-                            wait_time,
-                            60 - (now - self._minute_requests[0])
-                        )
-                        can_proceed = False
-                
-                # Check per-hour rate
-                if self.config.requests_per_hour:
-                    if len(self._hour_requests) >= self.config.requests_per_hour:
-                        # Wait until oldest request expires
-                        wait_time = max(
-                            wait_time,
-                            3600 - (now - self._hour_requests[0])
-                        )
-                        can_proceed = False
-                
-                if can_proceed:
-                    # Consume a burst token
-                    self._burst_tokens -= 1
-                    
-                    # Record request
-                    self._request_times.append(now)
-                    self._minute_requests.append(now)
-                    self._hour_requests.append(now)
-                    
-                    # Update stats
-                    self.stats['total_requests'] += 1
-                    
-                    # Calculate average delay
-                    if len(self._request_times) > 1:
-                        delays = [
-                            self._request_times[i] - self._request_times[i-1]
-                            for i in range(1, len(self._request_times))
-                        ]
-                        self.stats['average_delay'] = sum(delays) / len(delays)
-                    
-                    return True
+            wait_time = self._try_acquire()
+            if wait_time is None:
+                return True
             
             # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed + wait_time > timeout:
-                    self.stats['rate_limited'] += 1
-                    return False
+            if self._timed_out(start_time, wait_time, timeout):
+                return False
             
             # Wait before retrying
             self.logger.debug(f"Rate limited, waiting {wait_time:.2f}s")
             time.sleep(min(wait_time, 0.1))  # Check frequently for better responsiveness
     
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire permission without blocking the event loop.
+        
+        Args:
+            timeout: Maximum time to wait for permission
+            
+        Returns:
+            True if permission granted, False if timeout
+        """
+        start_time = time.monotonic()
+        
+        while True:
+            wait_time = self._try_acquire()
+            if wait_time is None:
+                return True
+            
+            if self._timed_out(start_time, wait_time, timeout):
+                return False
+            
+            self.logger.debug(f"Rate limited, waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+    
     def get_current_rates(self) -> Dict[str, float]:
         """Get current request rates"""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             self._clean_old_requests()
             
             rates = {
                 'per_second': len([t for t in self._request_times if now - t < 1]),
                 'per_minute': len(self._minute_requests),
                 'per_hour': len(self._hour_requests),
-                'burst_tokens': self._burst_tokens
+                'burst_tokens': self._bucket.level()
             }
             
             return rates
@@ -188,8 +266,7 @@ class RateLimiter:
             self._request_times.clear()
             self._minute_requests.clear()
             self._hour_requests.clear()
-            self._burst_tokens = self.config.burst_size
-            self._last_refill = time.time()
+            self._bucket.reset()
     
     def __enter__(self):
         """Context manager entry"""
@@ -204,52 +281,78 @@ class RateLimiter:
 class DomainRateLimiter:
     """
     Rate limiter that tracks limits per domain.
+    
+    Limiters are spread over independently locked shards, so workers
+    hitting different domains never wait on each other; looking up an
+    existing limiter takes no lock at all.
     """
     
+    SHARD_COUNT = 16
+    
     def __init__(self, default_config: RateLimitConfig = None):
         self.default_config = default_config or RateLimitConfig()
-        self.domain_limiters: Dict[str, RateLimiter] = {}
         self.domain_configs: Dict[str, RateLimitConfig] = {}
-        self._lock = Lock()
+        self._shards = [(Lock(), {}) for _ in range(self.SHARD_COUNT)]
         self.logger = logging.getLogger(f'{__name__}.DomainRateLimiter')
     
+    @property
+    def domain_limiters(self) -> Dict[str, RateLimiter]:
+        """Snapshot of every domain's limiter"""
+        limiters = {}
+        for lock, shard in self._shards:
+            with lock:
+                limiters.update(shard)
+        return limiters
+    
+    def _shard(self, domain: str):
+        """The (lock, limiters) shard that owns a domain"""
+        return self._shards[hash(domain) % self.SHARD_COUNT]
+    
     def set_domain_config(self, domain: str, config: RateLimitConfig):
         """Set specific rate limit configuration for a domain"""
-        with self._lock:
+        lock, shard = self._shard(domain)
+        with lock:
             self.domain_configs[domain] = config
             # Reset existing limiter if any
-            if domain in self.domain_limiters:
-                del self.domain_limiters[domain]
+            shard.pop(domain, None)
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
+        return _domain_of(url)
     
     def get_limiter(self, url: str) -> RateLimiter:
         """Get rate limiter for specific domain"""
         domain = self._get_domain(url)
+        lock, shard = self._shard(domain)
         
-        with self._lock:
-            if domain not in self.domain_limiters:
+        # Fast path: dict reads are atomic, so existing limiters need no lock
+        limiter = shard.get(domain)
+        if limiter is not None:
+            return limiter
+        
+        with lock:
+            if domain not in shard:
                 config = self.domain_configs.get(domain, self.default_config)
-                self.domain_limiters[domain] = RateLimiter(config)
+                shard[domain] = RateLimiter(config)
             
-            return self.domain_limiters[domain]
+            return shard[domain]
     
     def acquire(self, url: str, timeout: Optional[float] = None) -> bool:
         """Acquire permission to make request to URL"""
         limiter = self.get_limiter(url)
         return limiter.acquire(timeout)
     
+    async def acquire_async(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Acquire permission to make request to URL, sleeping cooperatively"""
+        limiter = self.get_limiter(url)
+        return await limiter.acquire_async(timeout)
+    
     def get_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all domains"""
-        with self._lock:
-            return {
-                domain: limiter.stats
-                for domain, limiter in self.domain_limiters.items()
-            }
+        return {
+            domain: limiter.stats
+            for domain, limiter in self.domain_limiters.items()
+        }
 
 
 class AsyncRateLimiter:
@@ -264,38 +367,26 @@ class AsyncRateLimiter:
         # Async lock
         self._lock = asyncio.Lock()
         self._request_times = deque()
-        self._burst_tokens = self.config.burst_size
-        self._last_refill = time.time()
+        self._bucket = _TokenBucket(self.config.requests_per_second, self.config.burst_size)
     
     async def acquire(self, timeout: Optional[float] = None) -> bool:
         """Acquire permission to make a request (async)"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         while True:
             async with self._lock:
-                now = time.time()
-                
-                # Refill tokens
-                elapsed = now - self._last_refill
-                tokens_to_add = elapsed * self.config.requests_per_second
-                self._burst_tokens = min(
-                    self.config.burst_size,
-                    self._burst_tokens + tokens_to_add
-                )
-                self._last_refill = now
+                self._bucket.refill()
                 
                 # Check if we can proceed
-                if self._burst_tokens >= 1:
-                    self._burst_tokens -= 1
-                    self._request_times.append(now)
+                wait_time = self._bucket.wait_time()
+                if wait_time == 0:
+                    self._bucket.tokens -= 1
+                    self._request_times.append(time.monotonic())
                     return True
-                
-                # Calculate wait time
-                wait_time = (1 - self._burst_tokens) / self.config.requests_per_second
             
             # Check timeout
             if timeout is not None:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed + wait_time > timeout:
                     return False
             
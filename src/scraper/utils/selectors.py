@@ -4,9 +4,66 @@ CSS selector manipulation and generation utilities.
 """
 
 import re
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Optional, List, Tuple, Any
 
+try:
+    import soupsieve
+    SOUPSIEVE_AVAILABLE = True
+except ImportError:
+    SOUPSIEVE_AVAILABLE = False
 
+
+# Unicode dash replacements
+_DASH_TRANSLATION = str.maketrans({
+    '\u2010': '-',  # Hyphen
+    '\u2011': '-',  # Non-breaking hyphen
+    '\u2012': '-',  # Figure dash
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2015': '-',  # Horizontal bar
+    '\u2212': '-',  # Minus sign
+})
+
+# Positional pseudo-classes and numeric indices, removed in a single pass
+_POSITIONAL_RE = re.compile(
+    r':nth-(?:of-type|child)\(\s*\d+\s*\)'
+    r'|\[\s*\d+\s*\]'
+    r'|:(?:first|last|only)-(?:child|of-type)'
+)
+
+# :nth-of-type(n), tolerating the Unicode hyphen some pages emit
+_NTH_OF_TYPE_RE = re.compile(r':nth[-\u2010]of[-\u2010]type\(\s*\d+\s*\)')
+
+# Child combinator with optional surrounding whitespace
+_CHILD_SPLIT_RE = re.compile(r'\s*>\s*')
+
+# Tag path from <body> down to the element, with :nth-of-type where a tag
+# repeats among siblings; built in the page so the walk is one WebDriver call
+_ELEMENT_PATH_JS = """
+const parts = [];
+for (let el = arguments[0]; el && el.parentElement && el.tagName.toLowerCase() !== 'html'; el = el.parentElement) {
+    const tag = el.tagName.toLowerCase();
+    const sameTag = Array.from(el.parentElement.children).filter(c => c.tagName === el.tagName);
+    parts.unshift(sameTag.length > 1 ? `${tag}:nth-of-type(${sameTag.indexOf(el) + 1})` : tag);
+}
+return parts.join(' > ');
+"""
+
+# Match count computed in the page instead of shipping every element handle back
+_COUNT_MATCHES_JS = "return (arguments[1] || document).querySelectorAll(arguments[0]).length;"
+
+# (pattern, replacement) pairs applied in order by css_to_xpath
+_CSS_TO_XPATH_SUBS = (
+    (re.compile(r'#([a-zA-Z][\w-]*)'), r'[@id="\1"]'),
+    (re.compile(r'\.([a-zA-Z][\w-]*)'), r'[contains(@class, "\1")]'),
+    (re.compile(r'\[([a-zA-Z][\w-]*)\]'), r'[@\1]'),
+    (re.compile(r'\[([a-zA-Z][\w-]*)="([^"]+)"\]'), r'[@\1="\2"]'),
+    (re.compile(r'\[([a-zA-Z][\w-]*)=\'([^\']+)\'\]'), r'[@\1="\2"]'),
+)
+
+
+@lru_cache(maxsize=4096)
 def normalize_selector(selector: str) -> str:
     """
     Normalize Unicode characters and clean up CSS selector.
@@ -20,26 +77,13 @@ def normalize_selector(selector: str) -> str:
     if not selector:
         return selector
     
-    # Unicode dash replacements
-    replacements = {
-        '\u2010': '-',  # Hyphen
-        '\u2011': '-',  # Non-breaking hyphen
-        '\u2012': '-',  # Figure dash
-        '\u2013': '-',  # En dash
-        '\u2014': '-',  # Em dash
-        '\u2015': '-',  # Horizontal bar
-        '\u2212': '-',  # Minus sign
-    }
-    
-    for old, new in replacements.items():
-        selector = selector.replace(old, new)
+    selector = selector.translate(_DASH_TRANSLATION)
     
     # Remove extra whitespace
-    selector = ' '.join(selector.split())
-    
-    return selector
+    return ' '.join(selector.split())
 
 
+@lru_cache(maxsize=4096)
 def generalize_selector(selector: str) -> str:
     """
     Remove specific indices and nth-of-type from selector to make it more general.
@@ -53,23 +97,44 @@ def generalize_selector(selector: str) -> str:
     if not selector:
         return selector
     
-    selector = normalize_selector(selector)
-    
-    # Remove :nth-of-type(...) patterns
-    selector = re.sub(r':nth-of-type\(\s*\d+\s*\)', '', selector)
+    selector = _POSITIONAL_RE.sub('', normalize_selector(selector))
     
-    # Remove :nth-child(...) patterns
-    selector = re.sub(r':nth-child\(\s*\d+\s*\)', '', selector)
+    # Collapse multiple spaces
+    return ' '.join(selector.split())
+
+
+@lru_cache(maxsize=512)
+def compile_css_selector(selector: str) -> Optional[Any]:
+    """
+    Compile a CSS selector for repeated use against BeautifulSoup trees.
     
-    # Remove numeric indices in brackets
-    selector = re.sub(r'\[\s*\d+\s*\]', '', selector)
+    Args:
+        selector: CSS selector
+        
+    Returns:
+        Compiled soupsieve selector, or None if soupsieve is unavailable or
+        the selector is invalid (callers fall back to Tag.select)
+    """
+    if not SOUPSIEVE_AVAILABLE or not selector:
+        return None
     
-    # Remove :first-child, :last-child, etc.
-    selector = re.sub(r':(first|last|only)-child', '', selector)
-    selector = re.sub(r':(first|last|only)-of-type', '', selector)
+    try:
+        return soupsieve.compile(selector)
+    except (soupsieve.SelectorSyntaxError, TypeError, ValueError):
+        return None
+
+
+def remove_nth_of_type(selector: str) -> str:
+    """
+    Remove :nth-of-type(n) pseudo-classes so a selector matches all siblings.
     
-    # Collapse multiple spaces
-    return ' '.join(selector.split())
+    Args:
+        selector: CSS selector
+        
+    Returns:
+        Selector without :nth-of-type(...) parts
+    """
+    return _NTH_OF_TYPE_RE.sub('', selector)
 
 
 def make_relative_selector(absolute_selector: str, container_selector: str) -> str:
@@ -87,8 +152,7 @@ def make_relative_selector(absolute_selector: str, container_selector: str) -> s
     cont_sel = generalize_selector(container_selector)
     
     # Split selectors by child combinator
-    abs_parts = [part.strip() for part in abs_sel.split('>')]
-    cont_parts = [part.strip() for part in cont_sel.split('>')]
+    abs_parts = _CHILD_SPLIT_RE.split(abs_sel)
     
     # Find where container ends in absolute selector
     for i in range(len(abs_parts)):
@@ -116,6 +180,19 @@ def make_relative_selector(absolute_selector: str, container_selector: str) -> s
     return abs_sel
 
 
+def split_child_combinators(selector: str) -> List[str]:
+    """
+    Split a selector on child combinators, tolerating any surrounding whitespace.
+    
+    Args:
+        selector: CSS selector such as 'div.list > article > h2'
+        
+    Returns:
+        Stripped compound selectors, e.g. ['div.list', 'article', 'h2']
+    """
+    return _CHILD_SPLIT_RE.split(selector.strip())
+
+
 def split_selector(selector: str) -> List[str]:
     """
     Split compound selector into individual parts.
@@ -165,13 +242,29 @@ def validate_selector(driver, selector: str) -> Tuple[bool, int]:
         Tuple of (is_valid, match_count)
     """
     try:
-        from selenium.webdriver.common.by import By
-        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-        return True, len(elements)
+        return True, count_matches(driver, selector)
     except Exception:
         return False, 0
 
 
+def count_matches(driver, selector: str, root=None) -> int:
+    """
+    Count elements matching a CSS selector with a single script call.
+    
+    Args:
+        driver: Selenium WebDriver
+        selector: CSS selector
+        root: Optional WebElement to search within instead of the document
+        
+    Returns:
+        Number of matching elements
+        
+    Raises:
+        WebDriverException: If the selector is not valid CSS
+    """
+    return int(driver.execute_script(_COUNT_MATCHES_JS, selector, root) or 0)
+
+
 def generate_unique_selector(element, driver) -> Optional[str]:
     """
     Generate unique CSS selector for element.
@@ -222,32 +315,13 @@ def generate_unique_selector(element, driver) -> Optional[str]:
                     return selector
         
         # Build path selector
-        path_parts = []
-        current = element
-        
-        while current:
-            tag = current.tag_name
-            if tag == 'html':
-                break
-            
-            # Get element position among siblings
-            parent = current.find_element_by_xpath('..')
-            siblings = parent.find_elements_by_tag_name(tag)
-            
-            if len(siblings) > 1:
-                index = siblings.index(current) + 1
-                path_parts.insert(0, f"{tag}:nth-of-type({index})")
-            else:
-                path_parts.insert(0, tag)
-            
-            current = parent if parent.tag_name != 'html' else None
-        
-        return ' > '.join(path_parts)
+        return driver.execute_script(_ELEMENT_PATH_JS, element) or None
         
     except Exception:
         return None
 
 
+@lru_cache(maxsize=512)
 def css_to_xpath(css_selector: str) -> str:
     """
     Convert CSS selector to XPath (basic conversion).
@@ -263,16 +337,9 @@ def css_to_xpath(css_selector: str) -> str:
     
     xpath = css_selector
     
-    # Convert ID selector
-    xpath = re.sub(r'#([a-zA-Z][\w-]*)', r'[@id="\1"]', xpath)
-    
-    # Convert class selector
-    xpath = re.sub(r'\.([a-zA-Z][\w-]*)', r'[contains(@class, "\1")]', xpath)
-    
-    # Convert attribute selectors
-    xpath = re.sub(r'\[([a-zA-Z][\w-]*)\]', r'[@\1]', xpath)
-    xpath = re.sub(r'\[([a-zA-Z][\w-]*)="([^"]+)"\]', r'[@\1="\2"]', xpath)
-    xpath = re.sub(r'\[([a-zA-Z][\w-]*)=\'([^\']+)\'\]', r'[@\1="\2"]', xpath)
+    # Convert ID, class and attribute selectors
+    for pattern, replacement in _CSS_TO_XPATH_SUBS:
+        xpath = pattern.sub(replacement, xpath)
     
     # Convert descendant combinator
     xpath = xpath.replace(' ', '//')
@@ -11,6 +11,8 @@ from datetime import datetime
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+from .file_io import read_json, write_json
+
 
 @dataclass
 class MigrationInfo:
@@ -206,8 +208,11 @@ class TemplateMigrationManager:
     
     def needs_migration(self, template: Dict[str, Any]) -> bool:
         """Check if template needs migration"""
-        template_version = template.get('version', '1.0')
-        return template_version != self.get_current_version()
+        return self.needs_migration_version(template.get('version', '1.0'))
+    
+    def needs_migration_version(self, version: Optional[str]) -> bool:
+        """Check a template's version string, without needing the template as a dict"""
+        return (version or '1.0') != self.get_current_version()
     
     def get_migration_path(self, from_version: str, to_version: Optional[str] = None) -> List[Migration]:
         """
@@ -311,8 +316,7 @@ class TemplateMigrationManager:
         """
         try:
             # Load template
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = json.load(f)
+            template = read_json(template_path)
             
             # Check if migration needed
             if not self.needs_migration(template):
@@ -322,16 +326,14 @@ class TemplateMigrationManager:
             # Create backup file
             if create_backup:
                 backup_path = template_path.with_suffix('.json.backup')
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(template, f, indent=2)
+                write_json(backup_path, template)
                 self.logger.info(f"Created backup: {backup_path}")
             
             # Migrate
             migrated = self.migrate_template(template, target_version)
             
             # Save migrated template
-            with open(template_path, 'w', encoding='utf-8') as f:
-                json.dump(migrated, f, indent=2, ensure_ascii=False)
+            write_json(template_path, migrated)
             
             self.logger.info(f"Successfully migrated {template_path.name}")
             return True
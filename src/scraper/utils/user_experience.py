@@ -3,14 +3,25 @@
 Enhanced user experience utilities for better guidance and usability.
 """
 
+import re
 import time
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 from colorama import init, Fore, Back, Style
 import textwrap
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# Basic URL validation used by ValidationHelper.validate_url
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 class UserExperience:
     """Provides enhanced user experience utilities"""
@@ -356,9 +367,6 @@ class ValidationHelper:
         Validate URL and provide suggestions
         Returns: (is_valid, cleaned_url, error_message)
         """
-        import re
-        from urllib.parse import urlparse
-        
         # Clean up URL
         url = url.strip()
         
@@ -367,15 +375,7 @@ class ValidationHelper:
             url = 'https://' + url
         
         # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(url):
+        if not _URL_PATTERN.match(url):
             return False, url, "Invalid URL format. Please enter a valid URL (e.g., https://example.com)"
         
         # Parse URL